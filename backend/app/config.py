@@ -1,19 +1,72 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite+aiosqlite:///./data.db"
+    # Optional read replica for dashboard/export reads; writes stay on DATABASE_URL
+    DATABASE_READ_URL: str | None = None
+    # After an upload/delete, reads go to the primary this long (replica lag)
+    READ_AFTER_WRITE_SECONDS: float = 30.0
     CORS_ORIGINS: list[str] = ["http://localhost:5173", "http://localhost:8000"]
+    # Connection pool (ignored for in-memory SQLite)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # asyncpg prepared statements cached per connection; 0 disables (pgbouncer)
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # Applied to every new SQLite connection
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_CACHE_SIZE_KB: int = 64 * 1024
+    # "concurrent" runs the /charts group-bys in parallel on separate pooled sessions
+    CHARTS_EXECUTION_MODE: Literal["sequential", "concurrent"] = "sequential"
+    # In-process cache for dashboard responses, invalidated on upload/delete
+    CACHE_ENABLED: bool = True
+    CACHE_TTL_SECONDS: float = 300.0
+    CACHE_MAX_ENTRIES: int = 512
+    CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    # Excel parsing runs off the event loop: "process" pool, or "thread" fallback
+    PARSE_EXECUTOR: Literal["process", "thread"] = "process"
+    PARSE_WORKERS: int = 2
+    PARSE_MAX_CONCURRENCY: int = 2
+    PARSE_MAX_QUEUE: int = 8
+    # Answer monthly series and KPI windows from the monthly_rollup table when
+    # the filters fit its dimensions
+    ROLLUP_ENABLED: bool = True
+    # "columnar" serves /kpis, /charts, /trends and /body-map from an in-memory
+    # NumPy copy of incidents, reloaded after uploads/deletes
+    ANALYTICS_ENGINE: Literal["sql", "columnar"] = "sql"
+    # Request/query timings exposed at /api/metrics; slower statements are logged
+    METRICS_ENABLED: bool = True
+    SLOW_QUERY_MS: float = 500.0
+    # Responses at least this large are gzipped when the client accepts it
+    GZIP_MINIMUM_SIZE: int = 1024
+    GZIP_COMPRESS_LEVEL: int = 6
+    # ETag + If-None-Match (304) revalidation for dashboard GETs
+    HTTP_ETAGS_ENABLED: bool = True
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
-    @property
-    def async_database_url(self) -> str:
-        url = self.DATABASE_URL
+    @staticmethod
+    def _to_async_url(url: str) -> str:
         # Convert standard postgresql:// to asyncpg driver
         if url.startswith("postgresql://"):
             url = url.replace("postgresql://", "postgresql+asyncpg://", 1)
         return url
 
+    @property
+    def async_database_url(self) -> str:
+        return self._to_async_url(self.DATABASE_URL)
+
+    @property
+    def async_database_read_url(self) -> str | None:
+        if not self.DATABASE_READ_URL:
+            return None
+        return self._to_async_url(self.DATABASE_READ_URL)
+
 
 settings = Settings()
@@ -1,47 +1,162 @@
-from sqlalchemy import text
+import time
+
+from sqlalchemy import event, make_url, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
 from app.models import Base
+from app.services.metrics import instrument_engine
+from app.services.search import create_search_index
 
 db_url = settings.async_database_url
+read_db_url = settings.async_database_read_url
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets dashboard reads proceed while an upload is writing; NORMAL
+    # sync is durable across application crashes in WAL mode.
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    # Negative cache_size is in KiB rather than pages
+    cursor.execute(f"PRAGMA cache_size={-int(settings.SQLITE_CACHE_SIZE_KB)}")
+    cursor.close()
+
 
-connect_args = {}
-if db_url.startswith("sqlite"):
-    connect_args = {"check_same_thread": False}
+def _create_engine(url: str):
+    connect_args = {}
+    if url.startswith("sqlite"):
+        connect_args = {"check_same_thread": False}
+    elif url.startswith("postgresql+asyncpg"):
+        connect_args = {"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
 
-engine = create_async_engine(
-    db_url,
-    echo=False,
-    connect_args=connect_args,
-)
+    pool_args = {}
+    if make_url(url).database not in (None, "", ":memory:"):
+        # aiosqlite defaults to NullPool; pooling keeps each connection's page
+        # cache and mmap alive between requests.
+        pool_args = {
+            "poolclass": AsyncAdaptedQueuePool,
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        }
 
+    new_engine = create_async_engine(
+        url,
+        echo=False,
+        connect_args=connect_args,
+        **pool_args,
+    )
+    if url.startswith("sqlite"):
+        event.listen(new_engine.sync_engine, "connect", _set_sqlite_pragmas)
+    instrument_engine(new_engine)
+    return new_engine
+
+
+engine = _create_engine(db_url)
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# Without DATABASE_READ_URL the read factory is the primary one.
+read_engine = _create_engine(read_db_url) if read_db_url else engine
+async_read_session = async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
+
+_last_write_at: float | None = None
+
+
+def record_write():
+    """Route reads to the primary for READ_AFTER_WRITE_SECONDS.
+
+    Called after uploads and deletes commit, so the dashboard reflects them
+    even while the replica is still catching up.
+    """
+    global _last_write_at
+    _last_write_at = time.monotonic()
+
+
+def read_session() -> AsyncSession:
+    """A session for read-only queries: the replica, unless a write is recent."""
+    if (
+        _last_write_at is not None
+        and time.monotonic() - _last_write_at < settings.READ_AFTER_WRITE_SECONDS
+    ):
+        return async_session()
+    return async_read_session()
+
 
 async def get_db():
     async with async_session() as session:
         yield session
 
 
+async def get_read_db():
+    async with read_session() as session:
+        yield session
+
+
+NEW_INCIDENT_COLUMNS = [
+    ("contract", "VARCHAR"),
+    ("rut_normalized", "VARCHAR"),
+    ("merge_key", "VARCHAR"),
+    ("content_hash", "VARCHAR"),
+]
+
+NEW_UPLOAD_JOB_COLUMNS = [
+    ("records_added", "INTEGER DEFAULT 0"),
+    ("records_updated", "INTEGER DEFAULT 0"),
+    ("records_unchanged", "INTEGER DEFAULT 0"),
+    ("records_duplicated", "INTEGER DEFAULT 0"),
+]
+
+
+def _table_columns(conn, table: str) -> set[str]:
+    if db_url.startswith("sqlite"):
+        result = conn.execute(text(f"PRAGMA table_info({table})"))
+        return {row[1] for row in result.fetchall()}
+    # PostgreSQL
+    result = conn.execute(text(
+        "SELECT column_name FROM information_schema.columns "
+        "WHERE table_name = :table"
+    ), {"table": table})
+    return {row[0] for row in result.fetchall()}
+
+
 def _migrate_add_columns(conn):
     """Add new columns to existing tables if they don't exist."""
-    if db_url.startswith("sqlite"):
-        result = conn.execute(text("PRAGMA table_info(incidents)"))
-        columns = {row[1] for row in result.fetchall()}
-        if "contract" not in columns:
-            conn.execute(text("ALTER TABLE incidents ADD COLUMN contract VARCHAR"))
-    else:
-        # PostgreSQL
-        result = conn.execute(text(
-            "SELECT column_name FROM information_schema.columns "
-            "WHERE table_name = 'incidents' AND column_name = 'contract'"
+    columns = _table_columns(conn, "incidents")
+    for name, column_type in NEW_INCIDENT_COLUMNS:
+        if name not in columns:
+            conn.execute(text(f"ALTER TABLE incidents ADD COLUMN {name} {column_type}"))
+
+    job_columns = _table_columns(conn, "upload_jobs")
+    for name, column_type in NEW_UPLOAD_JOB_COLUMNS:
+        if name not in job_columns:
+            conn.execute(text(f"ALTER TABLE upload_jobs ADD COLUMN {name} {column_type}"))
+
+    if "rut_normalized" not in columns:
+        # Same normalization as search.normalize_rut
+        conn.execute(text(
+            "UPDATE incidents SET rut_normalized = "
+            "UPPER(REPLACE(REPLACE(REPLACE(rut, '.', ''), '-', ''), ' ', '')) "
+            "WHERE rut IS NOT NULL"
         ))
-        if not result.fetchone():
-            conn.execute(text("ALTER TABLE incidents ADD COLUMN contract VARCHAR"))
+
+
+def _migrate_add_indexes(conn):
+    """Create model indexes missing from databases created before they existed.
+
+    create_all only creates indexes together with new tables.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
 
 
 async def create_tables():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
         await conn.run_sync(_migrate_add_columns)
+        await conn.run_sync(_migrate_add_indexes)
+        await conn.run_sync(create_search_index)
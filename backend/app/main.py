@@ -5,19 +5,37 @@ from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, PlainTextResponse
 
 from app.config import settings
 from app.database import create_tables
 from app.routers import dashboard, export, upload
+from app.services.compression import GZipMiddleware
+from app.services.metrics import MetricsMiddleware, metrics
+from app.services.parse_pool import parse_pool
+from app.services.rollup import backfill_rollup
+from app.services.upload_jobs import fail_interrupted_jobs
 
 STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
 
+# Vite fingerprints every file under /assets, so a URL never changes content.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class ImmutableStaticFiles(StaticFiles):
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await create_tables()
+    await backfill_rollup()
+    await fail_interrupted_jobs()
     yield
+    parse_pool.shutdown()
 
 
 app = FastAPI(
@@ -25,6 +43,14 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.GZIP_MINIMUM_SIZE,
+    compresslevel=settings.GZIP_COMPRESS_LEVEL,
+)
+
+app.add_middleware(MetricsMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
@@ -42,16 +68,24 @@ app.include_router(export.router)
 async def health():
     return {"status": "ok"}
 
+
+@app.get("/api/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Request and query latency histograms in Prometheus text format."""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
 # Serve frontend static files in production
 if STATIC_DIR.exists():
-    app.mount("/assets", StaticFiles(directory=STATIC_DIR / "assets"), name="static-assets")
+    app.mount("/assets", ImmutableStaticFiles(directory=STATIC_DIR / "assets"), name="static-assets")
 
     @app.get("/{full_path:path}")
     async def serve_spa(full_path: str):
+        # index.html and the unhashed public files are revalidated on every
+        # load, so a deploy is picked up right away.
         file_path = STATIC_DIR / full_path
         if file_path.is_file():
-            return FileResponse(file_path)
-        return FileResponse(STATIC_DIR / "index.html")
+            return FileResponse(file_path, headers={"Cache-Control": "no-cache"})
+        return FileResponse(STATIC_DIR / "index.html", headers={"Cache-Control": "no-cache"})
 else:
     @app.get("/")
     async def root():
@@ -1,6 +1,6 @@
 from datetime import date, datetime
 
-from sqlalchemy import Date, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Date, DateTime, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -28,6 +28,7 @@ class Incident(Base):
     number: Mapped[int | None] = mapped_column(Integer, nullable=True)
     name: Mapped[str | None] = mapped_column(String, nullable=True)
     rut: Mapped[str | None] = mapped_column(String, nullable=True)
+    rut_normalized: Mapped[str | None] = mapped_column(String, nullable=True)
     age: Mapped[int | None] = mapped_column(Integer, nullable=True)
     position: Mapped[str | None] = mapped_column(String, nullable=True)
     work_center: Mapped[str | None] = mapped_column(String, nullable=True)
@@ -50,6 +51,145 @@ class Incident(Base):
     final_status: Mapped[str | None] = mapped_column(String, nullable=True)
     image_url: Mapped[str | None] = mapped_column(String, nullable=True)
     contract: Mapped[str | None] = mapped_column(String, nullable=True)
+    # Set only for rows ingested in merge mode: merge_key fingerprints the row
+    # (number/rut/date) and content_hash the rest, so re-uploads can skip
+    # unchanged rows.
+    merge_key: Mapped[str | None] = mapped_column(String, nullable=True)
+    content_hash: Mapped[str | None] = mapped_column(String, nullable=True)
     upload_id: Mapped[int] = mapped_column(Integer, ForeignKey("uploads.id"), nullable=False)
 
     upload: Mapped["Upload"] = relationship("Upload", back_populates="incidents")
+
+    # Designed from the dashboard query shapes: each equality filter leads an
+    # index followed by date for the date_from/date_to range, and the trailing
+    # columns let the KPI, by_month and cost_by_classifier aggregates be
+    # answered from the index alone.
+    __table_args__ = (
+        Index(
+            "ix_incidents_date_kpis",
+            "date", "incident_type", "final_status", "lost_days", "total_cost", "age",
+        ),
+        Index("ix_incidents_year_month", "year", "date", "incident_type", "total_cost"),
+        Index("ix_incidents_work_center_date", "work_center", "date"),
+        Index("ix_incidents_contract_date", "contract", "date"),
+        Index("ix_incidents_incident_type_date", "incident_type", "date"),
+        Index("ix_incidents_classifier_date", "classifier", "date", "total_cost"),
+        Index("ix_incidents_final_status_date", "final_status", "date"),
+        Index("ix_incidents_body_part_date", "body_part", "date"),
+        Index("ix_incidents_position_date", "position", "date"),
+        Index("ix_incidents_sex_date", "sex", "date"),
+        Index("ix_incidents_attention_type_date", "attention_type", "date"),
+        Index("ix_incidents_upload_id", "upload_id"),
+        Index("ix_incidents_rut_normalized", "rut_normalized"),
+        # Conflict target of the merge upsert. NULLs never collide, so rows
+        # from regular uploads are unaffected.
+        Index("ix_incidents_merge_key", "merge_key", unique=True),
+    )
+
+
+class UploadJob(Base):
+    __tablename__ = "upload_jobs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    filename: Mapped[str] = mapped_column(String, nullable=False)
+    stage: Mapped[str] = mapped_column(String, default="queued")
+    rows_parsed: Mapped[int] = mapped_column(Integer, default=0)
+    rows_inserted: Mapped[int] = mapped_column(Integer, default=0)
+    # Outcome of the finished job, as in UploadResponse.
+    records_added: Mapped[int] = mapped_column(Integer, default=0)
+    records_updated: Mapped[int] = mapped_column(Integer, default=0)
+    records_unchanged: Mapped[int] = mapped_column(Integer, default=0)
+    records_duplicated: Mapped[int] = mapped_column(Integer, default=0)
+    total_records: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Plain column rather than a foreign key: deleting an upload must not be
+    # blocked by the job that created it.
+    upload_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
+class MonthlyRollup(Base):
+    """Incident aggregates per upload, month and filter dimension.
+
+    Kept in step with incidents on upload/delete so monthly dashboard series
+    can be answered without scanning raw rows. Partitioned by upload_id so
+    each upload's rows can be added or dropped on their own.
+    """
+
+    __tablename__ = "monthly_rollup"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    upload_id: Mapped[int] = mapped_column(Integer, ForeignKey("uploads.id"), nullable=False)
+    year: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    period_year: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    period_month: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    work_center: Mapped[str | None] = mapped_column(String, nullable=True)
+    contract: Mapped[str | None] = mapped_column(String, nullable=True)
+    incident_type: Mapped[str | None] = mapped_column(String, nullable=True)
+    classifier: Mapped[str | None] = mapped_column(String, nullable=True)
+    final_status: Mapped[str | None] = mapped_column(String, nullable=True)
+    incident_count: Mapped[int] = mapped_column(Integer, default=0)
+    lost_days: Mapped[int] = mapped_column(Integer, default=0)
+    total_cost: Mapped[float] = mapped_column(Float, default=0.0)
+    age_sum: Mapped[int] = mapped_column(Integer, default=0)
+    age_count: Mapped[int] = mapped_column(Integer, default=0)
+
+    __table_args__ = (
+        Index("ix_monthly_rollup_period", "period_year", "period_month"),
+        Index("ix_monthly_rollup_upload_id", "upload_id"),
+    )
+
+
+class WorkedHours(Base):
+    """Hours worked and headcount per work center, contract and month.
+
+    The exposure side of the safety rates, loaded from its own spreadsheet.
+    A file replaces the rows of the work center, contract and month
+    combinations it contains.
+    """
+
+    __tablename__ = "worked_hours"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    work_center: Mapped[str] = mapped_column(String, nullable=False)
+    contract: Mapped[str | None] = mapped_column(String, nullable=True)
+    period_year: Mapped[int] = mapped_column(Integer, nullable=False)
+    period_month: Mapped[int] = mapped_column(Integer, nullable=False)
+    worked_hours: Mapped[float] = mapped_column(Float, default=0.0)
+    headcount: Mapped[int] = mapped_column(Integer, default=0)
+
+    __table_args__ = (
+        Index("ix_worked_hours_period", "period_year", "period_month"),
+    )
+
+
+class MonthlyIndicator(Base):
+    """Worked hours joined with the accident rollup, one row per WorkedHours row.
+
+    Holds the additive parts of the frequency, severity and accident rates
+    so any set of rows can be summed before dividing. Refreshed per month
+    whenever worked hours or the rollup of that month change.
+    """
+
+    __tablename__ = "monthly_indicators"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    period_year: Mapped[int] = mapped_column(Integer, nullable=False)
+    period_month: Mapped[int] = mapped_column(Integer, nullable=False)
+    work_center: Mapped[str] = mapped_column(String, nullable=False)
+    contract: Mapped[str | None] = mapped_column(String, nullable=True)
+    worked_hours: Mapped[float] = mapped_column(Float, default=0.0)
+    headcount: Mapped[int] = mapped_column(Integer, default=0)
+    accidents: Mapped[int] = mapped_column(Integer, default=0)
+    lost_days: Mapped[int] = mapped_column(Integer, default=0)
+
+    __table_args__ = (
+        Index(
+            "ix_monthly_indicators_period",
+            "period_year", "period_month", "work_center", "contract",
+        ),
+        Index("ix_monthly_indicators_work_center", "work_center", "period_year", "period_month"),
+        Index("ix_monthly_indicators_contract", "contract", "period_year", "period_month"),
+    )
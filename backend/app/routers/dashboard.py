@@ -1,185 +1,216 @@
+import asyncio
+import base64
+import json
 import math
-from datetime import date, datetime
+from datetime import date, timedelta
+from typing import Literal
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import case, extract, func, select
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import Date, Float, Integer, String, bindparam, case, extract, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.config import settings
+from app.database import get_read_db, read_session
 from app.models import Incident
 from app.schemas import (
     AlertItem,
     BodyMapResponse,
-    BodyPartDetail,
-    ChartDataItem,
     ChartsResponse,
+    DashboardSummaryResponse,
     IncidentBrief,
     IncidentItem,
     IncidentListResponse,
+    IndicatorsResponse,
     KPIResponse,
-    MonthlyDataItem,
+    TrendPeriodItem,
     TrendsResponse,
 )
+from app.services.cache import result_cache
+from app.services.columnar import IncidentColumns, columnar_store
+from app.services.filters import IncidentFilters, apply_filters, filtered_statement
+from app.services.http_cache import DatasetETagRoute
+from app.services.indicators import indicator_months, indicator_period, safety_rates
+from app.services.periods import Comparison, PeriodKind, TrendPeriods, compare_periods, period_totals
+from app.services.rollup import (
+    rollup_by_month,
+    rollup_count,
+    rollup_fits,
+    rollup_kpi_row,
+    rollup_month_totals,
+)
+from app.services.search import search_condition
 
-router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
+router = APIRouter(prefix="/api/dashboard", tags=["dashboard"], route_class=DatasetETagRoute)
 
+MONTH_NAMES = [
+    "", "Ene", "Feb", "Mar", "Abr", "May", "Jun",
+    "Jul", "Ago", "Sep", "Oct", "Nov", "Dic",
+]
 
-def _apply_filters(query, filters: dict):
-    if filters.get("date_from"):
-        try:
-            d = datetime.strptime(filters["date_from"], "%Y-%m-%d").date()
-            query = query.where(Incident.date >= d)
-        except ValueError:
-            pass
+# The incident list selects exactly the IncidentItem fields, in schema order.
+INCIDENT_FIELDS = tuple(IncidentItem.model_fields)
+INCIDENT_COLUMNS = [getattr(Incident, name) for name in INCIDENT_FIELDS]
 
-    if filters.get("date_to"):
-        try:
-            d = datetime.strptime(filters["date_to"], "%Y-%m-%d").date()
-            query = query.where(Incident.date <= d)
-        except ValueError:
-            pass
 
-    if filters.get("work_center"):
-        query = query.where(Incident.work_center == filters["work_center"])
+def _json_response(body: bytes) -> Response:
+    """Already-encoded JSON.
 
-    if filters.get("position"):
-        query = query.where(Incident.position == filters["position"])
+    The large payloads (charts, body map, incident list) are built as plain
+    dicts straight from query rows, field for field like their schemas.py
+    models, and encoded once with orjson. Returning a Response skips
+    FastAPI's response_model pass, which would otherwise validate and
+    serialize every item again; response_model stays on the routes for the
+    OpenAPI schema.
+    """
+    return Response(body, media_type="application/json")
 
-    if filters.get("incident_type"):
-        query = query.where(Incident.incident_type == filters["incident_type"])
 
-    if filters.get("classifier"):
-        query = query.where(Incident.classifier == filters["classifier"])
+def _chart_item(name: str, count: int, total_cost: float | None = None) -> dict:
+    """ChartDataItem as a dict."""
+    return {"name": name, "count": count, "total_cost": total_cost}
 
-    if filters.get("body_part"):
-        query = query.where(Incident.body_part == filters["body_part"])
 
-    if filters.get("final_status"):
-        query = query.where(Incident.final_status == filters["final_status"])
+async def _gather_in_sessions(tasks):
+    """Run independent query callables concurrently, each on its own pooled session."""
+    async def _run(task):
+        async with read_session() as session:
+            return await task(session)
 
-    if filters.get("contract"):
-        query = query.where(Incident.contract == filters["contract"])
+    return await asyncio.gather(*(_run(task) for task in tasks))
 
-    return query
 
+def _encode_cursor(value, last_id: int) -> str:
+    payload = json.dumps([value, last_id], default=str).encode()
+    return base64.urlsafe_b64encode(payload).decode()
 
-def _get_filter_params(
-    date_from: str | None = None,
-    date_to: str | None = None,
-    work_center: str | None = None,
-    position: str | None = None,
-    incident_type: str | None = None,
-    classifier: str | None = None,
-    body_part: str | None = None,
-    final_status: str | None = None,
-    contract: str | None = None,
-) -> dict:
-    return {
-        "date_from": date_from,
-        "date_to": date_to,
-        "work_center": work_center,
-        "position": position,
-        "incident_type": incident_type,
-        "classifier": classifier,
-        "body_part": body_part,
-        "final_status": final_status,
-        "contract": contract,
-    }
 
+# Signed 64-bit range of SQLite and PostgreSQL bigint parameters.
+MIN_CURSOR_INT, MAX_CURSOR_INT = -(2 ** 63), 2 ** 63 - 1
 
-@router.get("/kpis", response_model=KPIResponse)
-async def get_kpis(
-    db: AsyncSession = Depends(get_db),
-    date_from: str | None = Query(None),
-    date_to: str | None = Query(None),
-    work_center: str | None = Query(None),
-    position: str | None = Query(None),
-    incident_type: str | None = Query(None),
-    classifier: str | None = Query(None),
-    body_part: str | None = Query(None),
-    final_status: str | None = Query(None),
-    contract: str | None = Query(None),
-):
-    filters = _get_filter_params(
-        date_from, date_to, work_center, position, incident_type,
-        classifier, body_part, final_status, contract,
-    )
 
-    base = select(Incident)
-    base = _apply_filters(base, filters)
+def _is_cursor_int(value) -> bool:
+    return type(value) is int and MIN_CURSOR_INT <= value <= MAX_CURSOR_INT
 
-    total_q = select(func.count()).select_from(base.subquery())
-    total_result = await db.execute(total_q)
-    total_all = total_result.scalar() or 0
 
-    incident_q = select(func.count()).select_from(
-        _apply_filters(
-            select(Incident).where(Incident.incident_type == "INCIDENTE"), filters
-        ).subquery()
-    )
-    incidents_result = await db.execute(incident_q)
-    total_incidents = incidents_result.scalar() or 0
+def _cursor_value_matches(value, column) -> bool:
+    """Whether a decoded cursor value can be bound against the sort column."""
+    if value is None:
+        return True
+    if isinstance(column.type, (String, Date)):
+        # Dates travel as ISO strings and are parsed by the caller.
+        return isinstance(value, str)
+    if isinstance(column.type, Integer):
+        return _is_cursor_int(value)
+    if isinstance(column.type, Float):
+        return _is_cursor_int(value) or (type(value) is float and math.isfinite(value))
+    return False
 
-    accident_q = select(func.count()).select_from(
-        _apply_filters(
-            select(Incident).where(Incident.incident_type == "ACCIDENTE"), filters
-        ).subquery()
-    )
-    accidents_result = await db.execute(accident_q)
-    total_accidents = accidents_result.scalar() or 0
 
-    agg_q = select(
-        func.coalesce(func.sum(Incident.lost_days), 0),
-        func.coalesce(func.sum(Incident.total_cost), 0.0),
-        func.coalesce(func.avg(Incident.age), 0.0),
-    )
-    agg_q = _apply_filters(agg_q, filters)
-    agg_result = await db.execute(agg_q)
-    agg_row = agg_result.one()
-    total_lost_days = int(agg_row[0])
-    total_cost = float(agg_row[1])
-    avg_age = round(float(agg_row[2]), 1)
-
-    active_q = select(func.count()).select_from(
-        _apply_filters(
-            select(Incident).where(Incident.final_status == "EN PROCESO"), filters
-        ).subquery()
-    )
-    active_result = await db.execute(active_q)
-    active_cases = active_result.scalar() or 0
+def _decode_cursor(cursor: str, column) -> tuple:
+    """(sort value, id) from a cursor made by _encode_cursor.
 
-    today = date.today()
+    Cursors come back from the client, so anything that is not exactly
+    what _encode_cursor produces for this sort column is rejected before it
+    reaches the driver.
+    """
+    try:
+        value, last_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not _cursor_value_matches(value, column) or not _is_cursor_int(last_id):
+            raise ValueError(cursor)
+        if value is not None and isinstance(column.type, Date):
+            value = date.fromisoformat(value)
+        return value, last_id
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Cursor de paginación inválido")
+
+
+def _after_cursor(column, descending: bool, position: tuple):
+    value, last_id = position
+    id_after = Incident.id < last_id if descending else Incident.id > last_id
+    if value is None:
+        return column.is_(None) & id_after
+    value_after = column < value if descending else column > value
+    return column.is_(None) | value_after | ((column == value) & id_after)
+
+
+def _month_starts(today: date) -> tuple[date, date]:
+    """First day of the current and of the previous month."""
     current_month_start = today.replace(day=1)
     if today.month == 1:
         prev_month_start = today.replace(year=today.year - 1, month=12, day=1)
     else:
         prev_month_start = today.replace(month=today.month - 1, day=1)
-    prev_month_end = current_month_start
+    return current_month_start, prev_month_start
 
-    current_month_q = select(
-        func.count(),
-        func.coalesce(func.sum(Incident.total_cost), 0.0),
-    )
-    current_month_q = _apply_filters(current_month_q, filters)
-    current_month_q = current_month_q.where(Incident.date >= current_month_start)
-    cm_result = await db.execute(current_month_q)
-    cm_row = cm_result.one()
-    incidents_this_month = cm_row[0] or 0
-    cost_this_month = float(cm_row[1])
-
-    prev_month_q = select(
-        func.count(),
+
+# Month boundaries are bound parameters too, so the KPI statement is
+# reused across days as well as across filter values.
+CURRENT_MONTH_START = bindparam("current_month_start", type_=Date)
+PREV_MONTH_START = bindparam("prev_month_start", type_=Date)
+
+
+def _kpi_statement(filters: IncidentFilters):
+    in_current_month = Incident.date >= CURRENT_MONTH_START
+    in_prev_month = (Incident.date >= PREV_MONTH_START) & (Incident.date < CURRENT_MONTH_START)
+
+    # One conditional-aggregation scan over the filtered rows instead of
+    # one query per KPI.
+    kpi_q = select(
+        func.coalesce(func.sum(case((Incident.incident_type == "INCIDENTE", 1), else_=0)), 0),
+        func.coalesce(func.sum(case((Incident.incident_type == "ACCIDENTE", 1), else_=0)), 0),
+        func.coalesce(func.sum(Incident.lost_days), 0),
         func.coalesce(func.sum(Incident.total_cost), 0.0),
+        func.coalesce(func.avg(Incident.age), 0.0),
+        func.coalesce(func.sum(case((Incident.final_status == "EN PROCESO", 1), else_=0)), 0),
+        func.coalesce(func.sum(case((in_current_month, 1), else_=0)), 0),
+        func.coalesce(func.sum(case((in_current_month, Incident.total_cost), else_=0.0)), 0.0),
+        func.coalesce(func.sum(case((in_prev_month, 1), else_=0)), 0),
+        func.coalesce(func.sum(case((in_prev_month, Incident.total_cost), else_=0.0)), 0.0),
     )
-    prev_month_q = _apply_filters(prev_month_q, filters)
-    prev_month_q = prev_month_q.where(
-        Incident.date >= prev_month_start,
-        Incident.date < prev_month_end,
-    )
-    pm_result = await db.execute(prev_month_q)
-    pm_row = pm_result.one()
-    incidents_prev_month = pm_row[0] or 0
-    cost_prev_month = float(pm_row[1])
+    return apply_filters(kpi_q, filters)
+
+
+async def _kpi_row(
+    db: AsyncSession,
+    filters: IncidentFilters,
+    store: IncidentColumns | None,
+    current_month_start: date,
+    prev_month_start: date,
+) -> tuple:
+    if store is not None:
+        row = store.kpi_row(store.mask(filters), current_month_start, prev_month_start)
+    elif rollup_fits(filters):
+        row = await rollup_kpi_row(db, filters, current_month_start, prev_month_start)
+    else:
+        # Unfiltered and month-aligned requests are served by the rollup
+        # above. Against per-KPI counts the single pass only loses on bare
+        # date windows (benchmarks/kpis.py), by tens of milliseconds at 1M
+        # rows, and is kept for those too rather than a second code path.
+        kpi_q = filtered_statement("kpis", filters, _kpi_statement)
+        kpi_result = await db.execute(kpi_q, {
+            **filters.params,
+            "current_month_start": current_month_start,
+            "prev_month_start": prev_month_start,
+        })
+        row = kpi_result.one()
+    return row
+
+
+def _kpi_response(row: tuple) -> KPIResponse:
+    # Costs are rounded to cents like the chart costs: float sums differ in
+    # their last bits with the order rows are added in, which is not the same
+    # for SQL, the rollup and the columnar store.
+    total_incidents = int(row[0])
+    total_accidents = int(row[1])
+    total_lost_days = int(row[2])
+    total_cost = round(float(row[3]), 2)
+    avg_age = round(float(row[4]), 1)
+    active_cases = int(row[5])
+    incidents_this_month = int(row[6])
+    cost_this_month = round(float(row[7]), 2)
+    incidents_prev_month = int(row[8])
+    cost_prev_month = round(float(row[9]), 2)
 
     return KPIResponse(
         total_incidents=total_incidents,
@@ -195,54 +226,24 @@ async def get_kpis(
     )
 
 
-@router.get("/charts", response_model=ChartsResponse)
-async def get_charts(
-    db: AsyncSession = Depends(get_db),
-    date_from: str | None = Query(None),
-    date_to: str | None = Query(None),
-    work_center: str | None = Query(None),
-    position: str | None = Query(None),
-    incident_type: str | None = Query(None),
-    classifier: str | None = Query(None),
-    body_part: str | None = Query(None),
-    final_status: str | None = Query(None),
-    contract: str | None = Query(None),
-):
-    filters = _get_filter_params(
-        date_from, date_to, work_center, position, incident_type,
-        classifier, body_part, final_status, contract,
-    )
+def _group_count_statement(filters: IncidentFilters, column):
+    q = select(column, func.count().label("cnt"))
+    q = apply_filters(q, filters)
+    return q.where(column.isnot(None)).group_by(column).order_by(func.count().desc(), column)
 
-    async def _group_count(column):
-        q = select(column, func.count().label("cnt"))
-        q = _apply_filters(q, filters)
-        q = q.where(column.isnot(None)).group_by(column).order_by(func.count().desc())
-        result = await db.execute(q)
-        return [ChartDataItem(name=row[0], count=row[1]) for row in result.all()]
 
-    async def _group_cost(column):
-        q = select(
-            column,
-            func.count().label("cnt"),
-            func.coalesce(func.sum(Incident.total_cost), 0.0).label("cost"),
-        )
-        q = _apply_filters(q, filters)
-        q = q.where(column.isnot(None)).group_by(column).order_by(func.sum(Incident.total_cost).desc())
-        result = await db.execute(q)
-        return [
-            ChartDataItem(name=row[0], count=row[1], total_cost=round(float(row[2]), 2))
-            for row in result.all()
-        ]
-
-    by_type = await _group_count(Incident.incident_type)
-    by_classifier = await _group_count(Incident.classifier)
-    by_work_center = await _group_count(Incident.work_center)
-    by_position = await _group_count(Incident.position)
-    by_sex = await _group_count(Incident.sex)
-    by_attention = await _group_count(Incident.attention_type)
-    cost_by_classifier = await _group_cost(Incident.classifier)
-    by_contract = await _group_count(Incident.contract)
+def _group_cost_statement(filters: IncidentFilters, column):
+    q = select(
+        column,
+        func.count().label("cnt"),
+        func.coalesce(func.sum(Incident.total_cost), 0.0).label("cost"),
+    )
+    q = apply_filters(q, filters)
+    q = q.where(column.isnot(None)).group_by(column)
+    return q.order_by(func.sum(Incident.total_cost).desc(), column)
 
+
+def _by_month_statement(filters: IncidentFilters):
     month_q = select(
         Incident.year,
         extract("month", Incident.date).label("month_num"),
@@ -251,45 +252,269 @@ async def get_charts(
         func.sum(case((Incident.incident_type == "ACCIDENTE", 1), else_=0)).label("acc"),
         func.coalesce(func.sum(Incident.total_cost), 0.0).label("cost"),
     )
-    month_q = _apply_filters(month_q, filters)
+    month_q = apply_filters(month_q, filters)
     month_q = month_q.where(Incident.date.isnot(None), Incident.year.isnot(None))
     month_q = month_q.group_by(Incident.year, extract("month", Incident.date))
-    month_q = month_q.order_by(Incident.year, extract("month", Incident.date))
-    month_result = await db.execute(month_q)
+    return month_q.order_by(Incident.year, extract("month", Incident.date))
+
 
-    month_names = [
-        "", "Ene", "Feb", "Mar", "Abr", "May", "Jun",
-        "Jul", "Ago", "Sep", "Oct", "Nov", "Dic",
+async def _charts_response(
+    db: AsyncSession, filters: IncidentFilters, store: IncidentColumns | None
+) -> dict:
+    """ChartsResponse as a dict."""
+    mask = store.mask(filters) if store is not None else None
+
+    async def _group_count(session: AsyncSession, column):
+        if store is not None:
+            rows = store.group_count(mask, column.key)
+        else:
+            q = filtered_statement(
+                f"group_count:{column.key}", filters, lambda f: _group_count_statement(f, column)
+            )
+            result = await session.execute(q, filters.params)
+            rows = result.all()
+        return [_chart_item(row[0], row[1]) for row in rows]
+
+    async def _group_cost(session: AsyncSession, column):
+        if store is not None:
+            rows = store.group_cost(mask, column.key)
+        else:
+            q = filtered_statement(
+                f"group_cost:{column.key}", filters, lambda f: _group_cost_statement(f, column)
+            )
+            result = await session.execute(q, filters.params)
+            rows = result.all()
+        return [_chart_item(row[0], row[1], round(float(row[2]), 2)) for row in rows]
+
+    async def _by_month(session: AsyncSession):
+        if store is not None:
+            month_rows = store.by_month(mask)
+        elif rollup_fits(filters):
+            month_rows = await rollup_by_month(session, filters)
+        else:
+            month_q = filtered_statement("by_month", filters, _by_month_statement)
+            month_result = await session.execute(month_q, filters.params)
+            month_rows = month_result.all()
+
+        by_month = []
+        for row in month_rows:
+            month_idx = int(row[1])
+            by_month.append({
+                "month": MONTH_NAMES[month_idx] if 1 <= month_idx <= 12 else str(month_idx),
+                "year": int(row[0]),
+                "incidents": int(row[3]),
+                "accidents": int(row[4]),
+                "cost": round(float(row[5]), 2),
+            })
+        return by_month
+
+    tasks = [
+        lambda s: _group_count(s, Incident.incident_type),
+        lambda s: _group_count(s, Incident.classifier),
+        lambda s: _group_count(s, Incident.work_center),
+        lambda s: _group_count(s, Incident.position),
+        lambda s: _group_count(s, Incident.sex),
+        lambda s: _group_count(s, Incident.attention_type),
+        lambda s: _group_cost(s, Incident.classifier),
+        lambda s: _group_count(s, Incident.contract),
+        _by_month,
     ]
-    by_month = []
-    for row in month_result.all():
-        month_idx = int(row[1])
-        by_month.append(
-            MonthlyDataItem(
-                month=month_names[month_idx] if 1 <= month_idx <= 12 else str(month_idx),
-                year=int(row[0]),
-                incidents=int(row[3]),
-                accidents=int(row[4]),
-                cost=round(float(row[5]), 2),
+    if store is None and settings.CHARTS_EXECUTION_MODE == "concurrent":
+        results = await _gather_in_sessions(tasks)
+    else:
+        results = [await task(db) for task in tasks]
+
+    (
+        by_type, by_classifier, by_work_center, by_position, by_sex,
+        by_attention, cost_by_classifier, by_contract, by_month,
+    ) = results
+
+    return {
+        "by_type": by_type,
+        "by_classifier": by_classifier,
+        "by_work_center": by_work_center,
+        "by_position": by_position,
+        "by_month": by_month,
+        "by_sex": by_sex,
+        "by_attention": by_attention,
+        "cost_by_classifier": cost_by_classifier,
+        "by_contract": by_contract,
+    }
+
+
+def _body_map_detail_statement(filters: IncidentFilters, capped: bool):
+    # Fetch every part's incidents in one query and group them here,
+    # instead of one detail query per body part.
+    detail_q = select(
+        Incident.body_part, Incident.id, Incident.name, Incident.date,
+        Incident.incident_type, Incident.classifier,
+    )
+    detail_q = apply_filters(detail_q, filters)
+    detail_q = detail_q.where(Incident.body_part.isnot(None))
+    if not capped:
+        return detail_q.order_by(Incident.id)
+
+    ranked = detail_q.add_columns(
+        func.row_number()
+        .over(partition_by=Incident.body_part, order_by=Incident.id)
+        .label("rn")
+    ).subquery()
+    return (
+        select(
+            ranked.c.body_part, ranked.c.id, ranked.c.name, ranked.c.date,
+            ranked.c.incident_type, ranked.c.classifier,
+        )
+        .where(ranked.c.rn <= bindparam("max_incidents_per_part", type_=Integer))
+        .order_by(ranked.c.id)
+    )
+
+
+async def _body_map_response(
+    db: AsyncSession,
+    filters: IncidentFilters,
+    store: IncidentColumns | None,
+    max_incidents_per_part: int | None,
+) -> dict:
+    """BodyMapResponse as a dict."""
+    if store is not None:
+        mask = store.mask(filters)
+        groups = store.group_count(mask, "body_part")
+        detail_rows = store.body_part_incidents(mask, max_incidents_per_part)
+    else:
+        group_q = filtered_statement(
+            "group_count:body_part", filters,
+            lambda f: _group_count_statement(f, Incident.body_part),
+        )
+        group_result = await db.execute(group_q, filters.params)
+        groups = group_result.all()
+
+        if max_incidents_per_part is not None:
+            detail_q = filtered_statement(
+                "body_map_detail_capped", filters,
+                lambda f: _body_map_detail_statement(f, capped=True),
+            )
+            params = {**filters.params, "max_incidents_per_part": max_incidents_per_part}
+        else:
+            detail_q = filtered_statement(
+                "body_map_detail", filters,
+                lambda f: _body_map_detail_statement(f, capped=False),
+            )
+            params = filters.params
+        detail_result = await db.execute(detail_q, params)
+        detail_rows = detail_result.all()
+    total = sum(row[1] for row in groups)
+
+    incidents_by_part: dict[str, list[dict]] = {}
+    for r in detail_rows:
+        incidents_by_part.setdefault(r[0], []).append({
+            "id": r[1],
+            "name": r[2],
+            "date": r[3],
+            "incident_type": r[4],
+            "classifier": r[5],
+        })
+
+    parts = []
+    for part_name, part_count in groups:
+        percentage = round((part_count / total * 100), 1) if total > 0 else 0.0
+        parts.append({
+            "name": part_name,
+            "count": part_count,
+            "percentage": percentage,
+            "incidents": incidents_by_part.get(part_name, []),
+        })
+
+    return {"parts": parts}
+
+
+def _trends_response(
+    periods: TrendPeriods,
+    starts: list[date],
+    counts: list[int],
+    costs: list[float],
+    bp_row,
+    cl_row,
+    active_cases: int,
+) -> TrendsResponse:
+    # Deltas and alert flags for every period at once; the headline figures
+    # and alerts are those of the current (last) period.
+    deltas = compare_periods(counts, costs, periods.lag)
+    series = [
+        TrendPeriodItem(
+            start=start,
+            end=periods.shift(start, 1) - timedelta(days=1),
+            incidents=counts[n],
+            cost=round(costs[n], 2),
+            incident_change=deltas["incident_change"][n - periods.lag],
+            cost_change=deltas["cost_change"][n - periods.lag],
+            incident_alert=deltas["incident_alert"][n - periods.lag],
+            cost_alert=deltas["cost_alert"][n - periods.lag],
+        )
+        for n, start in enumerate(starts)
+        if n >= periods.lag
+    ]
+    current = series[-1]
+    current_cost = costs[-1]
+    prev_cost = costs[-1 - periods.lag]
+    current_label, previous_label, versus_label = periods.labels()
+
+    most_affected_body_part = bp_row[0] if bp_row else None
+    most_affected_count = bp_row[1] if bp_row else 0
+    most_common_classifier = cl_row[0] if cl_row else None
+
+    alerts: list[AlertItem] = []
+
+    if current.incident_alert:
+        alerts.append(
+            AlertItem(
+                type="incident_increase",
+                message=f"Incremento significativo de incidentes: {current.incident_change}% respecto {versus_label}",
+                severity="warning",
+            )
+        )
+
+    if most_affected_body_part and most_affected_count > 3:
+        alerts.append(
+            AlertItem(
+                type="body_part",
+                message=f"Parte del cuerpo más afectada: {most_affected_body_part} con {most_affected_count} registros",
+                severity="warning",
             )
         )
 
-    return ChartsResponse(
-        by_type=by_type,
-        by_classifier=by_classifier,
-        by_work_center=by_work_center,
-        by_position=by_position,
-        by_month=by_month,
-        by_sex=by_sex,
-        by_attention=by_attention,
-        cost_by_classifier=cost_by_classifier,
-        by_contract=by_contract,
+    if current.cost_alert:
+        alerts.append(
+            AlertItem(
+                type="cost_increase",
+                message=f"Incremento significativo de costos: ${current_cost:,.0f} {current_label} vs ${prev_cost:,.0f} {previous_label}",
+                severity="danger",
+            )
+        )
+
+    if active_cases > 5:
+        alerts.append(
+            AlertItem(
+                type="pending_cases",
+                message=f"Hay {active_cases} casos en proceso pendientes de resolución",
+                severity="info",
+            )
+        )
+
+    return TrendsResponse(
+        month_over_month_change=current.incident_change,
+        cost_trend=current.cost_change,
+        most_affected_body_part=most_affected_body_part,
+        most_common_classifier=most_common_classifier,
+        alerts=alerts,
+        period=periods.kind,
+        comparison=periods.compare,
+        series=series,
     )
 
 
-@router.get("/body-map", response_model=BodyMapResponse)
-async def get_body_map(
-    db: AsyncSession = Depends(get_db),
+@router.get("/kpis", response_model=KPIResponse)
+async def get_kpis(
+    db: AsyncSession = Depends(get_read_db),
     date_from: str | None = Query(None),
     date_to: str | None = Query(None),
     work_center: str | None = Query(None),
@@ -300,63 +525,94 @@ async def get_body_map(
     final_status: str | None = Query(None),
     contract: str | None = Query(None),
 ):
-    filters = _get_filter_params(
+    filters = IncidentFilters.from_params(
         date_from, date_to, work_center, position, incident_type,
         classifier, body_part, final_status, contract,
     )
+    cache_key = result_cache.key("kpis", {"filters": filters, "today": date.today()})
+    cached = result_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    count_q = select(func.count())
-    count_q = _apply_filters(count_q, filters)
-    count_q = count_q.where(Incident.body_part.isnot(None))
-    total_result = await db.execute(count_q)
-    total = total_result.scalar() or 0
+    current_month_start, prev_month_start = _month_starts(date.today())
+    store = await columnar_store.get()
+    row = await _kpi_row(db, filters, store, current_month_start, prev_month_start)
+    return result_cache.set(cache_key, _kpi_response(row))
 
-    group_q = select(Incident.body_part, func.count().label("cnt"))
-    group_q = _apply_filters(group_q, filters)
-    group_q = group_q.where(Incident.body_part.isnot(None))
-    group_q = group_q.group_by(Incident.body_part).order_by(func.count().desc())
-    group_result = await db.execute(group_q)
 
-    parts = []
-    for row in group_result.all():
-        part_name = row[0]
-        part_count = row[1]
-        percentage = round((part_count / total * 100), 1) if total > 0 else 0.0
+@router.get("/charts", response_model=ChartsResponse)
+async def get_charts(
+    db: AsyncSession = Depends(get_read_db),
+    date_from: str | None = Query(None),
+    date_to: str | None = Query(None),
+    work_center: str | None = Query(None),
+    position: str | None = Query(None),
+    incident_type: str | None = Query(None),
+    classifier: str | None = Query(None),
+    body_part: str | None = Query(None),
+    final_status: str | None = Query(None),
+    contract: str | None = Query(None),
+):
+    filters = IncidentFilters.from_params(
+        date_from, date_to, work_center, position, incident_type,
+        classifier, body_part, final_status, contract,
+    )
+    cache_key = result_cache.key("charts", {"filters": filters})
+    cached = result_cache.get(cache_key)
+    if cached is not None:
+        return _json_response(cached)
 
-        detail_q = select(
-            Incident.id, Incident.name, Incident.date,
-            Incident.incident_type, Incident.classifier,
-        )
-        detail_q = _apply_filters(detail_q, filters)
-        detail_q = detail_q.where(Incident.body_part == part_name)
-        detail_result = await db.execute(detail_q)
-
-        incidents = [
-            IncidentBrief(
-                id=r[0],
-                name=r[1],
-                date=r[2],
-                incident_type=r[3],
-                classifier=r[4],
-            )
-            for r in detail_result.all()
-        ]
-
-        parts.append(
-            BodyPartDetail(
-                name=part_name,
-                count=part_count,
-                percentage=percentage,
-                incidents=incidents,
-            )
-        )
+    store = await columnar_store.get()
+    charts = await _charts_response(db, filters, store)
+    return _json_response(result_cache.set(cache_key, orjson.dumps(charts)))
 
-    return BodyMapResponse(parts=parts)
 
+@router.get("/body-map", response_model=BodyMapResponse)
+async def get_body_map(
+    db: AsyncSession = Depends(get_read_db),
+    date_from: str | None = Query(None),
+    date_to: str | None = Query(None),
+    work_center: str | None = Query(None),
+    position: str | None = Query(None),
+    incident_type: str | None = Query(None),
+    classifier: str | None = Query(None),
+    body_part: str | None = Query(None),
+    final_status: str | None = Query(None),
+    contract: str | None = Query(None),
+    max_incidents_per_part: int | None = Query(None, ge=0),
+):
+    filters = IncidentFilters.from_params(
+        date_from, date_to, work_center, position, incident_type,
+        classifier, body_part, final_status, contract,
+    )
+    cache_key = result_cache.key(
+        "body-map", {"filters": filters, "max_incidents_per_part": max_incidents_per_part}
+    )
+    cached = result_cache.get(cache_key)
+    if cached is not None:
+        return _json_response(cached)
 
-@router.get("/trends", response_model=TrendsResponse)
-async def get_trends(
-    db: AsyncSession = Depends(get_db),
+    store = await columnar_store.get()
+    body_map = await _body_map_response(db, filters, store, max_incidents_per_part)
+    return _json_response(result_cache.set(cache_key, orjson.dumps(body_map)))
+
+
+def _body_part_incidents_statement(filters: IncidentFilters):
+    q = select(
+        Incident.id, Incident.name, Incident.date,
+        Incident.incident_type, Incident.classifier,
+    )
+    q = apply_filters(q, filters)
+    q = q.where(Incident.body_part == bindparam("part", type_=String)).order_by(Incident.id)
+    return q.offset(bindparam("offset", type_=Integer)).limit(bindparam("limit", type_=Integer))
+
+
+@router.get("/body-map/incidents", response_model=list[IncidentBrief])
+async def get_body_part_incidents(
+    part: str = Query(...),
+    db: AsyncSession = Depends(get_read_db),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
     date_from: str | None = Query(None),
     date_to: str | None = Query(None),
     work_center: str | None = Query(None),
@@ -367,134 +623,300 @@ async def get_trends(
     final_status: str | None = Query(None),
     contract: str | None = Query(None),
 ):
-    filters = _get_filter_params(
+    """Page through the incidents of one body part (drill-down for a capped body map)."""
+    filters = IncidentFilters.from_params(
         date_from, date_to, work_center, position, incident_type,
         classifier, body_part, final_status, contract,
     )
 
-    today = date.today()
-    current_month_start = today.replace(day=1)
-    if today.month == 1:
-        prev_month_start = today.replace(year=today.year - 1, month=12, day=1)
-    else:
-        prev_month_start = today.replace(month=today.month - 1, day=1)
-    prev_month_end = current_month_start
+    q = filtered_statement("body_part_incidents", filters, _body_part_incidents_statement)
+    result = await db.execute(q, {**filters.params, "part": part, "offset": offset, "limit": limit})
+
+    return _json_response(orjson.dumps([
+        {
+            "id": r[0],
+            "name": r[1],
+            "date": r[2],
+            "incident_type": r[3],
+            "classifier": r[4],
+        }
+        for r in result.all()
+    ]))
+
 
-    cm_q = select(
+def _daily_totals_statement(filters: IncidentFilters):
+    q = select(
+        Incident.date,
         func.count(),
         func.coalesce(func.sum(Incident.total_cost), 0.0),
     )
-    cm_q = _apply_filters(cm_q, filters)
-    cm_q = cm_q.where(Incident.date >= current_month_start)
-    cm_result = await db.execute(cm_q)
-    cm_row = cm_result.one()
-    current_count = cm_row[0] or 0
-    current_cost = float(cm_row[1])
-
-    pm_q = select(
-        func.count(),
-        func.coalesce(func.sum(Incident.total_cost), 0.0),
+    q = apply_filters(q, filters)
+    q = q.where(Incident.date >= bindparam("since", type_=Date))
+    return q.group_by(Incident.date)
+
+
+async def _period_totals(
+    db: AsyncSession,
+    filters: IncidentFilters,
+    store: IncidentColumns | None,
+    periods: TrendPeriods,
+    starts: list[date],
+) -> tuple[list[int], list[float]]:
+    """Incident count and cost of every period of the series.
+
+    One grouped query returns per-day (or, from the rollup, per-month)
+    totals, which are then bucketed into periods in one vectorized pass;
+    the query is the same whatever the period kind or count. Costs are
+    rounded to cents, as in _kpi_response, so the changes and alerts derived
+    from them do not depend on the engine.
+    """
+    if store is not None:
+        counts, costs = store.period_totals(store.mask(filters), starts)
+    else:
+        if periods.kind in ("month", "quarter") and rollup_fits(filters):
+            rows = await rollup_month_totals(db, filters, starts[0])
+        else:
+            q = filtered_statement("daily_totals", filters, _daily_totals_statement)
+            result = await db.execute(q, {**filters.params, "since": starts[0]})
+            rows = result.all()
+        if not rows:
+            return [0] * len(starts), [0.0] * len(starts)
+        dates, day_counts, day_costs = zip(*rows)
+        counts, costs = period_totals(dates, day_counts, day_costs, starts)
+    return counts, [round(cost, 2) for cost in costs]
+
+
+def _active_cases_statement(filters: IncidentFilters):
+    q = select(func.count())
+    q = apply_filters(q, filters)
+    return q.where(Incident.final_status == "EN PROCESO")
+
+
+@router.get("/trends", response_model=TrendsResponse)
+async def get_trends(
+    db: AsyncSession = Depends(get_read_db),
+    date_from: str | None = Query(None),
+    date_to: str | None = Query(None),
+    work_center: str | None = Query(None),
+    position: str | None = Query(None),
+    incident_type: str | None = Query(None),
+    classifier: str | None = Query(None),
+    body_part: str | None = Query(None),
+    final_status: str | None = Query(None),
+    contract: str | None = Query(None),
+    period: PeriodKind = Query("month"),
+    days: int = Query(30, ge=1, le=365),
+    compare: Comparison = Query("previous"),
+    count: int = Query(12, ge=2, le=60),
+):
+    """Trend alerts plus a series of period-over-period deltas.
+
+    The series holds the last `count` periods (week, calendar month,
+    quarter, or rolling windows of `days` days), the current one last,
+    each compared with the previous period or with the same period a year
+    earlier. Each period counts incidents dated from its start up to the
+    next one; the current period is open-ended.
+    """
+    filters = IncidentFilters.from_params(
+        date_from, date_to, work_center, position, incident_type,
+        classifier, body_part, final_status, contract,
     )
-    pm_q = _apply_filters(pm_q, filters)
-    pm_q = pm_q.where(
-        Incident.date >= prev_month_start,
-        Incident.date < prev_month_end,
+    periods = TrendPeriods(period, days, compare, count)
+    cache_key = result_cache.key(
+        "trends", {"filters": filters, "periods": periods, "today": date.today()}
     )
-    pm_result = await db.execute(pm_q)
-    pm_row = pm_result.one()
-    prev_count = pm_row[0] or 0
-    prev_cost = float(pm_row[1])
-
-    if prev_count > 0:
-        month_over_month_change = round(
-            ((current_count - prev_count) / prev_count) * 100, 1
-        )
+    cached = result_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    starts = periods.starts(date.today())
+    store = await columnar_store.get()
+    counts, costs = await _period_totals(db, filters, store, periods, starts)
+    mask = store.mask(filters) if store is not None else None
+
+    if store is not None:
+        bp_row = next(iter(store.group_count(mask, "body_part")), None)
+        cl_row = next(iter(store.group_count(mask, "classifier")), None)
+        active_cases = store.count_equal(mask, "final_status", "EN PROCESO")
     else:
-        month_over_month_change = 100.0 if current_count > 0 else 0.0
+        bp_q = filtered_statement(
+            "top:body_part", filters,
+            lambda f: _group_count_statement(f, Incident.body_part).limit(1),
+        )
+        bp_result = await db.execute(bp_q, filters.params)
+        bp_row = bp_result.first()
 
-    if prev_cost > 0:
-        cost_trend = round(((current_cost - prev_cost) / prev_cost) * 100, 1)
-    else:
-        cost_trend = 100.0 if current_cost > 0 else 0.0
-
-    bp_q = select(Incident.body_part, func.count().label("cnt"))
-    bp_q = _apply_filters(bp_q, filters)
-    bp_q = bp_q.where(Incident.body_part.isnot(None))
-    bp_q = bp_q.group_by(Incident.body_part).order_by(func.count().desc()).limit(1)
-    bp_result = await db.execute(bp_q)
-    bp_row = bp_result.first()
-    most_affected_body_part = bp_row[0] if bp_row else None
-    most_affected_count = bp_row[1] if bp_row else 0
+        cl_q = filtered_statement(
+            "top:classifier", filters,
+            lambda f: _group_count_statement(f, Incident.classifier).limit(1),
+        )
+        cl_result = await db.execute(cl_q, filters.params)
+        cl_row = cl_result.first()
 
-    cl_q = select(Incident.classifier, func.count().label("cnt"))
-    cl_q = _apply_filters(cl_q, filters)
-    cl_q = cl_q.where(Incident.classifier.isnot(None))
-    cl_q = cl_q.group_by(Incident.classifier).order_by(func.count().desc()).limit(1)
-    cl_result = await db.execute(cl_q)
-    cl_row = cl_result.first()
-    most_common_classifier = cl_row[0] if cl_row else None
+        active_q = filtered_statement("active_cases", filters, _active_cases_statement)
+        active_result = await db.execute(active_q, filters.params)
+        active_cases = active_result.scalar() or 0
 
-    active_q = select(func.count())
-    active_q = _apply_filters(active_q, filters)
-    active_q = active_q.where(Incident.final_status == "EN PROCESO")
-    active_result = await db.execute(active_q)
-    active_cases = active_result.scalar() or 0
+    response = _trends_response(periods, starts, counts, costs, bp_row, cl_row, active_cases)
+    return result_cache.set(cache_key, response)
 
-    alerts: list[AlertItem] = []
 
-    if month_over_month_change > 20:
-        alerts.append(
-            AlertItem(
-                type="incident_increase",
-                message=f"Incremento significativo de incidentes: {month_over_month_change}% respecto al mes anterior",
-                severity="warning",
-            )
-        )
+@router.get("/summary", response_model=DashboardSummaryResponse)
+async def get_summary(
+    db: AsyncSession = Depends(get_read_db),
+    date_from: str | None = Query(None),
+    date_to: str | None = Query(None),
+    work_center: str | None = Query(None),
+    position: str | None = Query(None),
+    incident_type: str | None = Query(None),
+    classifier: str | None = Query(None),
+    body_part: str | None = Query(None),
+    final_status: str | None = Query(None),
+    contract: str | None = Query(None),
+    max_incidents_per_part: int | None = Query(None, ge=0),
+    period: PeriodKind = Query("month"),
+    days: int = Query(30, ge=1, le=365),
+    compare: Comparison = Query("previous"),
+    count: int = Query(12, ge=2, le=60),
+):
+    """KPIs, charts, trends and body map for one filter set in a single response.
 
-    if most_affected_body_part and most_affected_count > 3:
-        alerts.append(
-            AlertItem(
-                type="body_part",
-                message=f"Parte del cuerpo más afectada: {most_affected_body_part} con {most_affected_count} registros",
-                severity="warning",
-            )
-        )
+    Trends reuse the other three: active cases come from the KPI row, the
+    top classifier from the charts and the top body part from the body map,
+    so the period series is the only query of their own.
+    """
+    filters = IncidentFilters.from_params(
+        date_from, date_to, work_center, position, incident_type,
+        classifier, body_part, final_status, contract,
+    )
+    today = date.today()
+    periods = TrendPeriods(period, days, compare, count)
+    cache_key = result_cache.key(
+        "summary",
+        {
+            "filters": filters,
+            "periods": periods,
+            "today": today,
+            "max_incidents_per_part": max_incidents_per_part,
+        },
+    )
+    cached = result_cache.get(cache_key)
+    if cached is not None:
+        return _json_response(cached)
+
+    current_month_start, prev_month_start = _month_starts(today)
+    store = await columnar_store.get()
+    row = await _kpi_row(db, filters, store, current_month_start, prev_month_start)
+    charts = await _charts_response(db, filters, store)
+    body_map = await _body_map_response(db, filters, store, max_incidents_per_part)
+
+    starts = periods.starts(today)
+    counts, costs = await _period_totals(db, filters, store, periods, starts)
+
+    top_part = body_map["parts"][0] if body_map["parts"] else None
+    top_classifier = charts["by_classifier"][0] if charts["by_classifier"] else None
+    trends = _trends_response(
+        periods, starts, counts, costs,
+        (top_part["name"], top_part["count"]) if top_part else None,
+        (top_classifier["name"], top_classifier["count"]) if top_classifier else None,
+        int(row[5]),
+    )
 
-    if prev_cost > 0 and current_cost > prev_cost * 1.5:
-        alerts.append(
-            AlertItem(
-                type="cost_increase",
-                message=f"Incremento significativo de costos: ${current_cost:,.0f} este mes vs ${prev_cost:,.0f} mes anterior",
-                severity="danger",
-            )
-        )
+    summary = {
+        "kpis": _kpi_response(row).model_dump(),
+        "charts": charts,
+        "trends": trends.model_dump(),
+        "body_map": body_map,
+    }
+    return _json_response(result_cache.set(cache_key, orjson.dumps(summary)))
 
-    if active_cases > 5:
-        alerts.append(
-            AlertItem(
-                type="pending_cases",
-                message=f"Hay {active_cases} casos en proceso pendientes de resolución",
-                severity="info",
-            )
-        )
 
-    return TrendsResponse(
-        month_over_month_change=month_over_month_change,
-        cost_trend=cost_trend,
-        most_affected_body_part=most_affected_body_part,
-        most_common_classifier=most_common_classifier,
-        alerts=alerts,
+def _indicator_item(
+    year: int, month: int, label: str,
+    worked_hours: float, headcount: float, accidents: int, lost_days: int,
+) -> dict:
+    """IndicatorItem as a dict."""
+    return {
+        "year": year,
+        "month": month,
+        "label": label,
+        "worked_hours": round(float(worked_hours), 2),
+        "headcount": headcount,
+        "accidents": accidents,
+        "lost_days": lost_days,
+        **safety_rates(worked_hours, headcount, accidents, lost_days),
+    }
+
+
+@router.get("/indicators", response_model=IndicatorsResponse)
+async def get_indicators(
+    db: AsyncSession = Depends(get_read_db),
+    date_from: str | None = Query(None),
+    date_to: str | None = Query(None),
+    work_center: str | None = Query(None),
+    contract: str | None = Query(None),
+):
+    """Monthly frequency, severity and accident rates from the indicator table.
+
+    Rates are computed after summing hours, headcount, accidents and lost
+    days over the matching work centers/contracts. The total divides by the
+    average monthly headcount, so its accident rate covers the whole range.
+
+    Indicators are monthly: a date range covers every month it touches, and
+    period_from/period_to report those whole months (e.g. 2025-03-15 to
+    2025-05-10 gives 2025-03-01 to 2025-05-31).
+    """
+    filters = IncidentFilters.from_params(
+        date_from, date_to, work_center=work_center, contract=contract,
     )
+    cache_key = result_cache.key("indicators", {"filters": filters})
+    cached = result_cache.get(cache_key)
+    if cached is not None:
+        return _json_response(cached)
+
+    rows = [
+        (int(year), int(month), hours or 0.0, int(headcount or 0), int(accidents or 0), int(lost_days or 0))
+        for year, month, hours, headcount, accidents, lost_days
+        in await indicator_months(db, filters)
+    ]
+    series = [
+        _indicator_item(year, month, f"{MONTH_NAMES[month]} {year}", *totals)
+        for year, month, *totals in rows
+    ]
+    total = None
+    if series:
+        first, last = series[0], series[-1]
+        total = _indicator_item(
+            last["year"], last["month"], f"{first['label']} - {last['label']}",
+            sum(row[2] for row in rows),
+            round(sum(row[3] for row in rows) / len(rows), 1),
+            sum(row[4] for row in rows),
+            sum(row[5] for row in rows),
+        )
+    period_from, period_to = indicator_period(filters)
+    indicators = {"series": series, "total": total, "period_from": period_from, "period_to": period_to}
+    return _json_response(result_cache.set(cache_key, orjson.dumps(indicators)))
+
+
+def _incident_list_statement(filters: IncidentFilters, search: str | None, dialect_name: str):
+    """Filtered IncidentItem columns, before sorting and paging."""
+    q = apply_filters(select(*INCIDENT_COLUMNS), filters)
+    if search:
+        q = q.where(search_condition(search, dialect_name))
+    return q
 
 
 @router.get("/incidents", response_model=IncidentListResponse)
 async def get_incidents(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
     search: str | None = Query(None),
     sort_by: str | None = Query(None),
     sort_order: str = Query("desc"),
+    pagination: Literal["offset", "cursor"] = Query("offset"),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
     date_from: str | None = Query(None),
     date_to: str | None = Query(None),
     work_center: str | None = Query(None),
@@ -505,25 +927,21 @@ async def get_incidents(
     final_status: str | None = Query(None),
     contract: str | None = Query(None),
 ):
-    filters = _get_filter_params(
+    filters = IncidentFilters.from_params(
         date_from, date_to, work_center, position, incident_type,
         classifier, body_part, final_status, contract,
     )
 
-    base = select(Incident)
-    base = _apply_filters(base, filters)
+    params = filters.params
+    base = _incident_list_statement(filters, search, db.bind.dialect.name)
 
-    if search:
-        search_pattern = f"%{search}%"
-        base = base.where(
-            Incident.name.ilike(search_pattern)
-            | Incident.rut.ilike(search_pattern)
-            | Incident.observation.ilike(search_pattern)
-        )
-
-    count_q = select(func.count()).select_from(base.subquery())
-    count_result = await db.execute(count_q)
-    total = count_result.scalar() or 0
+    total = None
+    if include_total:
+        count_q = select(func.count()).select_from(base.subquery())
+        count_result = await db.execute(count_q, params)
+        total = count_result.scalar() or 0
+    elif not search and rollup_fits(filters):
+        total = await rollup_count(db, filters)
 
     allowed_sort_fields = {
         "id", "number", "name", "date", "age", "lost_days",
@@ -532,30 +950,58 @@ async def get_incidents(
     }
     if sort_by and sort_by in allowed_sort_fields:
         col = getattr(Incident, sort_by)
-        base = base.order_by(col.desc() if sort_order == "desc" else col.asc())
+        descending = sort_order == "desc"
     else:
-        base = base.order_by(Incident.id.desc())
-
-    offset = (page - 1) * size
-    base = base.offset(offset).limit(size)
-
-    result = await db.execute(base)
-    items = result.scalars().all()
+        col = Incident.id
+        descending = True
+
+    next_cursor = None
+    if pagination == "cursor":
+        # Keyset pagination on (sort column, id): NULLs always sort last and id
+        # breaks ties, so each page is an index range instead of an OFFSET.
+        if cursor:
+            base = base.where(_after_cursor(col, descending, _decode_cursor(cursor, col)))
+        base = base.order_by(
+            col.is_(None),
+            col.desc() if descending else col.asc(),
+            Incident.id.desc() if descending else Incident.id.asc(),
+        )
+        result = await db.execute(base.limit(size + 1), params)
+        items = [dict(zip(INCIDENT_FIELDS, row)) for row in result.all()]
+        if len(items) > size:
+            items = items[:size]
+            last = items[-1]
+            next_cursor = _encode_cursor(last[col.key], last["id"])
+    else:
+        base = base.order_by(col.desc() if descending else col.asc())
+        offset = (page - 1) * size
+        base = base.offset(offset).limit(size)
+        result = await db.execute(base, params)
+        items = [dict(zip(INCIDENT_FIELDS, row)) for row in result.all()]
+
+    if total is None:
+        pages = None
+    else:
+        pages = math.ceil(total / size) if total > 0 else 1
 
-    pages = math.ceil(total / size) if total > 0 else 1
-
-    return IncidentListResponse(
-        items=[IncidentItem.model_validate(item) for item in items],
-        total=total,
-        page=page,
-        size=size,
-        pages=pages,
-    )
+    return _json_response(orjson.dumps({
+        "items": items,
+        "total": total,
+        "page": page,
+        "size": size,
+        "pages": pages,
+        "next_cursor": next_cursor,
+    }))
 
 
 @router.get("/filter-options")
-async def get_filter_options(db: AsyncSession = Depends(get_db)):
+async def get_filter_options(db: AsyncSession = Depends(get_read_db)):
     """Return distinct values for dynamic filter dropdowns."""
+    cache_key = result_cache.key("filter-options", {})
+    cached = result_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     options: dict[str, list[str]] = {}
     for field_name, column in [
         ("contracts", Incident.contract),
@@ -565,4 +1011,10 @@ async def get_filter_options(db: AsyncSession = Depends(get_db)):
         q = select(column).where(column.isnot(None)).distinct().order_by(column)
         result = await db.execute(q)
         options[field_name] = [row[0] for row in result.all()]
-    return options
+    return result_cache.set(cache_key, options)
+
+
+@router.get("/cache-stats")
+async def get_cache_stats():
+    """Hit/miss/eviction counters of the dashboard result cache."""
+    return result_cache.stats()
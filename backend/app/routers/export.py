@@ -1,50 +1,22 @@
+import csv
+import io
+import tempfile
 from datetime import datetime
-from io import BytesIO
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_read_db, read_session
 from app.models import Incident
+from app.services.filters import IncidentFilters, apply_filters, filtered_statement
+from app.services.metrics import metrics
 
 router = APIRouter(prefix="/api", tags=["export"])
 
 
-def _apply_filters(query, filters: dict):
-    if filters.get("date_from"):
-        try:
-            d = datetime.strptime(filters["date_from"], "%Y-%m-%d").date()
-            query = query.where(Incident.date >= d)
-        except ValueError:
-            pass
-
-    if filters.get("date_to"):
-        try:
-            d = datetime.strptime(filters["date_to"], "%Y-%m-%d").date()
-            query = query.where(Incident.date <= d)
-        except ValueError:
-            pass
-
-    if filters.get("work_center"):
-        query = query.where(Incident.work_center == filters["work_center"])
-    if filters.get("position"):
-        query = query.where(Incident.position == filters["position"])
-    if filters.get("incident_type"):
-        query = query.where(Incident.incident_type == filters["incident_type"])
-    if filters.get("classifier"):
-        query = query.where(Incident.classifier == filters["classifier"])
-    if filters.get("body_part"):
-        query = query.where(Incident.body_part == filters["body_part"])
-    if filters.get("final_status"):
-        query = query.where(Incident.final_status == filters["final_status"])
-    if filters.get("contract"):
-        query = query.where(Incident.contract == filters["contract"])
-
-    return query
-
-
 EXPORT_COLUMNS = [
     ("N°", "number"),
     ("Nombre", "name"),
@@ -72,10 +44,44 @@ EXPORT_COLUMNS = [
     ("Contrato", "contract"),
 ]
 
+MONEY_FIELDS = {"attention_cost", "medicine_cost", "cost_per_day_not_worked", "total_cost"}
+
+FETCH_BATCH_SIZE = 1000
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _build_export_query(filters: IncidentFilters):
+    columns = [getattr(Incident, field) for _, field in EXPORT_COLUMNS]
+    query = select(*columns)
+    query = apply_filters(query, filters)
+    return query.order_by(Incident.id).execution_options(yield_per=FETCH_BATCH_SIZE)
+
+
+def _export_query(filters: IncidentFilters):
+    """Plain column tuples in EXPORT_COLUMNS order, fetched in batches.
+
+    Execute with filters.params.
+    """
+    return filtered_statement("export", filters, _build_export_query)
+
+
+def _export_filename(extension: str) -> str:
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"incidentes_{timestamp}.{extension}"
+
+
+async def _iter_file(file):
+    try:
+        while chunk := file.read(STREAM_CHUNK_SIZE):
+            yield chunk
+    finally:
+        file.close()
+
 
 @router.get("/export/excel")
 async def export_excel(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     date_from: str | None = Query(None),
     date_to: str | None = Query(None),
     work_center: str | None = Query(None),
@@ -88,26 +94,16 @@ async def export_excel(
 ):
     import xlsxwriter
 
-    filters = {
-        "date_from": date_from,
-        "date_to": date_to,
-        "work_center": work_center,
-        "position": position,
-        "incident_type": incident_type,
-        "classifier": classifier,
-        "body_part": body_part,
-        "final_status": final_status,
-        "contract": contract,
-    }
-
-    query = select(Incident)
-    query = _apply_filters(query, filters)
-    query = query.order_by(Incident.id)
-    result = await db.execute(query)
-    incidents = result.scalars().all()
-
-    output = BytesIO()
-    workbook = xlsxwriter.Workbook(output, {"in_memory": True})
+    filters = IncidentFilters.from_params(
+        date_from, date_to, work_center, position, incident_type,
+        classifier, body_part, final_status, contract,
+    )
+    query = _export_query(filters)
+
+    # constant_memory flushes each row to disk as it is written, so neither the
+    # rows nor the workbook are ever held in memory as a whole.
+    output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    workbook = xlsxwriter.Workbook(output, {"constant_memory": True})
     worksheet = workbook.add_worksheet("Incidentes")
 
     header_format = workbook.add_format({
@@ -122,32 +118,128 @@ async def export_excel(
     money_format = workbook.add_format({"num_format": "$#,##0.00"})
 
     for col_idx, (header, _) in enumerate(EXPORT_COLUMNS):
+        worksheet.set_column(col_idx, col_idx, max(len(header) + 2, 12))
         worksheet.write(0, col_idx, header, header_format)
 
-    for row_idx, incident in enumerate(incidents, start=1):
+    result = await db.stream(query, filters.params)
+    row_idx = 0
+    async for row in result:
+        row_idx += 1
         for col_idx, (_, field) in enumerate(EXPORT_COLUMNS):
-            value = getattr(incident, field, None)
+            value = row[col_idx]
 
             if field == "date" and value is not None:
                 worksheet.write_datetime(row_idx, col_idx, datetime.combine(value, datetime.min.time()), date_format)
-            elif field in ("attention_cost", "medicine_cost", "cost_per_day_not_worked", "total_cost"):
+            elif field in MONEY_FIELDS:
                 worksheet.write_number(row_idx, col_idx, float(value or 0), money_format)
             elif isinstance(value, (int, float)):
                 worksheet.write_number(row_idx, col_idx, value)
             else:
                 worksheet.write(row_idx, col_idx, str(value) if value is not None else "")
+    metrics.observe_rows_fetched(row_idx)
 
-    for col_idx, (header, _) in enumerate(EXPORT_COLUMNS):
-        worksheet.set_column(col_idx, col_idx, max(len(header) + 2, 12))
-
-    workbook.close()
+    await run_in_threadpool(workbook.close)
     output.seek(0)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"incidentes_{timestamp}.xlsx"
+    filename = _export_filename("xlsx")
 
     return StreamingResponse(
-        output,
+        _iter_file(output),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
+
+
+async def _iter_csv(filters: IncidentFilters):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    # The header goes out before the query runs; rows follow batch by batch.
+    writer.writerow([header for header, _ in EXPORT_COLUMNS])
+    yield buffer.getvalue().encode("utf-8-sig")
+
+    async with read_session() as session:
+        result = await session.stream(_export_query(filters), filters.params)
+        async for rows in result.partitions():
+            metrics.observe_rows_fetched(len(rows))
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(rows)
+            yield buffer.getvalue().encode("utf-8")
+
+
+@router.get("/export/csv")
+async def export_csv(
+    date_from: str | None = Query(None),
+    date_to: str | None = Query(None),
+    work_center: str | None = Query(None),
+    position: str | None = Query(None),
+    incident_type: str | None = Query(None),
+    classifier: str | None = Query(None),
+    body_part: str | None = Query(None),
+    final_status: str | None = Query(None),
+    contract: str | None = Query(None),
+):
+    filters = IncidentFilters.from_params(
+        date_from, date_to, work_center, position, incident_type,
+        classifier, body_part, final_status, contract,
+    )
+    filename = _export_filename("csv")
+
+    return StreamingResponse(
+        _iter_csv(filters),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
+@router.get("/export/parquet")
+async def export_parquet(
+    db: AsyncSession = Depends(get_read_db),
+    date_from: str | None = Query(None),
+    date_to: str | None = Query(None),
+    work_center: str | None = Query(None),
+    position: str | None = Query(None),
+    incident_type: str | None = Query(None),
+    classifier: str | None = Query(None),
+    body_part: str | None = Query(None),
+    final_status: str | None = Query(None),
+    contract: str | None = Query(None),
+):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    filters = IncidentFilters.from_params(
+        date_from, date_to, work_center, position, incident_type,
+        classifier, body_part, final_status, contract,
+    )
+
+    arrow_types = {"date": pa.date32()}
+    arrow_types.update({field: pa.int64() for field in ("number", "age", "lost_days", "year")})
+    arrow_types.update({field: pa.float64() for field in MONEY_FIELDS | {"days_not_worked"}})
+    schema = pa.schema([
+        (header, arrow_types.get(field, pa.string())) for header, field in EXPORT_COLUMNS
+    ])
+
+    output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    writer = pq.ParquetWriter(output, schema, compression="zstd")
+
+    result = await db.stream(_export_query(filters), filters.params)
+    async for rows in result.partitions():
+        metrics.observe_rows_fetched(len(rows))
+        table = pa.Table.from_arrays(
+            [pa.array(column, type=schema.field(idx).type) for idx, column in enumerate(zip(*rows))],
+            schema=schema,
+        )
+        await run_in_threadpool(writer.write_table, table)
+
+    await run_in_threadpool(writer.close)
+    output.seek(0)
+
+    filename = _export_filename("parquet")
+
+    return StreamingResponse(
+        _iter_file(output),
+        media_type="application/vnd.apache.parquet",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
@@ -1,20 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
-from sqlalchemy import func, select
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.models import Incident, Upload
-from app.schemas import UploadListItem, UploadResponse
-from app.services.excel_parser import parse_excel
+from app.config import settings
+from app.database import get_db, record_write
+from app.models import Upload
+from app.schemas import (
+    UploadJobResponse,
+    UploadListItem,
+    UploadResponse,
+    WorkedHoursUploadResponse,
+)
+from app.services.bulk_insert import (
+    INSERT_BATCH_SIZE,
+    dataset_changed,
+    ingest_batches,
+    total_incident_count,
+)
+from app.services.cache import result_cache
+from app.services.excel_parser import parse_worked_hours
+from app.services.indicators import refresh_indicators, replace_worked_hours
+from app.services.parse_pool import parse_pool, spool_upload
+from app.services.rollup import remove_rollup
+from app.services.upload_jobs import create_upload_job, get_upload_job
 
 router = APIRouter(prefix="/api", tags=["upload"])
 
 
-@router.post("/upload", response_model=UploadResponse)
-async def upload_file(
-    file: UploadFile = File(...),
-    db: AsyncSession = Depends(get_db),
-):
+def _check_excel_file(file: UploadFile):
     if not file.filename:
         raise HTTPException(status_code=400, detail="No se proporcionó un archivo")
 
@@ -25,40 +41,106 @@ async def upload_file(
             detail="Formato de archivo no soportado. Use .xlsx o .xlsm",
         )
 
-    content = await file.read()
+
+@router.post("/upload", response_model=UploadResponse | UploadJobResponse)
+async def upload_file(
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db),
+    async_: bool = Query(False, alias="async"),
+    mode: Literal["append", "merge"] = Query("append"),
+):
+    _check_excel_file(file)
+
+    if parse_pool.queue_depth >= settings.PARSE_MAX_QUEUE:
+        raise HTTPException(
+            status_code=503,
+            detail="Hay demasiadas cargas en proceso, intente nuevamente en unos minutos",
+        )
+
+    if async_:
+        source_path = await spool_upload(file.file, file.filename)
+        return await create_upload_job(db, file.filename, source_path, mode)
+
     try:
-        records = parse_excel(content, file.filename)
+        batches = await parse_pool.parse(file.file, file.filename, INSERT_BATCH_SIZE)
     except Exception as e:
         raise HTTPException(
             status_code=400,
             detail=f"Error al procesar el archivo Excel: {str(e)}",
         )
 
+    try:
+        if not batches.count:
+            raise HTTPException(
+                status_code=400,
+                detail="No se encontraron registros válidos en el archivo",
+            )
+        upload, counts = await ingest_batches(db, file.filename, batches, batches.count, mode=mode)
+    finally:
+        batches.close()
+
+    await db.commit()
+    record_write()
+    if dataset_changed(counts):
+        result_cache.bump_version()
+
+    total_records = await total_incident_count(db)
+
+    return UploadResponse(
+        upload_id=upload.id,
+        filename=file.filename,
+        records_added=counts["inserted"],
+        records_updated=counts["updated"],
+        records_unchanged=counts["unchanged"],
+        records_duplicated=counts["duplicates"],
+        total_records=total_records,
+    )
+
+
+@router.post("/worked-hours/upload", response_model=WorkedHoursUploadResponse)
+async def upload_worked_hours(file: UploadFile = File(...), db: AsyncSession = Depends(get_db)):
+    """Load hours worked and headcount per work center, contract and month.
+
+    Each work center/contract/month in the file replaces what was loaded
+    for it before; other work centers of the same month are kept. The
+    indicators of the months in the file are rebuilt.
+    """
+    _check_excel_file(file)
+
+    try:
+        records = await run_in_threadpool(parse_worked_hours, file.file)
+    except Exception as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Error al procesar el archivo Excel: {str(e)}",
+        )
     if not records:
         raise HTTPException(
             status_code=400,
             detail="No se encontraron registros válidos en el archivo",
         )
 
-    upload = Upload(filename=file.filename, record_count=len(records))
-    db.add(upload)
-    await db.flush()
-
-    incidents = [Incident(upload_id=upload.id, **record) for record in records]
-    db.add_all(incidents)
+    months = await replace_worked_hours(db, records)
+    await refresh_indicators(db, months)
     await db.commit()
+    record_write()
+    result_cache.bump_version()
 
-    total_result = await db.execute(select(func.count(Incident.id)))
-    total_records = total_result.scalar() or 0
-
-    return UploadResponse(
-        upload_id=upload.id,
+    return WorkedHoursUploadResponse(
         filename=file.filename,
-        records_added=len(records),
-        total_records=total_records,
+        records=len(records),
+        months=[f"{year}-{month:02d}" for year, month in sorted(months)],
     )
 
 
+@router.get("/upload-jobs/{job_id}", response_model=UploadJobResponse)
+async def get_upload_job_status(job_id: int, db: AsyncSession = Depends(get_db)):
+    job = await get_upload_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Carga no encontrada")
+    return job
+
+
 @router.get("/uploads", response_model=list[UploadListItem])
 async def list_uploads(db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(Upload).order_by(Upload.uploaded_at.desc()))
@@ -66,6 +148,12 @@ async def list_uploads(db: AsyncSession = Depends(get_db)):
     return uploads
 
 
+@router.get("/upload-queue")
+async def get_upload_queue():
+    """Parse pool load: queue depth, running and finished parses."""
+    return parse_pool.stats()
+
+
 @router.delete("/uploads/{upload_id}")
 async def delete_upload(upload_id: int, db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(Upload).where(Upload.id == upload_id))
@@ -74,7 +162,11 @@ async def delete_upload(upload_id: int, db: AsyncSession = Depends(get_db)):
     if not upload:
         raise HTTPException(status_code=404, detail="Upload no encontrado")
 
+    months = await remove_rollup(db, upload_id)
+    await refresh_indicators(db, months)
     await db.delete(upload)
     await db.commit()
+    record_write()
+    result_cache.bump_version()
 
     return {"detail": "Upload y registros asociados eliminados correctamente"}
@@ -8,9 +8,38 @@ class UploadResponse(BaseModel):
     upload_id: int
     filename: str
     records_added: int
+    records_updated: int = 0
+    records_unchanged: int = 0
+    # Merge mode: rows whose key repeats within the file; only the last is kept.
+    records_duplicated: int = 0
     total_records: int
 
 
+class WorkedHoursUploadResponse(BaseModel):
+    filename: str
+    records: int
+    months: list[str]
+
+
+class UploadJobResponse(BaseModel):
+    id: int
+    filename: str
+    stage: str
+    rows_parsed: int = 0
+    rows_inserted: int = 0
+    rows_per_second: float = 0.0
+    records_added: int = 0
+    records_updated: int = 0
+    records_unchanged: int = 0
+    records_duplicated: int = 0
+    total_records: Optional[int] = None
+    upload_id: Optional[int] = None
+    error: Optional[str] = None
+    created_at: datetime.datetime
+    started_at: Optional[datetime.datetime] = None
+    finished_at: Optional[datetime.datetime] = None
+
+
 class UploadListItem(BaseModel):
     id: int
     filename: str
@@ -84,12 +113,53 @@ class AlertItem(BaseModel):
     severity: str
 
 
+class TrendPeriodItem(BaseModel):
+    start: datetime.date
+    end: datetime.date
+    incidents: int = 0
+    cost: float = 0.0
+    incident_change: float = 0.0
+    cost_change: float = 0.0
+    incident_alert: bool = False
+    cost_alert: bool = False
+
+
 class TrendsResponse(BaseModel):
     month_over_month_change: float = 0.0
     cost_trend: float = 0.0
     most_affected_body_part: Optional[str] = None
     most_common_classifier: Optional[str] = None
     alerts: list[AlertItem] = []
+    period: str = "month"
+    comparison: str = "previous"
+    series: list[TrendPeriodItem] = []
+
+
+class IndicatorItem(BaseModel):
+    year: int
+    month: int
+    label: str
+    worked_hours: float
+    headcount: float
+    accidents: int
+    lost_days: int
+    frequency_rate: float
+    severity_rate: float
+    accident_rate: float
+
+
+class IndicatorsResponse(BaseModel):
+    series: list[IndicatorItem] = []
+    total: Optional[IndicatorItem] = None
+    period_from: Optional[datetime.date] = None
+    period_to: Optional[datetime.date] = None
+
+
+class DashboardSummaryResponse(BaseModel):
+    kpis: KPIResponse
+    charts: ChartsResponse
+    trends: TrendsResponse
+    body_map: BodyMapResponse
 
 
 class IncidentItem(BaseModel):
@@ -126,7 +196,8 @@ class IncidentItem(BaseModel):
 
 class IncidentListResponse(BaseModel):
     items: list[IncidentItem]
-    total: int
+    total: Optional[int] = None
     page: int
     size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
@@ -0,0 +1,234 @@
+import hashlib
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Incident, Upload
+from app.services.indicators import refresh_indicators
+from app.services.rollup import refresh_rollup
+from app.services.search import normalize_rut
+
+INSERT_BATCH_SIZE = 5000
+
+INCIDENT_COLUMNS = [
+    column.name for column in Incident.__table__.columns if column.name != "id"
+]
+
+# Columns compared between uploads in merge mode; a difference in any of them
+# makes the row "updated".
+CONTENT_COLUMNS = [
+    name for name in INCIDENT_COLUMNS
+    if name not in ("upload_id", "merge_key", "content_hash")
+]
+
+
+def _incident_rows(upload_id: int, records: list[dict]) -> list[dict]:
+    # The parser already fills numeric defaults, so every row carries the full
+    # column set (required by both executemany and COPY).
+    rows = []
+    for record in records:
+        row = {name: record.get(name) for name in INCIDENT_COLUMNS}
+        row["rut_normalized"] = normalize_rut(record.get("rut"))
+        row["upload_id"] = upload_id
+        rows.append(row)
+    return rows
+
+
+async def _copy_rows(db: AsyncSession, rows: list[dict]):
+    connection = await db.connection()
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        Incident.__tablename__,
+        records=[tuple(row[name] for name in INCIDENT_COLUMNS) for row in rows],
+        columns=INCIDENT_COLUMNS,
+    )
+
+
+async def bulk_insert_incidents(db: AsyncSession, upload_id: int, records: list[dict]):
+    """Insert parsed records without building ORM objects.
+
+    Uses COPY on PostgreSQL (asyncpg) and batched executemany INSERTs
+    elsewhere. Runs inside the caller's transaction; the caller commits.
+    """
+    rows = _incident_rows(upload_id, records)
+
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        batch = rows[start:start + INSERT_BATCH_SIZE]
+        if db.bind.dialect.name == "postgresql":
+            await _copy_rows(db, batch)
+        else:
+            await db.execute(insert(Incident), batch)
+
+
+def _fingerprint(row: dict) -> tuple[str, str]:
+    """(merge_key, content_hash) of an incident row.
+
+    The key identifies the same incident across re-uploads of the cumulative
+    workbook: sheet number, normalized RUT and date.
+    """
+    merge_key = "|".join(
+        "" if row[name] is None else str(row[name])
+        for name in ("number", "rut_normalized", "date")
+    )
+    content = repr(tuple(row[name] for name in CONTENT_COLUMNS))
+    content_hash = hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+    return merge_key, content_hash
+
+
+def _upsert_statement(dialect_name: str):
+    dialect_insert = postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+    stmt = dialect_insert(Incident)
+    # upload_id is left alone: an updated row stays with the upload that
+    # first brought it in, so that upload's rollup is the one refreshed.
+    return stmt.on_conflict_do_update(
+        index_elements=[Incident.merge_key],
+        set_={name: stmt.excluded[name] for name in (*CONTENT_COLUMNS, "content_hash")},
+        where=Incident.content_hash != stmt.excluded.content_hash,
+    )
+
+
+@dataclass
+class MergeState:
+    """What a merge upload remembers between the batches of one file.
+
+    stored maps the keys already in the database before this file to their
+    (content_hash, upload_id); pending holds the file's last row for those
+    of them whose content differs, written by apply_merge_updates.
+    """
+
+    inserted_keys: set[str] = field(default_factory=set)
+    stored: dict[str, tuple[str, int]] = field(default_factory=dict)
+    pending: dict[str, dict] = field(default_factory=dict)
+
+    def seen(self, key: str) -> bool:
+        return key in self.inserted_keys or key in self.stored
+
+
+async def _upsert_rows(db: AsyncSession, rows: list[dict]):
+    stmt = _upsert_statement(db.bind.dialect.name)
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        await db.execute(stmt, rows[start:start + INSERT_BATCH_SIZE])
+
+
+async def merge_incidents(
+    db: AsyncSession, upload_id: int, records: list[dict], state: MergeState,
+) -> dict:
+    """Insert the records whose merge_key is new; queue changes to stored rows.
+
+    Returns inserted/duplicates counts. Runs inside the caller's
+    transaction.
+
+    A key repeated within the file keeps its last row, in this batch or a
+    later one, and the rows it replaces are counted as duplicates. Changes
+    to rows stored before the file are only queued in state.pending, so an
+    earlier occurrence of a repeated key is never written over the stored
+    row; apply_merge_updates writes them once the whole file is read.
+    """
+    rows: dict[str, dict] = {}
+    duplicates = 0
+    for row in _incident_rows(upload_id, records):
+        row["merge_key"], row["content_hash"] = _fingerprint(row)
+        if row["merge_key"] in rows or state.seen(row["merge_key"]):
+            duplicates += 1
+        rows[row["merge_key"]] = row
+
+    keys = [key for key in rows if not state.seen(key)]
+    for start in range(0, len(keys), INSERT_BATCH_SIZE):
+        result = await db.execute(
+            select(Incident.merge_key, Incident.content_hash, Incident.upload_id)
+            .where(Incident.merge_key.in_(keys[start:start + INSERT_BATCH_SIZE]))
+        )
+        state.stored.update({key: (content_hash, owner) for key, content_hash, owner in result})
+
+    written = []
+    inserted = 0
+    for key, row in rows.items():
+        if key in state.stored:
+            if row["content_hash"] == state.stored[key][0]:
+                state.pending.pop(key, None)
+            else:
+                state.pending[key] = row
+            continue
+        if key not in state.inserted_keys:
+            state.inserted_keys.add(key)
+            inserted += 1
+        # A key this file inserted in an earlier batch is rewritten in place.
+        written.append(row)
+
+    await _upsert_rows(db, written)
+    return {"inserted": inserted, "duplicates": duplicates}
+
+
+async def apply_merge_updates(db: AsyncSession, state: MergeState) -> tuple[int, set[int]]:
+    """Write the queued changes to stored rows.
+
+    Returns the number of updated rows and the ids of the uploads that own
+    them.
+    """
+    await _upsert_rows(db, list(state.pending.values()))
+    return len(state.pending), {state.stored[key][1] for key in state.pending}
+
+
+async def ingest_batches(
+    db: AsyncSession,
+    filename: str,
+    batches: Iterable[list[dict]],
+    record_count: int,
+    mode: str = "append",
+    on_batch: Callable[[int], None] | None = None,
+) -> tuple[Upload, dict]:
+    """Create the Upload row and bulk insert its record batches.
+
+    In "merge" mode rows already present from earlier merge uploads are
+    updated in place or skipped, and the upload only owns the rows it
+    inserted. Returns the upload and its inserted/updated/duplicates/
+    unchanged counts. The caller commits and invalidates dashboard caches.
+    """
+    upload = Upload(filename=filename, record_count=record_count)
+    db.add(upload)
+    await db.flush()
+
+    counts = {"inserted": 0, "updated": 0, "duplicates": 0, "unchanged": 0}
+    refresh_ids = {upload.id}
+    state = MergeState()
+    rows_read = 0
+    for batch in batches:
+        if mode == "merge":
+            merged = await merge_incidents(db, upload.id, batch, state)
+            for name, value in merged.items():
+                counts[name] += value
+        else:
+            await bulk_insert_incidents(db, upload.id, batch)
+            counts["inserted"] += len(batch)
+        rows_read += len(batch)
+        if on_batch is not None:
+            on_batch(len(batch))
+
+    if mode == "merge":
+        counts["updated"], updated_uploads = await apply_merge_updates(db, state)
+        refresh_ids |= updated_uploads
+        counts["unchanged"] = rows_read - counts["inserted"] - counts["updated"] - counts["duplicates"]
+
+    upload.record_count = counts["inserted"]
+    months = await refresh_rollup(db, sorted(refresh_ids))
+    await refresh_indicators(db, months)
+    return upload, counts
+
+
+def dataset_changed(counts: dict) -> bool:
+    """Whether an upload wrote any incident.
+
+    A merge upload of an unchanged file does not, so cached dashboard
+    results and ETags stay valid.
+    """
+    return bool(counts["inserted"] or counts["updated"])
+
+
+async def total_incident_count(db: AsyncSession) -> int:
+    # uploads.record_count is maintained per upload, so summing it is far
+    # cheaper than counting the incidents table.
+    result = await db.execute(select(func.coalesce(func.sum(Upload.record_count), 0)))
+    return result.scalar() or 0
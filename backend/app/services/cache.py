@@ -0,0 +1,109 @@
+import json
+import time
+from collections import OrderedDict
+
+from pydantic import BaseModel
+
+from app.config import settings
+
+
+def _estimate_size(value) -> int:
+    if isinstance(value, bytes):
+        return len(value)
+    if isinstance(value, BaseModel):
+        return len(value.model_dump_json())
+    return len(json.dumps(value, default=str))
+
+
+class ResultCache:
+    """In-process TTL + LRU cache for dashboard responses.
+
+    Entries are keyed by endpoint, the normalized filter params and the
+    dataset version. Uploads and deletes bump the version, which drops every
+    cached result at once.
+    """
+
+    def __init__(self, enabled: bool, ttl_seconds: float, max_entries: int, max_bytes: int):
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.dataset_version = 0
+        self._entries: OrderedDict[tuple, tuple[float, int, object]] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, endpoint: str, params: dict) -> tuple:
+        normalized = tuple(sorted((k, v) for k, v in params.items() if v not in (None, "")))
+        return (self.dataset_version, endpoint, normalized)
+
+    def get(self, key: tuple):
+        if not self.enabled:
+            return None
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, _, value = entry
+        if expires_at < time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: tuple, value):
+        # Results computed before an upload/delete finished must not be stored
+        # under the new dataset version.
+        if not self.enabled or key[0] != self.dataset_version:
+            return value
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return value
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, size, value)
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+        return value
+
+    def _remove(self, key: tuple):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def bump_version(self):
+        """Invalidate every cached result after the dataset changed."""
+        self.dataset_version += 1
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "dataset_version": self.dataset_version,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+result_cache = ResultCache(
+    enabled=settings.CACHE_ENABLED,
+    ttl_seconds=settings.CACHE_TTL_SECONDS,
+    max_entries=settings.CACHE_MAX_ENTRIES,
+    max_bytes=settings.CACHE_MAX_BYTES,
+)
@@ -0,0 +1,221 @@
+import asyncio
+from datetime import date
+
+import numpy as np
+from sqlalchemy import select
+
+from app.config import settings
+from app.database import read_session
+from app.models import Incident
+from app.services.cache import result_cache
+from app.services.filters import EQUALITY_FIELDS, IncidentFilters
+from app.services.periods import period_totals
+
+CATEGORICAL_COLUMNS = (
+    "work_center", "position", "incident_type", "classifier", "body_part",
+    "final_status", "contract", "sex", "attention_type",
+)
+
+class Categorical:
+    """Dictionary-encoded string column: sorted categories plus int32 codes, -1 for NULL."""
+
+    def __init__(self, values: list):
+        self.categories = sorted({v for v in values if v is not None})
+        index = {v: i for i, v in enumerate(self.categories)}
+        self.codes = np.fromiter(
+            (index.get(v, -1) for v in values), dtype=np.int32, count=len(values)
+        )
+        self._index = index
+
+    def equals(self, value: str):
+        code = self._index.get(value)
+        if code is None:
+            return self.codes == -2
+        return self.codes == code
+
+
+class IncidentColumns:
+    """Immutable columnar snapshot of the incidents table.
+
+    Every method mirrors one dashboard query: same filters, same NULL
+    handling, same row shapes and ordering as the SQL it replaces, so the
+    routers format both results with the same code.
+    """
+
+    def __init__(self, rows: list):
+        columns = list(zip(*rows)) if rows else [()] * (7 + len(CATEGORICAL_COLUMNS))
+        ids, names, dates, years, ages, lost_days, total_cost = columns[:7]
+
+        self.size = len(rows)
+        self.ids = np.array(ids, dtype=np.int64)
+        self.names = np.array(names, dtype=object)
+        self.dates = np.array(
+            [np.datetime64(d, "D") if d is not None else np.datetime64("NaT") for d in dates],
+            dtype="datetime64[D]",
+        )
+        self.has_date = ~np.isnat(self.dates)
+        self.months = self.dates.astype("datetime64[M]").astype(np.int64) % 12 + 1
+        self.has_year = np.array([y is not None for y in years], dtype=bool)
+        self.years = np.array([y or 0 for y in years], dtype=np.int64)
+        self.has_age = np.array([a is not None for a in ages], dtype=bool)
+        self.ages = np.array([a or 0 for a in ages], dtype=np.int64)
+        self.lost_days = np.array([d or 0 for d in lost_days], dtype=np.int64)
+        self.total_cost = np.array([c or 0.0 for c in total_cost], dtype=np.float64)
+        self.categorical = {
+            name: Categorical(values)
+            for name, values in zip(CATEGORICAL_COLUMNS, columns[7:])
+        }
+
+    def mask(self, filters: IncidentFilters):
+        """Boolean row mask for the dashboard filters (see filters.apply_filters)."""
+        mask = np.ones(self.size, dtype=bool)
+        if filters.date_from:
+            mask &= self.dates >= np.datetime64(filters.date_from, "D")
+        if filters.date_to:
+            mask &= self.dates <= np.datetime64(filters.date_to, "D")
+        for name in EQUALITY_FIELDS:
+            value = getattr(filters, name)
+            if value:
+                mask &= self.categorical[name].equals(value)
+        return mask
+
+    def _date_window(self, start: date, end: date | None = None):
+        window = self.dates >= np.datetime64(start, "D")
+        if end is not None:
+            window &= self.dates < np.datetime64(end, "D")
+        return window
+
+    def count_equal(self, mask, column: str, value: str) -> int:
+        return int((mask & self.categorical[column].equals(value)).sum())
+
+    def kpi_row(self, mask, current_month_start: date, prev_month_start: date) -> tuple:
+        """KPI aggregates in the same column order as the raw single-pass query."""
+        in_current_month = mask & self._date_window(current_month_start)
+        in_prev_month = mask & self._date_window(prev_month_start, current_month_start)
+        with_age = mask & self.has_age
+        age_count = int(with_age.sum())
+        return (
+            self.count_equal(mask, "incident_type", "INCIDENTE"),
+            self.count_equal(mask, "incident_type", "ACCIDENTE"),
+            int(self.lost_days[mask].sum()),
+            float(self.total_cost[mask].sum()),
+            float(self.ages[with_age].sum()) / age_count if age_count else 0.0,
+            self.count_equal(mask, "final_status", "EN PROCESO"),
+            int(in_current_month.sum()),
+            float(self.total_cost[in_current_month].sum()),
+            int(in_prev_month.sum()),
+            float(self.total_cost[in_prev_month].sum()),
+        )
+
+    def period_totals(self, mask, starts: list[date]) -> tuple[list[int], list[float]]:
+        """Incident count and cost per period (see periods.period_totals)."""
+        rows = mask & self.has_date & (self.dates >= np.datetime64(starts[0], "D"))
+        return period_totals(self.dates[rows], np.ones(int(rows.sum())), self.total_cost[rows], starts)
+
+    def group_count(self, mask, column: str) -> list[tuple[str, int]]:
+        """(value, count) for non-NULL values, most frequent first."""
+        categorical = self.categorical[column]
+        codes = categorical.codes[mask]
+        counts = np.bincount(codes[codes >= 0], minlength=len(categorical.categories))
+        order = np.argsort(-counts, kind="stable")
+        return [(categorical.categories[i], int(counts[i])) for i in order if counts[i]]
+
+    def group_cost(self, mask, column: str) -> list[tuple[str, int, float]]:
+        """(value, count, total cost) for non-NULL values, costliest first."""
+        categorical = self.categorical[column]
+        codes = categorical.codes[mask]
+        present = codes >= 0
+        size = len(categorical.categories)
+        counts = np.bincount(codes[present], minlength=size)
+        costs = np.bincount(codes[present], weights=self.total_cost[mask][present], minlength=size)
+        order = np.argsort(-costs, kind="stable")
+        return [
+            (categorical.categories[i], int(counts[i]), float(costs[i]))
+            for i in order if counts[i]
+        ]
+
+    def by_month(self, mask) -> list[tuple]:
+        """Rows of (year, month, total, incidents, accidents, cost), like the raw by_month query."""
+        rows = mask & self.has_date & self.has_year
+        keys = self.years[rows] * 13 + self.months[rows]
+        periods, inverse = np.unique(keys, return_inverse=True)
+        incident_type = self.categorical["incident_type"]
+        totals = np.bincount(inverse, minlength=len(periods))
+        incidents = np.bincount(
+            inverse, weights=incident_type.equals("INCIDENTE")[rows], minlength=len(periods)
+        )
+        accidents = np.bincount(
+            inverse, weights=incident_type.equals("ACCIDENTE")[rows], minlength=len(periods)
+        )
+        costs = np.bincount(inverse, weights=self.total_cost[rows], minlength=len(periods))
+        return [
+            (int(key // 13), int(key % 13), int(totals[i]), int(incidents[i]),
+             int(accidents[i]), float(costs[i]))
+            for i, key in enumerate(periods)
+        ]
+
+    def body_part_incidents(self, mask, max_per_part: int | None = None) -> list[tuple]:
+        """(body_part, id, name, date, incident_type, classifier) rows in id order,
+        optionally capped to the first max_per_part ids of each part."""
+        body_part = self.categorical["body_part"]
+        rows = np.flatnonzero(mask & (body_part.codes >= 0))
+        if max_per_part is not None:
+            grouped = rows[np.argsort(body_part.codes[rows], kind="stable")]
+            part_codes = body_part.codes[grouped]
+            rank = np.arange(len(grouped)) - np.searchsorted(part_codes, part_codes)
+            rows = np.sort(grouped[rank < max_per_part])
+
+        incident_type = self.categorical["incident_type"]
+        classifier = self.categorical["classifier"]
+        dates = self.dates[rows].tolist()
+        return [
+            (
+                body_part.categories[body_part.codes[i]],
+                int(self.ids[i]),
+                self.names[i],
+                dates[n],
+                incident_type.categories[incident_type.codes[i]] if incident_type.codes[i] >= 0 else None,
+                classifier.categories[classifier.codes[i]] if classifier.codes[i] >= 0 else None,
+            )
+            for n, i in enumerate(rows)
+        ]
+
+
+class ColumnarStore:
+    """Holds the current IncidentColumns snapshot, rebuilt when the dataset changes.
+
+    Uploads and deletes bump result_cache.dataset_version; the next dashboard
+    request after that reloads the snapshot once and swaps it in, while
+    requests already running keep using the old one.
+    """
+
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self.version: int | None = None
+        self._snapshot: IncidentColumns | None = None
+        self._lock = asyncio.Lock()
+
+    async def _load(self) -> IncidentColumns:
+        query = select(
+            Incident.id, Incident.name, Incident.date, Incident.year, Incident.age,
+            Incident.lost_days, Incident.total_cost,
+            *(getattr(Incident, name) for name in CATEGORICAL_COLUMNS),
+        ).order_by(Incident.id)
+        async with read_session() as db:
+            rows = (await db.execute(query)).all()
+        return IncidentColumns(rows)
+
+    async def get(self) -> IncidentColumns | None:
+        """The current snapshot, or None when the engine is disabled."""
+        if not self.enabled:
+            return None
+        if self.version != result_cache.dataset_version:
+            async with self._lock:
+                version = result_cache.dataset_version
+                if self.version != version:
+                    self._snapshot = await self._load()
+                    self.version = version
+        return self._snapshot
+
+
+columnar_store = ColumnarStore(enabled=settings.ANALYTICS_ENGINE == "columnar")
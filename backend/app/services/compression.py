@@ -0,0 +1,108 @@
+import gzip
+import io
+
+from starlette.datastructures import Headers, MutableHeaders
+
+# xlsx files are zip archives and Parquet pages are compressed by the writer;
+# gzipping them again costs CPU on every export and saves almost nothing.
+PRECOMPRESSED_CONTENT_TYPES = (
+    "application/vnd.openxmlformats",
+    "application/vnd.apache.parquet",
+)
+
+
+class GZipMiddleware:
+    """ASGI middleware gzipping responses for clients that accept it.
+
+    The decision is taken from the response's own start message, so it
+    only relies on the ASGI spec: responses that already set
+    Content-Encoding, precompressed content types and single-message bodies
+    under minimum_size are sent unchanged. Streamed bodies are compressed
+    chunk by chunk.
+    """
+
+    def __init__(self, app, minimum_size: int = 500, compresslevel: int = 9):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or "gzip" not in Headers(scope=scope).get("Accept-Encoding", ""):
+            await self.app(scope, receive, send)
+            return
+
+        responder = _GZipSend(send, self.minimum_size, self.compresslevel)
+        try:
+            await self.app(scope, receive, responder)
+        finally:
+            responder.close()
+
+
+class _GZipSend:
+    """send callable for one response, holding its compression state."""
+
+    def __init__(self, send, minimum_size: int, compresslevel: int):
+        self.send = send
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+        self.start: dict | None = None
+        self.passthrough = False
+        self.buffer = io.BytesIO()
+        self.gzip_file: gzip.GzipFile | None = None
+
+    async def __call__(self, message):
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.passthrough = "content-encoding" in headers or headers.get(
+                "content-type", ""
+            ).startswith(PRECOMPRESSED_CONTENT_TYPES)
+            if self.passthrough:
+                await self.send(message)
+            else:
+                # Held back until the first body chunk tells whether to compress.
+                self.start = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.gzip_file is None:
+            if not more_body and len(body) < self.minimum_size:
+                self.passthrough = True
+                await self.send(self.start)
+                await self.send(message)
+                return
+            # mtime=0 keeps the bytes identical for identical bodies, as the
+            # strong dashboard ETags promise.
+            self.gzip_file = gzip.GzipFile(
+                mode="wb", fileobj=self.buffer, compresslevel=self.compresslevel, mtime=0,
+            )
+            chunk = self._compress(body, more_body)
+            headers = MutableHeaders(raw=list(self.start["headers"]))
+            headers["Content-Encoding"] = "gzip"
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                if "content-length" in headers:
+                    del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(chunk))
+            await self.send({**self.start, "headers": headers.raw})
+        else:
+            chunk = self._compress(body, more_body)
+        await self.send({**message, "body": chunk})
+
+    def _compress(self, body: bytes, more_body: bool) -> bytes:
+        self.gzip_file.write(body)
+        if not more_body:
+            self.gzip_file.close()
+        chunk = self.buffer.getvalue()
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        return chunk
+
+    def close(self):
+        if self.gzip_file is not None:
+            self.gzip_file.close()
+        self.buffer.close()
@@ -1,6 +1,9 @@
 import re
+from collections.abc import Iterator
 from datetime import date, datetime
 from io import BytesIO
+from itertools import islice
+from typing import BinaryIO
 
 from openpyxl import load_workbook
 
@@ -94,60 +97,146 @@ def _parse_string(value) -> str | None:
     return s if s else None
 
 
+def _build_record(row: tuple, col_mapping: dict[int, str]) -> dict | None:
+    if not row or all(cell is None for cell in row):
+        return None
+
+    record = {}
+    for col_idx, field_name in col_mapping.items():
+        value = row[col_idx] if col_idx < len(row) else None
+
+        if field_name == "date":
+            record[field_name] = _parse_date(value)
+        elif field_name in NUMERIC_INT_FIELDS:
+            record[field_name] = _parse_int(value)
+        elif field_name in NUMERIC_FLOAT_FIELDS:
+            record[field_name] = _parse_float(value)
+        else:
+            record[field_name] = _parse_string(value)
+
+    if not record.get("name") and not record.get("rut") and not record.get("number"):
+        return None
+
+    for f in NUMERIC_FLOAT_FIELDS:
+        if f not in record:
+            record[f] = 0.0
+    for f in NUMERIC_INT_FIELDS:
+        if f not in record:
+            record[f] = None
+    if "lost_days" not in record or record["lost_days"] is None:
+        record["lost_days"] = 0
+
+    return record
+
+
+def iter_records(file: bytes | BinaryIO, filename: str) -> Iterator[dict]:
+    """Yield parsed records while the sheet is still being read.
+
+    Accepts the raw bytes or a binary file object, so callers can hand over
+    the upload's spooled file without reading it into memory first.
+    """
+    if isinstance(file, bytes):
+        file = BytesIO(file)
+    wb = load_workbook(file, read_only=True, data_only=True)
+
+    try:
+        target_sheet = "HOJA NUEVA FAYMEX"
+        if target_sheet in wb.sheetnames:
+            ws = wb[target_sheet]
+        else:
+            ws = wb.worksheets[0]
+
+        rows = ws.iter_rows(values_only=True)
+        raw_headers = next(rows, None)
+        if raw_headers is None:
+            return
+
+        col_mapping: dict[int, str] = {}
+        for idx, header in enumerate(raw_headers):
+            if header is None:
+                continue
+            normalized = _normalize_header(header)
+            if normalized in COLUMN_MAP:
+                col_mapping[idx] = COLUMN_MAP[normalized]
+
+        for row in rows:
+            record = _build_record(row, col_mapping)
+            if record is not None:
+                yield record
+    finally:
+        wb.close()
+
+
+def iter_record_batches(file: bytes | BinaryIO, filename: str, batch_size: int) -> Iterator[list[dict]]:
+    """Like iter_records, but yields lists of at most batch_size records."""
+    records = iter_records(file, filename)
+    while batch := list(islice(records, batch_size)):
+        yield batch
+
+
 def parse_excel(file_content: bytes, filename: str) -> list[dict]:
-    wb = load_workbook(BytesIO(file_content), read_only=True, data_only=True)
-
-    target_sheet = "HOJA NUEVA FAYMEX"
-    if target_sheet in wb.sheetnames:
-        ws = wb[target_sheet]
-    else:
-        ws = wb.worksheets[0]
-
-    rows = list(ws.iter_rows(values_only=True))
-    wb.close()
-
-    if not rows:
-        return []
-
-    raw_headers = rows[0]
-    col_mapping: dict[int, str] = {}
-    for idx, header in enumerate(raw_headers):
-        if header is None:
-            continue
-        normalized = _normalize_header(header)
-        if normalized in COLUMN_MAP:
-            col_mapping[idx] = COLUMN_MAP[normalized]
-
-    records = []
-    for row in rows[1:]:
-        if not row or all(cell is None for cell in row):
-            continue
-
-        record = {}
-        for col_idx, field_name in col_mapping.items():
-            value = row[col_idx] if col_idx < len(row) else None
-
-            if field_name == "date":
-                record[field_name] = _parse_date(value)
-            elif field_name in NUMERIC_INT_FIELDS:
-                record[field_name] = _parse_int(value)
-            elif field_name in NUMERIC_FLOAT_FIELDS:
-                record[field_name] = _parse_float(value)
-            else:
-                record[field_name] = _parse_string(value)
-
-        if not record.get("name") and not record.get("rut") and not record.get("number"):
-            continue
-
-        for f in NUMERIC_FLOAT_FIELDS:
-            if f not in record:
-                record[f] = 0.0
-        for f in NUMERIC_INT_FIELDS:
-            if f not in record:
-                record[f] = None
-        if "lost_days" not in record or record["lost_days"] is None:
-            record["lost_days"] = 0
-
-        records.append(record)
-
-    return records
+    return list(iter_records(file_content, filename))
+
+
+WORKED_HOURS_COLUMN_MAP = {
+    "centro de trabajo": "work_center",
+    "contrato": "contract",
+    "año": "period_year",
+    "mes": "period_month",
+    "horas trabajadas": "worked_hours",
+    "hh trabajadas": "worked_hours",
+    "hh": "worked_hours",
+    "dotación": "headcount",
+    "dotacion": "headcount",
+    "trabajadores": "headcount",
+}
+
+
+def parse_worked_hours(file: bytes | BinaryIO) -> list[dict]:
+    """Rows of the worked hours sheet: work center, contract, year, month, hours, headcount.
+
+    Rows without a work center or a valid year/month are skipped; repeated
+    work center/contract/month rows are added together.
+    """
+    if isinstance(file, bytes):
+        file = BytesIO(file)
+    wb = load_workbook(file, read_only=True, data_only=True)
+
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        raw_headers = next(rows, None)
+        if raw_headers is None:
+            return []
+
+        col_mapping: dict[int, str] = {}
+        for idx, header in enumerate(raw_headers):
+            normalized = _normalize_header(header)
+            if normalized in WORKED_HOURS_COLUMN_MAP:
+                col_mapping[idx] = WORKED_HOURS_COLUMN_MAP[normalized]
+
+        records: dict[tuple, dict] = {}
+        for row in rows:
+            values = {
+                field: row[idx] if idx < len(row) else None
+                for idx, field in col_mapping.items()
+            }
+            work_center = _parse_string(values.get("work_center"))
+            year = _parse_int(values.get("period_year"))
+            month = _parse_int(values.get("period_month"))
+            if not work_center or year is None or month is None or not 1 <= month <= 12:
+                continue
+
+            key = (work_center, _parse_string(values.get("contract")), year, month)
+            record = records.setdefault(key, {
+                "work_center": key[0],
+                "contract": key[1],
+                "period_year": year,
+                "period_month": month,
+                "worked_hours": 0.0,
+                "headcount": 0,
+            })
+            record["worked_hours"] += _parse_float(values.get("worked_hours"))
+            record["headcount"] += _parse_int(values.get("headcount")) or 0
+        return list(records.values())
+    finally:
+        wb.close()
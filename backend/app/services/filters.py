@@ -0,0 +1,116 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import cached_property
+
+from sqlalchemy import Date, String, bindparam
+
+from app.models import Incident
+
+EQUALITY_FIELDS = (
+    "work_center", "position", "incident_type", "classifier", "body_part",
+    "final_status", "contract",
+)
+
+# One condition per filter, each comparing against a named bound parameter,
+# so the SQL text only depends on which filters are set, not on their values.
+FILTER_CONDITIONS = {
+    "date_from": Incident.date >= bindparam("filter_date_from", type_=Date),
+    "date_to": Incident.date <= bindparam("filter_date_to", type_=Date),
+    **{
+        name: getattr(Incident, name) == bindparam(f"filter_{name}", type_=String)
+        for name in EQUALITY_FIELDS
+    },
+}
+
+
+def parse_date(value: str | None) -> date | None:
+    """YYYY-MM-DD to date; missing or malformed values mean "no bound"."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class IncidentFilters:
+    """The dashboard/export filter params, parsed once and hashable.
+
+    Dates are already parsed (invalid ones dropped) and empty strings are
+    None, so equal filter sets compare and hash equal.
+    """
+
+    date_from: date | None = None
+    date_to: date | None = None
+    work_center: str | None = None
+    position: str | None = None
+    incident_type: str | None = None
+    classifier: str | None = None
+    body_part: str | None = None
+    final_status: str | None = None
+    contract: str | None = None
+
+    @classmethod
+    def from_params(
+        cls,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        work_center: str | None = None,
+        position: str | None = None,
+        incident_type: str | None = None,
+        classifier: str | None = None,
+        body_part: str | None = None,
+        final_status: str | None = None,
+        contract: str | None = None,
+    ) -> "IncidentFilters":
+        return cls(
+            date_from=parse_date(date_from),
+            date_to=parse_date(date_to),
+            work_center=work_center or None,
+            position=position or None,
+            incident_type=incident_type or None,
+            classifier=classifier or None,
+            body_part=body_part or None,
+            final_status=final_status or None,
+            contract=contract or None,
+        )
+
+    @cached_property
+    def shape(self) -> tuple[str, ...]:
+        """Names of the filters that are set; decides the statement's SQL."""
+        return tuple(name for name in FILTER_CONDITIONS if getattr(self, name) is not None)
+
+    @cached_property
+    def params(self) -> dict:
+        """Bound parameter values for the conditions added by apply_filters."""
+        return {f"filter_{name}": getattr(self, name) for name in self.shape}
+
+
+def apply_filters(query, filters: IncidentFilters):
+    """Add the WHERE conditions of the active filters, as bound parameters.
+
+    Execute the result with filters.params (merged with any other params).
+    """
+    if not filters.shape:
+        return query
+    return query.where(*(FILTER_CONDITIONS[name] for name in filters.shape))
+
+
+_statements: dict[tuple[str, tuple[str, ...]], object] = {}
+
+
+def filtered_statement(name: str, filters: IncidentFilters, build: Callable):
+    """Statement template for a query name and filter shape, built once.
+
+    build(filters) must depend only on filters.shape, with every value
+    passed as a bound parameter. Reusing the same statement object skips
+    rebuilding the select tree per request and keeps the SQL text stable
+    for SQLAlchemy's compiled cache and asyncpg's prepared statements.
+    """
+    key = (name, filters.shape)
+    statement = _statements.get(key)
+    if statement is None:
+        statement = _statements[key] = build(filters)
+    return statement
@@ -0,0 +1,75 @@
+import hashlib
+import os
+import time
+from datetime import date
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from app.config import settings
+from app.services.cache import result_cache
+
+# dataset_version starts at 0 in every process, so tags also carry the
+# process they were issued by; a restart or another worker never answers
+# 304 to a tag it did not issue.
+_PROCESS_TAG = f"{os.getpid()}.{time.time_ns()}"
+
+# Routes on a DatasetETagRoute router whose response does not follow the dataset.
+UNVERSIONED_PATHS = {"/api/dashboard/cache-stats"}
+
+
+def dataset_etag(request: Request) -> str:
+    """Strong ETag for a dashboard GET.
+
+    The body only depends on the dataset version, the query string and the
+    current day (KPI and trend month windows), plus whether it will be
+    gzipped, so equal inputs always mean identical bytes.
+    """
+    gzip = "gzip" in request.headers.get("accept-encoding", "")
+    source = "|".join((
+        _PROCESS_TAG,
+        str(result_cache.dataset_version),
+        date.today().isoformat(),
+        request.url.path,
+        request.url.query,
+        "gzip" if gzip else "identity",
+    ))
+    return '"' + hashlib.sha1(source.encode()).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+class DatasetETagRoute(APIRoute):
+    """Route class adding ETag revalidation to dataset-derived GET routes.
+
+    A matching If-None-Match is answered with 304 before the endpoint runs,
+    so a reload of an unchanged dashboard costs no queries and no body.
+    Cache-Control: no-cache lets browsers keep the body but revalidate it
+    on every use, which is what picks up a new upload immediately.
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+        if not settings.HTTP_ETAGS_ENABLED or self.path in UNVERSIONED_PATHS:
+            return handler
+
+        async def conditional_handler(request: Request) -> Response:
+            if request.method not in ("GET", "HEAD"):
+                return await handler(request)
+
+            etag = dataset_etag(request)
+            headers = {"ETag": etag, "Cache-Control": "no-cache"}
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers=headers)
+
+            response = await handler(request)
+            if response.status_code == 200:
+                response.headers.update(headers)
+            return response
+
+        return conditional_handler
@@ -0,0 +1,163 @@
+from calendar import monthrange
+from collections import defaultdict
+from datetime import date
+
+from sqlalchemy import and_, delete, func, insert, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import MonthlyIndicator, MonthlyRollup, WorkedHours
+from app.services.filters import IncidentFilters
+
+I = MonthlyIndicator
+R = MonthlyRollup
+W = WorkedHours
+
+ACCIDENT_TYPE = "ACCIDENTE"
+
+# Frequency and severity rates are per million hours worked, the accident
+# rate per 100 workers.
+HOURS_BASE = 1_000_000
+WORKERS_BASE = 100
+
+INDICATOR_COLUMNS = [
+    "period_year", "period_month", "work_center", "contract",
+    "worked_hours", "headcount", "accidents", "lost_days",
+]
+
+
+def _month_key(model):
+    return model.period_year * 100 + model.period_month
+
+
+def _month_keys(months) -> list[int]:
+    return sorted(year * 100 + month for year, month in months)
+
+
+def _same_centers(work_centers: set[tuple[str, str | None]]):
+    """Rows of any of the (work_center, contract) pairs; a None contract matches NULL."""
+    without_contract = sorted(wc for wc, contract in work_centers if contract is None)
+    with_contract = sorted(pair for pair in work_centers if pair[1] is not None)
+    conditions = []
+    if without_contract:
+        conditions.append(and_(W.contract.is_(None), W.work_center.in_(without_contract)))
+    if with_contract:
+        conditions.append(tuple_(W.work_center, W.contract).in_(with_contract))
+    return or_(*conditions)
+
+
+async def replace_worked_hours(db: AsyncSession, records: list[dict]) -> set[tuple[int, int]]:
+    """Replace the worked hours of every work center/contract/month in records.
+
+    Rows of other work centers or contracts in the same months are kept, so
+    a file with one site's hours does not erase the rest.
+    Returns the (year, month) pairs whose indicators need a refresh.
+    """
+    by_month: dict[tuple[int, int], set[tuple[str, str | None]]] = defaultdict(set)
+    for r in records:
+        by_month[(r["period_year"], r["period_month"])].add((r["work_center"], r["contract"]))
+    for (year, month), work_centers in by_month.items():
+        await db.execute(delete(WorkedHours).where(
+            W.period_year == year, W.period_month == month, _same_centers(work_centers),
+        ))
+    if records:
+        await db.execute(insert(WorkedHours), records)
+    return set(by_month)
+
+
+def _accidents_by_month(keys: list[int]):
+    return (
+        select(
+            R.period_year, R.period_month, R.work_center, R.contract,
+            func.sum(R.incident_count).label("accidents"),
+            func.sum(R.lost_days).label("lost_days"),
+        )
+        .where(R.incident_type == ACCIDENT_TYPE, _month_key(R).in_(keys))
+        .group_by(R.period_year, R.period_month, R.work_center, R.contract)
+        .subquery()
+    )
+
+
+async def refresh_indicators(db: AsyncSession, months: set[tuple[int, int]]):
+    """Rebuild the indicator rows of the given (year, month) pairs.
+
+    Each worked hours row is matched with the accidents of the same work
+    center, contract and month in the rollup; accidents of a work
+    center/contract without worked hours for that month have no rate and
+    are left out.
+    """
+    if not months:
+        return
+    keys = _month_keys(months)
+    await db.execute(delete(MonthlyIndicator).where(_month_key(I).in_(keys)))
+
+    acc = _accidents_by_month(keys)
+    source = (
+        select(
+            W.period_year, W.period_month, W.work_center, W.contract,
+            W.worked_hours, W.headcount,
+            func.coalesce(acc.c.accidents, 0),
+            func.coalesce(acc.c.lost_days, 0),
+        )
+        .select_from(W)
+        .outerjoin(acc, and_(
+            acc.c.period_year == W.period_year,
+            acc.c.period_month == W.period_month,
+            acc.c.work_center == W.work_center,
+            acc.c.contract.is_not_distinct_from(W.contract),
+        ))
+        .where(_month_key(W).in_(keys))
+    )
+    await db.execute(insert(MonthlyIndicator).from_select(INDICATOR_COLUMNS, source))
+
+
+def safety_rates(worked_hours: float, headcount: float, accidents: int, lost_days: int) -> dict:
+    """Frequency, severity and accident rates; 0 when there is no exposure."""
+    per_hours = HOURS_BASE / worked_hours if worked_hours else 0.0
+    return {
+        "frequency_rate": round(accidents * per_hours, 2),
+        "severity_rate": round(lost_days * per_hours, 2),
+        "accident_rate": round(accidents * WORKERS_BASE / headcount, 2) if headcount else 0.0,
+    }
+
+
+def indicator_period(filters: IncidentFilters) -> tuple[date | None, date | None]:
+    """The dates the indicators actually cover for the filters.
+
+    Worked hours are only known per month, so date_from is moved back to
+    the first day of its month and date_to forward to the last day of its
+    month.
+    """
+    start = filters.date_from.replace(day=1) if filters.date_from else None
+    end = None
+    if filters.date_to:
+        d = filters.date_to
+        end = d.replace(day=monthrange(d.year, d.month)[1])
+    return start, end
+
+
+def _apply_indicator_filters(query, filters: IncidentFilters):
+    start, end = indicator_period(filters)
+    if start:
+        query = query.where(_month_key(I) >= start.year * 100 + start.month)
+    if end:
+        query = query.where(_month_key(I) <= end.year * 100 + end.month)
+    if filters.work_center:
+        query = query.where(I.work_center == filters.work_center)
+    if filters.contract:
+        query = query.where(I.contract == filters.contract)
+    return query
+
+
+async def indicator_months(db: AsyncSession, filters: IncidentFilters) -> list:
+    """Rows of (year, month, worked_hours, headcount, accidents, lost_days), by month."""
+    q = select(
+        I.period_year,
+        I.period_month,
+        func.sum(I.worked_hours),
+        func.sum(I.headcount),
+        func.sum(I.accidents),
+        func.sum(I.lost_days),
+    )
+    q = _apply_indicator_filters(q, filters)
+    q = q.group_by(I.period_year, I.period_month).order_by(I.period_year, I.period_month)
+    return (await db.execute(q)).all()
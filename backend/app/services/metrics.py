@@ -0,0 +1,233 @@
+import logging
+import time
+from bisect import bisect_left
+from collections.abc import Callable
+from contextvars import ContextVar
+
+from sqlalchemy import event
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds, shared by request and query histograms.
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# ASGI scope of the request being served; SQL hooks read it to tag
+# statements with their calling route.
+_current_scope: ContextVar[dict | None] = ContextVar("current_scope", default=None)
+_route_paths: dict = {}
+
+
+def _route_label(scope: dict | None) -> str:
+    """Route template ("/api/uploads/{upload_id}") rather than the raw path,
+    to keep label cardinality bounded."""
+    if scope is None:
+        return "background"
+    endpoint = scope.get("endpoint")
+    if endpoint is None:
+        return "unmatched"
+    path = _route_paths.get(endpoint)
+    if path is None:
+        for route in scope["router"].routes:
+            if getattr(route, "endpoint", None) is endpoint:
+                path = _route_paths[endpoint] = route.path
+                break
+        else:
+            return "unmatched"
+    return path
+
+
+class Histogram:
+    __slots__ = ("buckets", "sum", "count")
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.buckets[bisect_left(BUCKETS, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+class Metrics:
+    """Request and query timings, kept in process and rendered for Prometheus.
+
+    Everything is updated from the event loop thread (the async engines run
+    their SQLAlchemy hooks there too), so plain dicts need no locking.
+    """
+
+    def __init__(self, enabled: bool, slow_query_seconds: float):
+        self.enabled = enabled
+        self.slow_query_seconds = slow_query_seconds
+        self.requests: dict[tuple[str, str], Histogram] = {}
+        self.responses: dict[tuple[str, str, int], int] = {}
+        self.queries: dict[tuple[str, str], Histogram] = {}
+        self.rows_affected: dict[tuple[str, str], int] = {}
+        self.rows_fetched: dict[str, int] = {}
+        self.slow_queries = 0
+        self._collectors: list[tuple[str, str, str, Callable[[], float]]] = []
+
+    def register(self, name: str, kind: str, help_text: str, read: Callable[[], float]):
+        """Publish a value owned elsewhere (a gauge or counter), read at render time."""
+        self._collectors.append((name, kind, help_text, read))
+
+    def observe_request(self, method: str, route: str, status: int, seconds: float):
+        key = (method, route)
+        histogram = self.requests.get(key)
+        if histogram is None:
+            histogram = self.requests[key] = Histogram()
+        histogram.observe(seconds)
+        status_key = (method, route, status)
+        self.responses[status_key] = self.responses.get(status_key, 0) + 1
+
+    def observe_query(self, statement: str, seconds: float, rows_affected: int | None):
+        route = _route_label(_current_scope.get())
+        operation = statement.lstrip().split(None, 1)[0].lower() if statement.strip() else "other"
+        key = (route, operation)
+        histogram = self.queries.get(key)
+        if histogram is None:
+            histogram = self.queries[key] = Histogram()
+        histogram.observe(seconds)
+        if rows_affected is not None:
+            self.rows_affected[key] = self.rows_affected.get(key, 0) + rows_affected
+
+        if seconds >= self.slow_query_seconds:
+            self.slow_queries += 1
+            logger.warning(
+                "Slow query (%.1f ms) from %s: %s",
+                seconds * 1000, route, " ".join(statement.split())[:1000],
+            )
+
+    def observe_rows_fetched(self, rows: int):
+        """Count rows read by the current route.
+
+        Result rows are not visible from the statement hooks (streamed
+        results are fetched after execute returns), so the code consuming
+        them reports how many it read.
+        """
+        if not self.enabled:
+            return
+        route = _route_label(_current_scope.get())
+        self.rows_fetched[route] = self.rows_fetched.get(route, 0) + rows
+
+    def _render_histogram(self, lines: list[str], name: str, help_text: str, series: dict, label_names):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for key, histogram in sorted(series.items()):
+            labels = _labels(**dict(zip(label_names, key)))
+            cumulative = 0
+            for bound, count in zip((*BUCKETS, "+Inf"), histogram.buckets):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines: list[str] = []
+        self._render_histogram(
+            lines, "http_request_duration_seconds", "Request latency by route.",
+            self.requests, ("method", "route"),
+        )
+        lines.append("# HELP http_responses_total Responses by route and status code.")
+        lines.append("# TYPE http_responses_total counter")
+        for (method, route, status), count in sorted(self.responses.items()):
+            lines.append(f"http_responses_total{{{_labels(method=method, route=route, status=status)}}} {count}")
+
+        self._render_histogram(
+            lines, "db_query_duration_seconds", "SQL statement latency by calling route.",
+            self.queries, ("route", "operation"),
+        )
+        lines.append("# HELP db_rows_affected_total Rows written by INSERT/UPDATE/DELETE, by calling route.")
+        lines.append("# TYPE db_rows_affected_total counter")
+        for (route, operation), rows in sorted(self.rows_affected.items()):
+            lines.append(f"db_rows_affected_total{{{_labels(route=route, operation=operation)}}} {rows}")
+        lines.append("# HELP db_rows_fetched_total Rows read by streamed exports, by route.")
+        lines.append("# TYPE db_rows_fetched_total counter")
+        for route, rows in sorted(self.rows_fetched.items()):
+            lines.append(f"db_rows_fetched_total{{{_labels(route=route)}}} {rows}")
+
+        lines.append("# HELP db_slow_queries_total Statements slower than SLOW_QUERY_MS.")
+        lines.append("# TYPE db_slow_queries_total counter")
+        lines.append(f"db_slow_queries_total {self.slow_queries}")
+
+        for name, kind, help_text, read in self._collectors:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"{name} {read()}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics(
+    enabled=settings.METRICS_ENABLED,
+    slow_query_seconds=settings.SLOW_QUERY_MS / 1000,
+)
+
+
+def _rows_affected(cursor) -> int | None:
+    # DB-API rowcount, for statements without a result set; -1 when the
+    # driver cannot tell (asyncpg executemany, COPY).
+    if cursor.description is not None or cursor.rowcount < 0:
+        return None
+    return cursor.rowcount
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started_at = conn.info["query_started_at"].pop()
+    metrics.observe_query(statement, time.perf_counter() - started_at, _rows_affected(cursor))
+
+
+def instrument_engine(async_engine):
+    """Time every statement run through an async engine."""
+    if metrics.enabled:
+        event.listen(async_engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(async_engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency and status per route template.
+
+    Pure ASGI rather than BaseHTTPMiddleware, so it adds no extra task or
+    body buffering to each request.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not metrics.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started_at = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        token = _current_scope.set(scope)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            metrics.observe_request(
+                scope["method"], _route_label(scope), status, time.perf_counter() - started_at
+            )
+            _current_scope.reset(token)
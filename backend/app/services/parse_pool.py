@@ -0,0 +1,182 @@
+import asyncio
+import multiprocessing
+import os
+import pickle
+import shutil
+import tempfile
+from collections.abc import Iterator
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import BinaryIO
+
+from app.config import settings
+from app.services.excel_parser import iter_record_batches
+from app.services.metrics import metrics
+
+
+def _parse_to_spool(source_path: str, filename: str, batch_size: int) -> tuple[str, int]:
+    """Parse a workbook into a temp file of pickled record batches.
+
+    Runs inside the executor. Batches are written as they are parsed, so
+    neither the worker nor the API process ever holds the whole sheet.
+    """
+    fd, spool_path = tempfile.mkstemp(suffix=".batches")
+    count = 0
+    try:
+        with os.fdopen(fd, "wb") as spool, open(source_path, "rb") as source:
+            for batch in iter_record_batches(source, filename, batch_size):
+                pickle.dump(batch, spool, protocol=pickle.HIGHEST_PROTOCOL)
+                count += len(batch)
+    except BaseException:
+        os.remove(spool_path)
+        raise
+    return spool_path, count
+
+
+async def spool_upload(file: BinaryIO, filename: str) -> str:
+    """Copy an uploaded file to a temp path the executor can open."""
+    fd, source_path = tempfile.mkstemp(suffix=os.path.splitext(filename)[1])
+    with os.fdopen(fd, "wb") as source:
+        await asyncio.get_running_loop().run_in_executor(None, shutil.copyfileobj, file, source)
+    return source_path
+
+
+class ParsedBatches:
+    """Record batches produced by the parse pool, read back one at a time."""
+
+    def __init__(self, spool_path: str, count: int):
+        self.spool_path = spool_path
+        self.count = count
+
+    def __iter__(self) -> Iterator[list[dict]]:
+        with open(self.spool_path, "rb") as spool:
+            while True:
+                try:
+                    yield pickle.load(spool)
+                except EOFError:
+                    return
+
+    def close(self):
+        if os.path.exists(self.spool_path):
+            os.remove(self.spool_path)
+
+
+class ParsePool:
+    """Runs Excel parsing off the event loop with a bounded number of slots.
+
+    Uses a ProcessPoolExecutor by default and falls back to threads when
+    PARSE_EXECUTOR is "thread" or a process pool cannot be started.
+    """
+
+    def __init__(self, mode: str, max_workers: int, max_concurrency: int):
+        self.mode = mode
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+        self._executor: Executor | None = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.mode == "process":
+                try:
+                    # spawn: forking a process that runs an event loop and
+                    # DB connection threads is unsafe.
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                except (OSError, NotImplementedError):
+                    self.mode = "thread"
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="excel-parse"
+                )
+        return self._executor
+
+    @property
+    def queue_depth(self) -> int:
+        return self.queued
+
+    @asynccontextmanager
+    async def _slot(self):
+        self.queued += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.queued -= 1
+        self.running += 1
+        try:
+            yield
+        finally:
+            self.running -= 1
+            self._semaphore.release()
+
+    async def parse_path(self, source_path: str, filename: str, batch_size: int) -> ParsedBatches:
+        loop = asyncio.get_running_loop()
+        async with self._slot():
+            try:
+                spool_path, count = await loop.run_in_executor(
+                    self._get_executor(), _parse_to_spool, source_path, filename, batch_size
+                )
+            except BrokenExecutor:
+                # A crashed worker poisons the whole pool; start a fresh one
+                # for the next upload.
+                self.failed += 1
+                self.shutdown()
+                raise
+            except Exception:
+                self.failed += 1
+                raise
+            self.completed += 1
+        return ParsedBatches(spool_path, count)
+
+    async def parse(self, file: BinaryIO, filename: str, batch_size: int) -> ParsedBatches:
+        source_path = await spool_upload(file, filename)
+        try:
+            return await self.parse_path(source_path, filename, batch_size)
+        finally:
+            os.remove(source_path)
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "max_workers": self.max_workers,
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": self.queued,
+            "running": self.running,
+            "completed": self.completed,
+            "failed": self.failed,
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+parse_pool = ParsePool(
+    mode=settings.PARSE_EXECUTOR,
+    max_workers=settings.PARSE_WORKERS,
+    max_concurrency=settings.PARSE_MAX_CONCURRENCY,
+)
+
+metrics.register(
+    "upload_parse_queue_depth", "gauge",
+    "Uploads waiting for a parse slot.", lambda: parse_pool.queued,
+)
+metrics.register(
+    "upload_parse_running", "gauge",
+    "Workbooks being parsed.", lambda: parse_pool.running,
+)
+metrics.register(
+    "upload_parse_completed_total", "counter",
+    "Workbooks parsed successfully.", lambda: parse_pool.completed,
+)
+metrics.register(
+    "upload_parse_failed_total", "counter",
+    "Workbooks that failed to parse.", lambda: parse_pool.failed,
+)
@@ -0,0 +1,132 @@
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Literal
+
+import numpy as np
+
+PeriodKind = Literal["week", "month", "quarter", "rolling"]
+Comparison = Literal["previous", "year_over_year"]
+
+# Periods per year, i.e. how far back the same period of last year is.
+# A 52-week lag keeps weekdays aligned.
+PERIODS_PER_YEAR = {"week": 52, "month": 12, "quarter": 4}
+
+# Alert thresholds, applied to every period of the series.
+INCIDENT_INCREASE_PERCENT = 20
+COST_INCREASE_FACTOR = 1.5
+
+
+def _add_months(d: date, months: int) -> date:
+    index = d.year * 12 + d.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+@dataclass(frozen=True)
+class TrendPeriods:
+    """A trend series: the last `count` periods of a kind, the current one
+    included, each compared with the period `lag` places before it."""
+
+    kind: PeriodKind = "month"
+    days: int = 30
+    compare: Comparison = "previous"
+    count: int = 12
+
+    @property
+    def lag(self) -> int:
+        if self.compare == "previous":
+            return 1
+        if self.kind == "rolling":
+            # The run of windows that ends closest to one year back.
+            return max(1, round(365 / self.days))
+        return PERIODS_PER_YEAR[self.kind]
+
+    def current_start(self, today: date) -> date:
+        if self.kind == "week":
+            return today - timedelta(days=today.weekday())
+        if self.kind == "month":
+            return today.replace(day=1)
+        if self.kind == "quarter":
+            return today.replace(month=(today.month - 1) // 3 * 3 + 1, day=1)
+        return today - timedelta(days=self.days - 1)
+
+    def shift(self, start: date, periods: int) -> date:
+        """Start of the period `periods` away from the one starting at start."""
+        if self.kind == "week":
+            return start + timedelta(weeks=periods)
+        if self.kind == "month":
+            return _add_months(start, periods)
+        if self.kind == "quarter":
+            return _add_months(start, 3 * periods)
+        return start + timedelta(days=self.days * periods)
+
+    def starts(self, today: date) -> list[date]:
+        """Period starts, oldest first: the `count` reported periods plus the
+        `lag` earlier ones the first of them are compared with."""
+        current = self.current_start(today)
+        return [self.shift(current, -n) for n in reversed(range(self.count + self.lag))]
+
+    def labels(self) -> tuple[str, str, str]:
+        """Alert wording: (this period, the comparison period, and the
+        comparison period after "respecto")."""
+        if self.kind == "rolling":
+            current = f"últimos {self.days} días"
+            if self.compare == "previous":
+                return current, f"{self.days} días anteriores", f"a los {self.days} días anteriores"
+            return current, f"mismos {self.days} días del año anterior", f"a los mismos {self.days} días del año anterior"
+
+        noun, this, article, same = {
+            "week": ("semana", "esta", "a la", "misma"),
+            "month": ("mes", "este", "al", "mismo"),
+            "quarter": ("trimestre", "este", "al", "mismo"),
+        }[self.kind]
+        if self.compare == "previous":
+            previous = f"{noun} anterior"
+        else:
+            previous = f"{same} {noun} del año anterior"
+        return f"{this} {noun}", previous, f"{article} {previous}"
+
+
+def period_totals(dates, counts, costs, starts: list[date]) -> tuple[list[int], list[float]]:
+    """Sum dated counts and costs (per row or per day, any order) into the
+    periods starting at `starts`: oldest first, the last one open-ended.
+    Dates before the first start are ignored."""
+    bounds = np.array(starts, dtype="datetime64[D]")
+    periods = np.searchsorted(bounds, np.asarray(dates, dtype="datetime64[D]"), side="right") - 1
+    keep = periods >= 0
+    period_counts = np.bincount(
+        periods[keep], weights=np.asarray(counts, dtype=np.float64)[keep], minlength=len(starts)
+    )
+    period_costs = np.bincount(
+        periods[keep], weights=np.asarray(costs, dtype=np.float64)[keep], minlength=len(starts)
+    )
+    return [int(count) for count in period_counts], period_costs.tolist()
+
+
+def _percent_change(current: np.ndarray, previous: np.ndarray) -> list[float]:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = np.where(
+            previous > 0,
+            (current - previous) / previous * 100,
+            np.where(current > 0, 100.0, 0.0),
+        )
+    return [round(float(value), 1) for value in change]
+
+
+def compare_periods(counts: list[int], costs: list[float], lag: int) -> dict[str, list]:
+    """Period-over-period deltas and alert flags for every period that has
+    a comparison period, i.e. all but the first `lag`."""
+    counts = np.asarray(counts, dtype=np.int64)
+    costs = np.asarray(costs, dtype=np.float64)
+    current_counts, previous_counts = counts[lag:], counts[:-lag]
+    current_costs, previous_costs = costs[lag:], costs[:-lag]
+
+    incident_change = _percent_change(current_counts, previous_counts)
+    cost_change = _percent_change(current_costs, previous_costs)
+    incident_alert = np.asarray(incident_change) > INCIDENT_INCREASE_PERCENT
+    cost_alert = (previous_costs > 0) & (current_costs > previous_costs * COST_INCREASE_FACTOR)
+    return {
+        "incident_change": incident_change,
+        "cost_change": cost_change,
+        "incident_alert": incident_alert.tolist(),
+        "cost_alert": cost_alert.tolist(),
+    }
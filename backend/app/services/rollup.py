@@ -0,0 +1,183 @@
+from calendar import monthrange
+from datetime import date
+
+from sqlalchemy import case, delete, extract, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import async_session
+from app.models import Incident, MonthlyRollup
+from app.services.filters import IncidentFilters
+
+R = MonthlyRollup
+
+ROLLUP_DIMENSIONS = ("work_center", "contract", "incident_type", "classifier", "final_status")
+
+ROLLUP_COLUMNS = [
+    "upload_id", "year", "period_year", "period_month", *ROLLUP_DIMENSIONS,
+    "incident_count", "lost_days", "total_cost", "age_sum", "age_count",
+]
+
+
+def _rollup_source():
+    period_year = extract("year", Incident.date)
+    period_month = extract("month", Incident.date)
+    group_columns = [
+        Incident.upload_id, Incident.year, period_year, period_month,
+        *(getattr(Incident, dim) for dim in ROLLUP_DIMENSIONS),
+    ]
+    return select(
+        *group_columns,
+        func.count(),
+        func.coalesce(func.sum(Incident.lost_days), 0),
+        func.coalesce(func.sum(Incident.total_cost), 0.0),
+        func.coalesce(func.sum(Incident.age), 0),
+        func.count(Incident.age),
+    ).group_by(*group_columns)
+
+
+async def _upload_months(db: AsyncSession, upload_ids: list[int]) -> set[tuple[int, int]]:
+    q = (
+        select(R.period_year, R.period_month)
+        .where(R.upload_id.in_(upload_ids), R.period_year.isnot(None))
+        .distinct()
+    )
+    return {(int(year), int(month)) for year, month in (await db.execute(q)).all()}
+
+
+async def refresh_rollup(db: AsyncSession, upload_ids: list[int]) -> set[tuple[int, int]]:
+    """Recompute the rollup rows of the given uploads from their incidents.
+
+    Returns the (year, month) pairs whose rollup rows may have changed.
+    """
+    months = await _upload_months(db, upload_ids)
+    await db.execute(delete(MonthlyRollup).where(MonthlyRollup.upload_id.in_(upload_ids)))
+    source = _rollup_source().where(Incident.upload_id.in_(upload_ids))
+    await db.execute(insert(MonthlyRollup).from_select(ROLLUP_COLUMNS, source))
+    return months | await _upload_months(db, upload_ids)
+
+
+async def remove_rollup(db: AsyncSession, upload_id: int) -> set[tuple[int, int]]:
+    """Drop an upload's rollup rows and return the (year, month) pairs they covered."""
+    months = await _upload_months(db, [upload_id])
+    await db.execute(delete(MonthlyRollup).where(MonthlyRollup.upload_id == upload_id))
+    return months
+
+
+async def backfill_rollup():
+    """Build the rollup for databases that had incidents before it existed."""
+    async with async_session() as db:
+        has_rollup = await db.scalar(select(MonthlyRollup.id).limit(1))
+        has_incidents = await db.scalar(select(Incident.id).limit(1))
+        if has_rollup is None and has_incidents is not None:
+            await db.execute(insert(MonthlyRollup).from_select(ROLLUP_COLUMNS, _rollup_source()))
+            await db.commit()
+
+
+def rollup_fits(filters: IncidentFilters) -> bool:
+    """Whether a filter set can be answered from the rollup.
+
+    position and body_part are not rollup dimensions, and date bounds must
+    fall on month boundaries.
+    """
+    if not settings.ROLLUP_ENABLED:
+        return False
+    if filters.position or filters.body_part:
+        return False
+    if filters.date_from and filters.date_from.day != 1:
+        return False
+    if filters.date_to and filters.date_to.day != monthrange(filters.date_to.year, filters.date_to.month)[1]:
+        return False
+    return True
+
+
+def _period_from(d: date):
+    return (R.period_year > d.year) | ((R.period_year == d.year) & (R.period_month >= d.month))
+
+
+def _in_period(d: date):
+    return (R.period_year == d.year) & (R.period_month == d.month)
+
+
+def _apply_rollup_filters(query, filters: IncidentFilters):
+    if filters.date_from:
+        query = query.where(_period_from(filters.date_from))
+
+    date_to = filters.date_to
+    if date_to:
+        query = query.where(
+            (R.period_year < date_to.year)
+            | ((R.period_year == date_to.year) & (R.period_month <= date_to.month))
+        )
+
+    for dim in ROLLUP_DIMENSIONS:
+        value = getattr(filters, dim)
+        if value:
+            query = query.where(getattr(R, dim) == value)
+
+    return query
+
+
+def _sum_where(condition, column):
+    return func.coalesce(func.sum(case((condition, column), else_=0)), 0)
+
+
+async def rollup_kpi_row(
+    db: AsyncSession, filters: IncidentFilters, current_month_start: date, prev_month_start: date
+) -> tuple:
+    """KPI aggregates in the same column order as the raw single-pass query."""
+    in_current_month = _period_from(current_month_start)
+    in_prev_month = _in_period(prev_month_start)
+    q = select(
+        _sum_where(R.incident_type == "INCIDENTE", R.incident_count),
+        _sum_where(R.incident_type == "ACCIDENTE", R.incident_count),
+        func.coalesce(func.sum(R.lost_days), 0),
+        func.coalesce(func.sum(R.total_cost), 0.0),
+        func.coalesce(func.sum(R.age_sum), 0),
+        func.coalesce(func.sum(R.age_count), 0),
+        _sum_where(R.final_status == "EN PROCESO", R.incident_count),
+        _sum_where(in_current_month, R.incident_count),
+        _sum_where(in_current_month, R.total_cost),
+        _sum_where(in_prev_month, R.incident_count),
+        _sum_where(in_prev_month, R.total_cost),
+    )
+    q = _apply_rollup_filters(q, filters)
+    row = (await db.execute(q)).one()
+    age_sum, age_count = row[4], row[5]
+    avg_age = age_sum / age_count if age_count else 0.0
+    return (*row[:4], avg_age, *row[6:])
+
+
+async def rollup_month_totals(db: AsyncSession, filters: IncidentFilters, since: date) -> list:
+    """Rows of (first day of month, count, cost) from the month of `since` on."""
+    q = select(
+        R.period_year,
+        R.period_month,
+        func.sum(R.incident_count),
+        func.coalesce(func.sum(R.total_cost), 0.0),
+    )
+    q = _apply_rollup_filters(q, filters).where(_period_from(since))
+    q = q.group_by(R.period_year, R.period_month)
+    rows = (await db.execute(q)).all()
+    return [(date(int(year), int(month), 1), count, cost) for year, month, count, cost in rows]
+
+
+async def rollup_count(db: AsyncSession, filters: IncidentFilters) -> int:
+    q = _apply_rollup_filters(select(func.coalesce(func.sum(R.incident_count), 0)), filters)
+    return (await db.execute(q)).scalar() or 0
+
+
+async def rollup_by_month(db: AsyncSession, filters: IncidentFilters) -> list:
+    """Rows of (year, month, total, incidents, accidents, cost), like the raw by_month query."""
+    q = select(
+        R.year,
+        R.period_month,
+        func.sum(R.incident_count),
+        _sum_where(R.incident_type == "INCIDENTE", R.incident_count),
+        _sum_where(R.incident_type == "ACCIDENTE", R.incident_count),
+        func.coalesce(func.sum(R.total_cost), 0.0),
+    )
+    q = _apply_rollup_filters(q, filters)
+    q = q.where(R.period_year.isnot(None), R.year.isnot(None))
+    q = q.group_by(R.year, R.period_month).order_by(R.year, R.period_month)
+    return (await db.execute(q)).all()
@@ -0,0 +1,116 @@
+import re
+
+from sqlalchemy import column, false, func, literal_column, or_, select, table, text
+
+from app.models import Incident
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_RUT_RE = re.compile(r"^[\d.\-\s]+[kK]?$")
+
+_fts_table = table("incidents_fts", column("rowid"))
+
+SQLITE_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS incidents_fts USING fts5("
+    "name, observation, content='incidents', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS incidents_fts_ai AFTER INSERT ON incidents BEGIN "
+    "INSERT INTO incidents_fts(rowid, name, observation) "
+    "VALUES (new.id, new.name, new.observation); END",
+    "CREATE TRIGGER IF NOT EXISTS incidents_fts_ad AFTER DELETE ON incidents BEGIN "
+    "INSERT INTO incidents_fts(incidents_fts, rowid, name, observation) "
+    "VALUES ('delete', old.id, old.name, old.observation); END",
+    "CREATE TRIGGER IF NOT EXISTS incidents_fts_au AFTER UPDATE OF name, observation ON incidents BEGIN "
+    "INSERT INTO incidents_fts(incidents_fts, rowid, name, observation) "
+    "VALUES ('delete', old.id, old.name, old.observation); "
+    "INSERT INTO incidents_fts(rowid, name, observation) "
+    "VALUES (new.id, new.name, new.observation); END",
+]
+
+# Accents are folded on both backends, as remove_diacritics does on SQLite,
+# so "jose" finds "José" everywhere. unaccent() is only STABLE; generated
+# columns need an IMMUTABLE function, hence the wrapper with the dictionary
+# pinned.
+POSTGRES_UNACCENT_FUNCTION = "incidents_search_unaccent"
+
+POSTGRES_FTS_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    f"CREATE OR REPLACE FUNCTION {POSTGRES_UNACCENT_FUNCTION}(value text) RETURNS text "
+    "LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT "
+    "AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, value) $$",
+    "ALTER TABLE incidents ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    f"GENERATED ALWAYS AS (to_tsvector('simple', {POSTGRES_UNACCENT_FUNCTION}("
+    "coalesce(name, '') || ' ' || coalesce(observation, '')))) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_incidents_search_vector ON incidents USING GIN (search_vector)",
+]
+
+
+def normalize_rut(value: str | None) -> str | None:
+    """RUT without dots, dashes or spaces, upper-cased (12.345.678-k -> 12345678K)."""
+    if not value:
+        return None
+    normalized = value.replace(".", "").replace("-", "").replace(" ", "").upper()
+    return normalized or None
+
+
+def create_search_index(conn):
+    """Create the full-text index: FTS5 + sync triggers on SQLite, a generated
+    tsvector column + GIN index on PostgreSQL. Idempotent."""
+    if conn.dialect.name == "sqlite":
+        exists = conn.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'incidents_fts'"
+        )).fetchone()
+        for statement in SQLITE_FTS_DDL:
+            conn.execute(text(statement))
+        if not exists:
+            conn.execute(text("INSERT INTO incidents_fts(incidents_fts) VALUES ('rebuild')"))
+    else:
+        # Columns created before accent folding are rebuilt (their index is
+        # dropped with them and recreated below).
+        expression = conn.execute(text(
+            "SELECT generation_expression FROM information_schema.columns "
+            "WHERE table_name = 'incidents' AND column_name = 'search_vector'"
+        )).scalar()
+        if expression is not None and POSTGRES_UNACCENT_FUNCTION not in expression:
+            conn.execute(text("ALTER TABLE incidents DROP COLUMN search_vector"))
+        for statement in POSTGRES_FTS_DDL:
+            conn.execute(text(statement))
+
+
+def _rut_prefix_condition(search: str):
+    prefix = normalize_rut(search.strip())
+    if not prefix:
+        return None
+    # A range rather than LIKE so both backends can use the btree index.
+    upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    return (Incident.rut_normalized >= prefix) & (Incident.rut_normalized < upper)
+
+
+def search_condition(search: str, dialect_name: str):
+    """WHERE clause for the incidents search box.
+
+    Every word must match the start of a word in name or observation,
+    ignoring case and accents, through the full-text index; text inside a
+    word ("ose" in "José") does not match. RUT-looking terms also match the
+    normalized RUT prefix.
+    """
+    tokens = _TOKEN_RE.findall(search)
+    if not tokens:
+        fts_condition = None
+    elif dialect_name == "sqlite":
+        match = " ".join(f'"{token}"*' for token in tokens)
+        fts_ids = select(_fts_table.c.rowid).where(
+            text("incidents_fts MATCH :fts_query").bindparams(fts_query=match)
+        )
+        fts_condition = Incident.id.in_(fts_ids)
+    else:
+        query = " & ".join(f"{token}:*" for token in tokens)
+        fts_condition = literal_column("incidents.search_vector").op("@@")(
+            func.to_tsquery("simple", getattr(func, POSTGRES_UNACCENT_FUNCTION)(query))
+        )
+
+    rut_condition = _rut_prefix_condition(search) if _RUT_RE.match(search.strip()) else None
+
+    conditions = [c for c in (fts_condition, rut_condition) if c is not None]
+    if not conditions:
+        return false()
+    return or_(*conditions)
@@ -0,0 +1,145 @@
+import asyncio
+import os
+from datetime import datetime
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import async_session, record_write
+from app.models import UploadJob
+from app.schemas import UploadJobResponse
+from app.services.bulk_insert import (
+    INSERT_BATCH_SIZE,
+    dataset_changed,
+    ingest_batches,
+    total_incident_count,
+)
+from app.services.cache import result_cache
+from app.services.parse_pool import parse_pool
+
+ACTIVE_STAGES = ("queued", "parsing", "inserting")
+
+# Progress of jobs running in this process. Polling reads it without touching
+# the database; the upload_jobs row is only written on stage changes, which
+# also keeps SQLite from contending with the insert transaction.
+_live_jobs: dict[int, dict] = {}
+_tasks: set[asyncio.Task] = set()
+
+
+def _job_response(job: dict) -> UploadJobResponse:
+    rows_per_second = 0.0
+    if job["started_at"] is not None:
+        elapsed = ((job["finished_at"] or datetime.utcnow()) - job["started_at"]).total_seconds()
+        if elapsed > 0:
+            rows_per_second = round(job["rows_inserted"] / elapsed, 1)
+    return UploadJobResponse(**job, rows_per_second=rows_per_second)
+
+
+def _job_dict(job: UploadJob) -> dict:
+    return {
+        field: getattr(job, field)
+        for field in (
+            "id", "filename", "stage", "rows_parsed", "rows_inserted",
+            "records_added", "records_updated", "records_unchanged", "records_duplicated",
+            "total_records", "upload_id", "error", "created_at", "started_at", "finished_at",
+        )
+    }
+
+
+async def _save_progress(job: dict, **changes):
+    job.update(changes)
+    async with async_session() as db:
+        await db.execute(update(UploadJob).where(UploadJob.id == job["id"]).values(**changes))
+        await db.commit()
+
+
+async def create_upload_job(
+    db: AsyncSession, filename: str, source_path: str, mode: str = "append"
+) -> UploadJobResponse:
+    """Persist a queued job and start processing it in the background."""
+    job = UploadJob(filename=filename, stage="queued")
+    db.add(job)
+    await db.commit()
+
+    live = _job_dict(job)
+    _live_jobs[job.id] = live
+    task = asyncio.create_task(_run_upload_job(live, source_path, mode))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return _job_response(live)
+
+
+async def _run_upload_job(job: dict, source_path: str, mode: str):
+    try:
+        await _save_progress(job, stage="parsing", started_at=datetime.utcnow())
+        try:
+            batches = await parse_pool.parse_path(source_path, job["filename"], INSERT_BATCH_SIZE)
+        except Exception as e:
+            raise ValueError(f"Error al procesar el archivo Excel: {str(e)}") from e
+
+        try:
+            if not batches.count:
+                raise ValueError("No se encontraron registros válidos en el archivo")
+            await _save_progress(job, stage="inserting", rows_parsed=batches.count)
+
+            def _on_batch(rows: int):
+                job["rows_inserted"] += rows
+
+            async with async_session() as db:
+                upload, counts = await ingest_batches(
+                    db, job["filename"], batches, batches.count, mode=mode, on_batch=_on_batch
+                )
+                await db.commit()
+                record_write()
+                if dataset_changed(counts):
+                    result_cache.bump_version()
+                total_records = await total_incident_count(db)
+        finally:
+            batches.close()
+
+        await _save_progress(
+            job,
+            stage="done",
+            rows_inserted=batches.count,
+            records_added=counts["inserted"],
+            records_updated=counts["updated"],
+            records_unchanged=counts["unchanged"],
+            records_duplicated=counts["duplicates"],
+            upload_id=upload.id,
+            total_records=total_records,
+            finished_at=datetime.utcnow(),
+        )
+    except Exception as e:
+        await _save_progress(job, stage="failed", error=str(e), finished_at=datetime.utcnow())
+    finally:
+        _live_jobs.pop(job["id"], None)
+        os.remove(source_path)
+
+
+async def get_upload_job(db: AsyncSession, job_id: int) -> UploadJobResponse | None:
+    live = _live_jobs.get(job_id)
+    if live is not None:
+        return _job_response(live)
+
+    job = await db.get(UploadJob, job_id)
+    if job is None:
+        return None
+    return _job_response(_job_dict(job))
+
+
+async def fail_interrupted_jobs():
+    """Mark jobs left unfinished by a previous process as failed.
+
+    Their temp files did not survive the restart, so they cannot resume.
+    """
+    async with async_session() as db:
+        await db.execute(
+            update(UploadJob)
+            .where(UploadJob.stage.in_(ACTIVE_STAGES))
+            .values(
+                stage="failed",
+                error="Proceso interrumpido por un reinicio del servidor",
+                finished_at=datetime.utcnow(),
+            )
+        )
+        await db.commit()
@@ -0,0 +1,84 @@
+"""Dashboard reads while uploads write: the SQLite journal settings under load.
+
+    DATABASE_URL=sqlite+aiosqlite:///./load.db python -m benchmarks.concurrent_load 20000
+    SQLITE_JOURNAL_MODE=DELETE SQLITE_SYNCHRONOUS=FULL SQLITE_MMAP_SIZE=0 \\
+        DATABASE_URL=sqlite+aiosqlite:///./load.db python -m benchmarks.concurrent_load 20000
+
+Loads the synthetic dataset first if the database is empty. READERS
+clients then request /api/dashboard/kpis in a loop while one writer
+uploads an UPLOAD_ROWS-row workbook over and over, for DURATION seconds,
+against the app in this process, after one warm-up upload that starts
+the parse pool. The result cache and the rollup are off
+so every read reaches the database. The uploads made are deleted again at
+the end, so runs with different settings share the same dataset. Set
+SLOW_QUERY_MS=1e9 to keep the slow-query log out of the output.
+"""
+import asyncio
+import sys
+import time
+
+import httpx
+
+from app.config import settings
+from app.main import app, lifespan
+from app.services.cache import result_cache
+from benchmarks.dataset import ensure_dataset, synthetic_workbook
+
+READERS = 8
+DURATION = 20.0
+UPLOAD_ROWS = 1000
+READ_PARAMS = {"work_center": "PLANTA A"}
+
+
+async def main(rows: int):
+    total = await ensure_dataset(rows)
+    result_cache.enabled = False
+    settings.ROLLUP_ENABLED = False
+    workbook = synthetic_workbook(UPLOAD_ROWS, seed=1)
+    latencies: list[float] = []
+    upload_ids: list[int] = []
+
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            async def upload() -> int:
+                response = await client.post(
+                    "/api/upload", files={"file": ("load.xlsx", workbook)},
+                )
+                response.raise_for_status()
+                return response.json()["upload_id"]
+
+            warm_up = await upload()
+            stop = time.monotonic() + DURATION
+
+            async def reader():
+                while time.monotonic() < stop:
+                    start = time.perf_counter()
+                    response = await client.get("/api/dashboard/kpis", params=READ_PARAMS)
+                    response.raise_for_status()
+                    latencies.append(time.perf_counter() - start)
+
+            async def writer():
+                while time.monotonic() < stop:
+                    upload_ids.append(await upload())
+
+            await asyncio.gather(*(reader() for _ in range(READERS)), writer())
+            for upload_id in [warm_up, *upload_ids]:
+                (await client.delete(f"/api/uploads/{upload_id}")).raise_for_status()
+
+    latencies.sort()
+    print(
+        f"journal_mode={settings.SQLITE_JOURNAL_MODE} synchronous={settings.SQLITE_SYNCHRONOUS} "
+        f"mmap_size={settings.SQLITE_MMAP_SIZE}, {total} incidents, "
+        f"{READERS} readers + 1 writer for {DURATION:.0f} s"
+    )
+    print(
+        f"reads/s {len(latencies) / DURATION:.1f}  "
+        f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:.1f} ms  "
+        f"max {latencies[-1] * 1000:.1f} ms  "
+        f"uploads {len(upload_ids)} x {UPLOAD_ROWS} rows"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000))
@@ -0,0 +1,108 @@
+"""Synthetic incidents for the benchmarks, loaded into DATABASE_URL.
+
+    DATABASE_URL=sqlite+aiosqlite:///./bench.db python -m benchmarks.dataset 1000000
+
+Rows go through ingest_batches, like an upload, so the rollup and search
+index are built too. Loading is skipped when the database already holds
+incidents.
+"""
+import asyncio
+import random
+import sys
+from collections.abc import Iterator
+from datetime import date, timedelta
+from io import BytesIO
+from itertools import islice
+
+from openpyxl import Workbook
+
+from app.database import async_session, create_tables
+from app.services.bulk_insert import INSERT_BATCH_SIZE, ingest_batches, total_incident_count
+from app.services.excel_parser import COLUMN_MAP
+
+WORK_CENTERS = ["PLANTA A", "PLANTA B", "PLANTA C", "OBRA NORTE", "OBRA SUR", "TALLER", None]
+CONTRACTS = ["C-100", "C-200", "C-300", "C-400", None]
+POSITIONS = ["SOLDADOR", "MECANICO", "RIGGER", "ELECTRICO", "OPERADOR", "AYUDANTE", None]
+CLASSIFIERS = ["GOLPE", "CORTE", "CAIDA", "ATRAPAMIENTO", "SOBREESFUERZO", "PROYECCION", None]
+BODY_PARTS = ["MANO", "PIE", "CABEZA", "OJO", "ESPALDA", "RODILLA", "HOMBRO", None]
+OBSERVATIONS = ["golpe leve en faena", "corte en mano izquierda", "sin novedad", None]
+
+DAYS_SPAN = 3 * 365
+
+
+def synthetic_records(count: int, seed: int = 0) -> Iterator[dict]:
+    """Records shaped like excel_parser output, dated over the last three years."""
+    rnd = random.Random(seed)
+    today = date.today()
+    for number in range(1, count + 1):
+        d = today - timedelta(days=rnd.randrange(DAYS_SPAN))
+        attention_cost = round(rnd.uniform(0, 5000), 2)
+        medicine_cost = round(rnd.uniform(0, 1000), 2)
+        days_not_worked = float(rnd.randint(0, 10))
+        cost_per_day = round(rnd.uniform(0, 300), 2)
+        yield {
+            "number": number,
+            "name": f"Persona {rnd.randrange(20000)}",
+            "rut": f"{rnd.randint(10, 25)}.{rnd.randint(100, 999)}.{rnd.randint(100, 999)}-{rnd.choice('0123456789K')}",
+            "age": rnd.randint(18, 65) if rnd.random() > 0.1 else None,
+            "position": rnd.choice(POSITIONS),
+            "work_center": rnd.choice(WORK_CENTERS),
+            "attention_type": rnd.choice(["MUTUAL", "INTERNA"]),
+            "time_type": rnd.choice(["CTP", "STP"]),
+            "lost_days": rnd.randint(0, 30),
+            "sex": rnd.choice(["M", "F"]),
+            "incident_type": rnd.choice(["INCIDENTE", "ACCIDENTE"]),
+            "classifier": rnd.choice(CLASSIFIERS),
+            "body_part": rnd.choice(BODY_PARTS),
+            "observation": rnd.choice(OBSERVATIONS),
+            "date": d,
+            "year": d.year,
+            "attention_cost": attention_cost,
+            "medicine_cost": medicine_cost,
+            "days_not_worked": days_not_worked,
+            "cost_per_day_not_worked": cost_per_day,
+            "total_cost": round(attention_cost + medicine_cost + days_not_worked * cost_per_day, 2),
+            "status": "CERRADO",
+            "final_status": rnd.choice(["EN PROCESO", "CERRADO", "CERRADO"]),
+            "image_url": None,
+            "contract": rnd.choice(CONTRACTS),
+        }
+
+
+def synthetic_workbook(count: int, seed: int = 0) -> bytes:
+    """synthetic_records as an .xlsx file for /api/upload."""
+    headers = {field: header for header, field in COLUMN_MAP.items()}
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(list(headers.values()))
+    for record in synthetic_records(count, seed):
+        ws.append([record[field] for field in headers])
+    out = BytesIO()
+    wb.save(out)
+    return out.getvalue()
+
+
+def _batches(count: int, seed: int) -> Iterator[list[dict]]:
+    records = synthetic_records(count, seed)
+    while batch := list(islice(records, INSERT_BATCH_SIZE)):
+        yield batch
+
+
+async def ensure_dataset(count: int, seed: int = 0) -> int:
+    """Load `count` synthetic incidents unless some are already present.
+
+    Returns the number of incidents in the database.
+    """
+    await create_tables()
+    async with async_session() as db:
+        existing = await total_incident_count(db)
+        if existing:
+            return existing
+        await ingest_batches(db, f"synthetic-{count}.xlsx", _batches(count, seed), count)
+        await db.commit()
+        return await total_incident_count(db)
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(asyncio.run(ensure_dataset(rows)), "incidents")
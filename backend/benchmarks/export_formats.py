@@ -0,0 +1,65 @@
+"""Throughput and output size of the xlsx, csv and parquet exports.
+
+    DATABASE_URL=sqlite+aiosqlite:///./export.db python -m benchmarks.export_formats 500000
+
+Loads the synthetic dataset first if the database is empty, then serves
+the app with uvicorn on a local port and downloads each unfiltered export,
+reporting time to first byte, total time, rows per second and bytes.
+Set SLOW_QUERY_MS=1e9 to keep the slow-query log out of the output.
+"""
+import asyncio
+import socket
+import sys
+import threading
+import time
+
+import httpx
+import uvicorn
+
+from app.main import app
+from benchmarks.dataset import ensure_dataset
+
+FORMATS = ("excel", "csv", "parquet")
+
+
+def _serve() -> tuple[uvicorn.Server, str]:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, f"http://127.0.0.1:{port}"
+
+
+def main(rows: int):
+    total = asyncio.run(ensure_dataset(rows))
+    server, base_url = _serve()
+    try:
+        print(f"{total} incidents")
+        print(f"{'format':8s} {'first byte':>11s} {'total':>9s} {'rows/s':>9s} {'size':>10s}")
+        for fmt in FORMATS:
+            start = time.perf_counter()
+            first_byte = None
+            size = 0
+            with httpx.stream(
+                "GET", f"{base_url}/api/export/{fmt}",
+                headers={"Accept-Encoding": "identity"}, timeout=None,
+            ) as response:
+                response.raise_for_status()
+                for chunk in response.iter_raw():
+                    if first_byte is None:
+                        first_byte = time.perf_counter() - start
+                    size += len(chunk)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{fmt:8s} {first_byte:9.2f} s {elapsed:7.2f} s "
+                f"{total / elapsed:9.0f} {size / 1024 / 1024:7.1f} MB"
+            )
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,99 @@
+"""Per-request Python overhead of the dashboard statements, with and without templates.
+
+    DATABASE_URL=sqlite+aiosqlite:///./small.db python -m benchmarks.filter_overhead 400
+
+First times building the /charts statements (seven group counts, the
+cost by classifier and the monthly series), their SQLAlchemy cache keys
+and the result-cache key, through filtered_statement and built afresh on
+every call. Then serves /charts, /kpis and /trends in-process over a
+small dataset, where statement building is a large share of the request,
+as the app does and with filtered_statement replaced by a plain build.
+The result cache and the rollup are off. Set SLOW_QUERY_MS=1e9 to keep
+the slow-query log out of the output.
+"""
+import asyncio
+import sys
+import time
+import timeit
+
+import httpx
+
+from app.config import settings
+from app.main import app, lifespan
+from app.models import Incident
+from app.routers import dashboard
+from app.routers.dashboard import _by_month_statement, _group_cost_statement, _group_count_statement
+from app.services.cache import result_cache
+from app.services.filters import IncidentFilters, filtered_statement
+from benchmarks.dataset import ensure_dataset
+
+BUILDS = 2000
+REQUESTS = 100
+RAW_FILTERS = {
+    "date_from": "2025-01-01",
+    "work_center": "PLANTA A",
+    "classifier": "CORTE",
+    "contract": "C-100",
+}
+GROUP_COLUMNS = (
+    Incident.incident_type, Incident.classifier, Incident.work_center, Incident.position,
+    Incident.sex, Incident.attention_type, Incident.contract,
+)
+
+
+def _plain(name: str, filters: IncidentFilters, build):
+    return build(filters)
+
+
+def _chart_statements(statement) -> tuple:
+    filters = IncidentFilters.from_params(**RAW_FILTERS)
+    statements = [
+        statement(f"group_count:{column.key}", filters, lambda f, c=column: _group_count_statement(f, c))
+        for column in GROUP_COLUMNS
+    ]
+    statements.append(statement(
+        "group_cost:classifier", filters, lambda f: _group_cost_statement(f, Incident.classifier),
+    ))
+    statements.append(statement("by_month", filters, _by_month_statement))
+    keys = [q._generate_cache_key() for q in statements]
+    return keys, hash(result_cache.key("charts", {"filters": filters}))
+
+
+def _us_per_build(statement) -> float:
+    _chart_statements(statement)
+    return min(timeit.repeat(lambda: _chart_statements(statement), number=BUILDS, repeat=5)) / BUILDS * 1e6
+
+
+async def _ms_per_request(client: httpx.AsyncClient, path: str) -> float:
+    (await client.get(path, params=RAW_FILTERS)).raise_for_status()
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        (await client.get(path, params=RAW_FILTERS)).raise_for_status()
+    return (time.perf_counter() - start) * 1000 / REQUESTS
+
+
+async def main(rows: int):
+    print(f"/charts statements + cache keys, best of 5 x {BUILDS} builds")
+    print(f"  fresh     {_us_per_build(_plain):8.1f} us")
+    print(f"  template  {_us_per_build(filtered_statement):8.1f} us")
+
+    total = await ensure_dataset(rows)
+    result_cache.enabled = False
+    settings.ROLLUP_ENABLED = False
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            print(f"{total} incidents, ms per request, mean of {REQUESTS}")
+            print(f"{'endpoint':20s} {'fresh':>8s} {'template':>9s}")
+            for path in ("/api/dashboard/charts", "/api/dashboard/kpis", "/api/dashboard/trends"):
+                dashboard.filtered_statement = _plain
+                try:
+                    fresh = await _ms_per_request(client, path)
+                finally:
+                    dashboard.filtered_statement = filtered_statement
+                template = await _ms_per_request(client, path)
+                print(f"{path.rsplit('/', 1)[1]:20s} {fresh:8.2f} {template:9.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 400))
@@ -0,0 +1,113 @@
+"""CPU per request of the response serialization paths at 100 and 10k items.
+
+    DATABASE_URL=sqlite+aiosqlite:///./serialization.db python -m benchmarks.serialization 12000
+    ANALYTICS_ENGINE=columnar DATABASE_URL=sqlite+aiosqlite:///./serialization.db python -m benchmarks.serialization 12000
+
+Part one serves IncidentBrief lists from rows held in memory three ways:
+pydantic models through FastAPI's response_model (the former path),
+TypeAdapter over the row tuples, and plain dicts encoded with orjson (the
+path the routes use), after checking the three bodies are equal. Part two
+loads the synthetic dataset if the database is empty and measures
+/incidents at 100 items, the body map capped at 20 per part, the
+uncapped body map (about 10k incidents at the default size) and /charts.
+Everything is served in-process with the result cache off; figures are
+process CPU per request, best of REPEATS batches. Set SLOW_QUERY_MS=1e9
+to keep the slow-query log out of the output.
+"""
+import asyncio
+import sys
+import time
+from collections import namedtuple
+from datetime import date, timedelta
+
+import httpx
+import orjson
+from fastapi import FastAPI
+from pydantic import TypeAdapter
+
+from app.main import app, lifespan
+from app.routers.dashboard import _json_response
+from app.schemas import IncidentBrief
+from app.services.cache import result_cache
+from benchmarks.dataset import ensure_dataset
+
+REPEATS = 5
+SIZES = (100, 10_000)
+BriefRow = namedtuple("BriefRow", "id name date incident_type classifier")
+
+
+def _encoders_app() -> FastAPI:
+    rows = [
+        BriefRow(i, f"Persona {i}", date(2025, 1, 1) + timedelta(days=i % 300), "INCIDENTE", "CORTE")
+        for i in range(max(SIZES))
+    ]
+    adapter = TypeAdapter(list[IncidentBrief])
+    encoders = FastAPI()
+
+    @encoders.get("/models", response_model=list[IncidentBrief])
+    async def models(count: int):
+        return [IncidentBrief(**row._asdict()) for row in rows[:count]]
+
+    @encoders.get("/type-adapter")
+    async def type_adapter(count: int):
+        return _json_response(adapter.dump_json(adapter.validate_python(rows[:count], from_attributes=True)))
+
+    @encoders.get("/orjson")
+    async def orjson_dicts(count: int):
+        return _json_response(orjson.dumps([row._asdict() for row in rows[:count]]))
+
+    return encoders
+
+
+async def _cpu_ms(client: httpx.AsyncClient, path: str, params: dict, calls: int) -> float:
+    (await client.get(path, params=params)).raise_for_status()
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.process_time()
+        for _ in range(calls):
+            (await client.get(path, params=params)).raise_for_status()
+        best = min(best, (time.process_time() - start) / calls)
+    return best * 1000
+
+
+def _client(asgi_app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=asgi_app), base_url="http://bench", timeout=None)
+
+
+async def encoders():
+    async with _client(_encoders_app()) as client:
+        print("IncidentBrief lists, CPU ms per request")
+        print(f"{'items':>7s} {'models':>9s} {'adapter':>9s} {'orjson':>9s}")
+        for count in SIZES:
+            params = {"count": count}
+            bodies = [(await client.get(path, params=params)).json() for path in ("/models", "/type-adapter", "/orjson")]
+            assert bodies[0] == bodies[1] == bodies[2]
+            calls = 50 if count <= 100 else 3
+            timings = [await _cpu_ms(client, path, params, calls) for path in ("/models", "/type-adapter", "/orjson")]
+            print(f"{count:7d} {timings[0]:9.2f} {timings[1]:9.2f} {timings[2]:9.2f}")
+
+
+async def endpoints(rows: int):
+    total = await ensure_dataset(rows)
+    result_cache.enabled = False
+    async with lifespan(app), _client(app) as client:
+        body_map = (await client.get("/api/dashboard/body-map")).json()
+        detail = sum(len(part["incidents"]) for part in body_map["parts"])
+        cases = [
+            ("incidents, 100 items", "/api/dashboard/incidents", {"size": 100, "include_total": False}, 30),
+            ("body map, capped 20", "/api/dashboard/body-map", {"max_incidents_per_part": 20}, 30),
+            (f"body map, {detail} items", "/api/dashboard/body-map", {}, 3),
+            ("charts", "/api/dashboard/charts", {}, 10),
+        ]
+        print(f"{total} incidents, CPU ms per request")
+        for label, path, params, calls in cases:
+            print(f"  {label:28s} {await _cpu_ms(client, path, params, calls):8.2f}")
+
+
+async def main(rows: int):
+    await encoders()
+    await endpoints(rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 12_000))
@@ -0,0 +1,92 @@
+"""Dashboard load: the four dashboard endpoints against /api/dashboard/summary.
+
+    DATABASE_URL=sqlite+aiosqlite:///./summary.db python -m benchmarks.summary 40000
+    ANALYTICS_ENGINE=columnar DATABASE_URL=sqlite+aiosqlite:///./summary.db python -m benchmarks.summary 40000
+
+Loads the synthetic dataset first if the database is empty and checks
+that the summary equals the four separate responses. Each filter set is
+then loaded the ways the frontend could: the four requests one after
+another, the four at once, and one summary request, with the body map
+capped at BODY_MAP_CAP incidents per part and uncapped. Requests are
+served in-process over httpx.ASGITransport with the result cache off, so
+the figures hold no network latency. Set SLOW_QUERY_MS=1e9 to keep the
+slow-query log out of the output.
+"""
+import asyncio
+import sys
+import time
+from datetime import date, timedelta
+
+import httpx
+
+from app.main import app, lifespan
+from app.services.cache import result_cache
+from benchmarks.dataset import ensure_dataset
+
+REPEATS = 5
+BODY_MAP_CAP = 20
+ENDPOINTS = {"kpis": "kpis", "charts": "charts", "trends": "trends", "body-map": "body_map"}
+
+
+def _filter_sets() -> list[dict]:
+    return [
+        {},
+        {"work_center": "PLANTA A"},
+        {"position": "SOLDADOR"},
+        {"date_from": (date.today() - timedelta(days=90)).isoformat()},
+    ]
+
+
+async def _get(client: httpx.AsyncClient, path: str, params: dict) -> dict:
+    response = await client.get(f"/api/dashboard/{path}", params=params)
+    response.raise_for_status()
+    return response.json()
+
+
+async def four_sequential(client, params):
+    for path in ENDPOINTS:
+        await _get(client, path, params)
+
+
+async def four_concurrent(client, params):
+    await asyncio.gather(*(_get(client, path, params) for path in ENDPOINTS))
+
+
+async def summary(client, params):
+    await _get(client, "summary", params)
+
+
+async def _ms_per_load(run, client, filter_sets: list[dict]) -> float:
+    for params in filter_sets:
+        await run(client, params)
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        for params in filter_sets:
+            await run(client, params)
+    return (time.perf_counter() - start) * 1000 / (REPEATS * len(filter_sets))
+
+
+async def main(rows: int):
+    total = await ensure_dataset(rows)
+    result_cache.enabled = False
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            for params in _filter_sets():
+                combined = await _get(client, "summary", params)
+                for path, key in ENDPOINTS.items():
+                    assert await _get(client, path, params) == combined[key], (path, params)
+
+            print(f"{total} incidents, ms per dashboard load, mean over {len(_filter_sets())} filter sets")
+            print(f"{'body map':16s} {'4 sequential':>13s} {'4 concurrent':>13s} {'summary':>9s}")
+            for label, cap in ((f"capped {BODY_MAP_CAP}", {"max_incidents_per_part": BODY_MAP_CAP}), ("uncapped", {})):
+                filter_sets = [{**params, **cap} for params in _filter_sets()]
+                timings = [
+                    await _ms_per_load(run, client, filter_sets)
+                    for run in (four_sequential, four_concurrent, summary)
+                ]
+                print(f"{label:16s} {timings[0]:13.1f} {timings[1]:13.1f} {timings[2]:9.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 40_000))
@@ -0,0 +1,28 @@
+import os
+import tempfile
+from io import BytesIO
+
+import pytest
+from openpyxl import Workbook
+
+# app.database builds its engines at import time, so the tests' database
+# has to be chosen before any app module is imported.
+os.environ["DATABASE_URL"] = (
+    f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}"
+)
+
+
+@pytest.fixture(scope="session")
+def workbook():
+    """Builds an .xlsx upload: workbook(headers, rows) -> bytes."""
+    def build(headers: list[str], rows) -> bytes:
+        wb = Workbook()
+        ws = wb.active
+        ws.append(headers)
+        for row in rows:
+            ws.append(list(row))
+        output = BytesIO()
+        wb.save(output)
+        return output.getvalue()
+
+    return build
@@ -0,0 +1,50 @@
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.columnar import columnar_store
+
+PARTS = ["MANO DERECHA", "PIE IZQUIERDO", "CABEZA"]
+WORK_CENTER = "BODY MAP TEST"
+
+
+HEADERS = ["N°", "Nombre", "Rut", "Fecha", "Tipo", "Parte del Cuerpo", "Centro de Trabajo"]
+
+
+@pytest.fixture(scope="module")
+def client(workbook):
+    content = workbook(HEADERS, [
+        (
+            number, f"Parte {number}", f"18.{number:03d}.000-1", date(2025, 7, 1 + number % 28),
+            "INCIDENTE", PARTS[number % len(PARTS)], WORK_CENTER,
+        )
+        for number in range(1, 51)
+    ])
+    with TestClient(app) as client:
+        assert client.post("/api/upload", files={"file": ("body.xlsx", content)}).status_code == 200
+        yield client
+
+
+@pytest.mark.parametrize("engine", ["sql", "columnar"])
+def test_capped_body_map_and_drill_down_pages_give_every_incident(client, monkeypatch, engine):
+    monkeypatch.setattr(columnar_store, "enabled", engine == "columnar")
+    params = {"work_center": WORK_CENTER}
+    full = client.get("/api/dashboard/body-map", params=params).json()["parts"]
+    summary = client.get(
+        "/api/dashboard/summary", params={**params, "max_incidents_per_part": 4},
+    ).json()
+    capped = summary["body_map"]["parts"]
+    assert [(p["name"], p["count"]) for p in capped] == [(p["name"], p["count"]) for p in full]
+
+    for part, full_part in zip(capped, full):
+        assert len(part["incidents"]) == 4
+        ids = [item["id"] for item in part["incidents"]]
+        while len(ids) < part["count"]:
+            page = client.get("/api/dashboard/body-map/incidents", params={
+                **params, "part": part["name"], "offset": len(ids), "limit": 5,
+            }).json()
+            assert page
+            ids += [item["id"] for item in page]
+        assert ids == [item["id"] for item in full_part["incidents"]]
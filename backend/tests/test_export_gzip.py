@@ -0,0 +1,105 @@
+import gzip
+from datetime import date
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.compression import GZipMiddleware
+
+
+HEADERS = ["N°", "Nombre", "Rut", "Fecha", "Tipo", "Gasto Total"]
+
+
+@pytest.fixture(scope="module")
+def client(workbook):
+    content = workbook(HEADERS, [
+        (number, f"Gzip {number}", f"17.{number:03d}.000-1", date(2025, 4, 3), "ACCIDENTE", 25)
+        for number in range(1, 201)
+    ])
+    with TestClient(app) as client:
+        assert client.post("/api/upload", files={"file": ("gzip.xlsx", content)}).status_code == 200
+        yield client
+
+
+@pytest.mark.parametrize("fmt, content_type", [
+    ("excel", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    ("parquet", "application/vnd.apache.parquet"),
+])
+def test_compressed_exports_are_not_gzipped(client, fmt, content_type):
+    response = client.get(f"/api/export/{fmt}", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == content_type
+    assert "content-encoding" not in response.headers
+    assert len(response.content) > 1024
+
+
+def test_csv_export_is_still_gzipped(client):
+    response = client.get("/api/export/csv", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Gzip 200" in response.text
+
+
+TEXT = "incidente " * 200
+
+
+@pytest.fixture(scope="module")
+def gzip_client():
+    inner = FastAPI()
+
+    @inner.get("/text")
+    async def text():
+        return PlainTextResponse(TEXT)
+
+    @inner.get("/small")
+    async def small():
+        return PlainTextResponse("ok")
+
+    @inner.get("/stream")
+    async def stream():
+        return StreamingResponse((TEXT for _ in range(3)), media_type="text/csv")
+
+    @inner.get("/encoded")
+    async def encoded():
+        return PlainTextResponse(TEXT, headers={"Content-Encoding": "identity"})
+
+    inner.add_middleware(GZipMiddleware, minimum_size=100, compresslevel=6)
+    with TestClient(inner) as client:
+        yield client
+
+
+def raw_get(client, path: str):
+    with client.stream("GET", path, headers={"Accept-Encoding": "gzip"}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+def test_middleware_gzips_a_complete_body(gzip_client):
+    response, raw = raw_get(gzip_client, "/text")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) == len(raw)
+    assert gzip.decompress(raw).decode() == TEXT
+    assert raw_get(gzip_client, "/text")[1] == raw
+
+
+def test_middleware_gzips_a_streamed_body(gzip_client):
+    response, raw = raw_get(gzip_client, "/stream")
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(raw).decode() == TEXT * 3
+
+
+@pytest.mark.parametrize("path, body", [("/small", "ok"), ("/encoded", TEXT)])
+def test_middleware_leaves_small_and_encoded_bodies_alone(gzip_client, path, body):
+    response, raw = raw_get(gzip_client, path)
+    assert response.headers.get("content-encoding") in (None, "identity")
+    assert raw.decode() == body
+
+
+def test_middleware_skips_clients_without_gzip(gzip_client):
+    response = gzip_client.get("/text", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.text == TEXT
@@ -0,0 +1,71 @@
+import base64
+import json
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models import Incident
+from app.routers.dashboard import _decode_cursor, _encode_cursor
+
+
+def cursor_of(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+@pytest.mark.parametrize("column, value", [
+    (Incident.name, "Persona 1"),
+    (Incident.name, None),
+    (Incident.date, date(2025, 3, 1)),
+    (Incident.age, 41),
+    (Incident.total_cost, 1234.5),
+    (Incident.total_cost, 100),
+    (Incident.id, 7),
+])
+def test_encoded_cursor_round_trips(column, value):
+    assert _decode_cursor(_encode_cursor(value, 42), column) == (value, 42)
+
+
+@pytest.mark.parametrize("column, payload", [
+    (Incident.name, [[1], 5]),
+    (Incident.name, [{"a": 1}, 5]),
+    (Incident.name, [3, 5]),
+    (Incident.work_center, [True, 5]),
+    (Incident.date, [20250301, 5]),
+    (Incident.date, ["2025-13-01", 5]),
+    (Incident.age, ["41", 5]),
+    (Incident.age, [41.5, 5]),
+    (Incident.age, [True, 5]),
+    (Incident.age, [2 ** 64, 5]),
+    (Incident.total_cost, ["1.5", 5]),
+    (Incident.total_cost, [float("nan"), 5]),
+    (Incident.name, ["x", "5"]),
+    (Incident.name, ["x", 5.0]),
+    (Incident.name, ["x", None]),
+    (Incident.name, ["x", [5]]),
+    (Incident.name, ["x", 5, 6]),
+    (Incident.name, {"value": "x", "id": 5}),
+    (Incident.name, 5),
+])
+def test_malformed_cursor_is_rejected(column, payload):
+    with pytest.raises(HTTPException) as exc_info:
+        _decode_cursor(cursor_of(payload), column)
+    assert exc_info.value.status_code == 400
+
+
+def test_undecodable_cursor_is_rejected():
+    with pytest.raises(HTTPException) as exc_info:
+        _decode_cursor("not base64!", Incident.name)
+    assert exc_info.value.status_code == 400
+
+
+def test_crafted_cursor_returns_400():
+    with TestClient(app) as client:
+        response = client.get("/api/dashboard/incidents", params={
+            "pagination": "cursor",
+            "sort_by": "name",
+            "cursor": cursor_of([[1], 5]),
+        })
+    assert response.status_code == 400
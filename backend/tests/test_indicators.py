@@ -0,0 +1,114 @@
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+# A year no other test module loads, so the shared database does not interfere.
+YEAR = 2019
+HOURS_HEADERS = ["Centro de Trabajo", "Contrato", "Año", "Mes", "Horas Trabajadas", "Dotación"]
+INCIDENT_HEADERS = ["N°", "Nombre", "Rut", "Fecha", "Tipo", "Centro de Trabajo", "Dias Perdidos"]
+# The rate test gets a year of its own, so March totals above stay put.
+RATES_YEAR = 2018
+
+
+@pytest.fixture(scope="module")
+def upload_hours(workbook):
+    def upload(client, rows: list[tuple]):
+        response = client.post(
+            "/api/worked-hours/upload", files={"file": ("hh.xlsx", workbook(HOURS_HEADERS, rows))},
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    return upload
+
+
+def march_hours(client, **params) -> float:
+    body = client.get("/api/dashboard/indicators", params={
+        "date_from": f"{YEAR}-03-01", "date_to": f"{YEAR}-03-31", **params,
+    }).json()
+    return body["total"]["worked_hours"] if body["total"] else 0.0
+
+
+@pytest.fixture(scope="module")
+def client(upload_hours):
+    with TestClient(app) as client:
+        upload_hours(client, [
+            ("IND NORTE", None, YEAR, 3, 1000, 10),
+            ("IND NORTE", "K-1", YEAR, 3, 200, 2),
+            ("IND SUR", "K-1", YEAR, 3, 500, 5),
+        ])
+        yield client
+
+
+def test_upload_only_replaces_its_own_work_centers(client, upload_hours):
+    assert march_hours(client) == 1700
+    body = upload_hours(client, [("IND NORTE", None, YEAR, 3, 1500, 12)])
+    assert body["months"] == [f"{YEAR}-03"]
+
+    assert march_hours(client) == 2200
+    assert march_hours(client, work_center="IND SUR") == 500
+    assert march_hours(client, contract="K-1") == 700
+
+
+def test_reupload_with_contract_replaces_that_row(client, upload_hours):
+    before = march_hours(client)
+    upload_hours(client, [("IND SUR", "K-1", YEAR, 3, 800, 5)])
+    assert march_hours(client) == before + 300
+
+
+def test_date_range_reports_the_whole_months_it_covers(client):
+    body = client.get("/api/dashboard/indicators", params={
+        "date_from": f"{YEAR}-03-15", "date_to": f"{YEAR}-03-20",
+    }).json()
+    assert [item["month"] for item in body["series"]] == [3]
+    assert body["period_from"] == f"{YEAR}-03-01"
+    assert body["period_to"] == f"{YEAR}-03-31"
+
+
+def test_unbounded_range_has_no_period(client):
+    body = client.get("/api/dashboard/indicators").json()
+    assert body["period_from"] is None
+    assert body["period_to"] is None
+
+
+def test_rates_match_hand_computed_values(client, upload_hours, workbook):
+    upload_hours(client, [
+        ("IND TASAS", None, RATES_YEAR, 1, 40000, 25),
+        ("IND TASAS", None, RATES_YEAR, 2, 0, 20),
+        ("IND TASAS", None, RATES_YEAR, 3, 30000, 26),
+    ])
+    incidents = [
+        (1, "ACCIDENTE", 3), (1, "ACCIDENTE", 5), (1, "INCIDENTE", 9),
+        (2, "ACCIDENTE", 4),
+        (3, "ACCIDENTE", 2), (3, "ACCIDENTE", 3), (3, "ACCIDENTE", 5),
+    ]
+    content = workbook(INCIDENT_HEADERS, [
+        (8100 + n, f"Tasa {n}", f"16.{n:03d}.000-1", date(RATES_YEAR, month, 10), kind, "IND TASAS", lost_days)
+        for n, (month, kind, lost_days) in enumerate(incidents)
+    ])
+    assert client.post("/api/upload", files={"file": ("tasas.xlsx", content)}).status_code == 200
+
+    body = client.get("/api/dashboard/indicators", params={
+        "date_from": f"{RATES_YEAR}-01-01", "date_to": f"{RATES_YEAR}-03-31", "work_center": "IND TASAS",
+    }).json()
+    series = [
+        (item["month"], item["accidents"], item["lost_days"],
+         item["frequency_rate"], item["severity_rate"], item["accident_rate"])
+        for item in body["series"]
+    ]
+    assert series == [
+        # 2 * 1e6 / 40000, 8 * 1e6 / 40000, 2 * 100 / 25; the incident is not counted.
+        (1, 2, 8, 50.0, 200.0, 8.0),
+        # No hours worked: no hour-based rates, but the accident rate still has a headcount.
+        (2, 1, 4, 0.0, 0.0, 5.0),
+        # 3 * 1e6 / 30000, 10 * 1e6 / 30000, 3 * 100 / 26
+        (3, 3, 10, 100.0, 333.33, 11.54),
+    ]
+
+    total = body["total"]
+    assert (total["worked_hours"], total["headcount"], total["accidents"], total["lost_days"]) == (70000, 23.7, 6, 22)
+    # 6 * 1e6 / 70000, 22 * 1e6 / 70000, 6 * 100 / 23.7 (average monthly headcount)
+    assert (total["frequency_rate"], total["severity_rate"], total["accident_rate"]) == (85.71, 314.29, 25.32)
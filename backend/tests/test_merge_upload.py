@@ -0,0 +1,67 @@
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routers import upload as upload_router
+from app.services.cache import result_cache
+
+HEADERS = ["N°", "Nombre", "Rut", "Fecha", "Tipo", "Gasto Total"]
+
+
+def merge_upload(client: TestClient, content: bytes) -> dict:
+    response = client.post(
+        "/api/upload",
+        params={"mode": "merge"},
+        files={"file": ("merge.xlsx", content)},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def counts(result: dict) -> tuple[int, int, int, int]:
+    return (
+        result["records_added"],
+        result["records_updated"],
+        result["records_unchanged"],
+        result["records_duplicated"],
+    )
+
+
+@pytest.mark.parametrize("batch_size, reupload_counts", [
+    (5000, (0, 0, 2, 1)),
+    # The repeated key lands in a later batch than its first row; the last
+    # row still wins and the identical re-upload changes nothing.
+    (2, (0, 0, 2, 1)),
+])
+def test_keys_repeated_in_the_file_are_reported_as_duplicates(
+    monkeypatch, workbook, batch_size, reupload_counts,
+):
+    monkeypatch.setattr(upload_router, "INSERT_BATCH_SIZE", batch_size)
+    number = 9000 + batch_size
+    rut = f"11.111.{number}-1"
+    day = date(2025, 3, 1)
+    rows = [
+        (number, "Ana Soto", rut, day, "ACCIDENTE", 100),
+        (number + 1, "Luis Rojas", f"22.222.{number}-2", day, "INCIDENTE", 50),
+        (number, "Ana Soto", rut, day, "ACCIDENTE", 250),
+    ]
+    content = workbook(HEADERS, rows)
+    with TestClient(app) as client:
+        first = merge_upload(client, content)
+        assert counts(first) == (2, 0, 0, 1)
+
+        incidents = client.get(
+            "/api/dashboard/incidents", params={"search": rut},
+        ).json()["items"]
+        assert [item["total_cost"] for item in incidents] == [250.0]
+
+        version = result_cache.dataset_version
+        again = merge_upload(client, content)
+        assert counts(again) == reupload_counts
+        assert result_cache.dataset_version == version
+        incidents = client.get(
+            "/api/dashboard/incidents", params={"search": rut},
+        ).json()["items"]
+        assert [item["total_cost"] for item in incidents] == [250.0]
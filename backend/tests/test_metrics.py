@@ -0,0 +1,60 @@
+import csv
+import io
+import re
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+HEADERS = ["N°", "Nombre", "Rut", "Fecha", "Tipo", "Gasto Total"]
+
+
+def metric(text: str, name: str, **labels) -> float:
+    label_text = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    series = f"{name}{{{label_text}}}" if labels else name
+    match = re.search(rf"^{re.escape(series)} (\S+)$", text, re.MULTILINE)
+    return float(match.group(1)) if match else 0.0
+
+
+@pytest.fixture(scope="module")
+def client(workbook):
+    content = workbook(HEADERS, [
+        (number, f"Persona {number}", f"15.{number:03d}.000-1", date(2025, 5, 2), "INCIDENTE", 10)
+        for number in range(1, 41)
+    ])
+    with TestClient(app) as client:
+        assert client.post("/api/upload", files={"file": ("metrics.xlsx", content)}).status_code == 200
+        yield client
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet", "excel"])
+def test_streamed_export_rows_are_counted(client, fmt):
+    route = f"/api/export/{fmt}"
+    before = metric(client.get("/api/metrics").text, "db_rows_fetched_total", route=route)
+    response = client.get(route)
+    assert response.status_code == 200
+    exported = len(list(csv.reader(io.StringIO(client.get("/api/export/csv").text)))) - 1
+
+    text = client.get("/api/metrics").text
+    fetched = metric(text, "db_rows_fetched_total", route=route)
+    if fmt == "csv":
+        # The second CSV download above is counted too.
+        assert fetched - before == 2 * exported
+    else:
+        assert fetched - before == exported
+
+
+def test_inserted_rows_are_counted(client):
+    text = client.get("/api/metrics").text
+    assert metric(text, "db_rows_affected_total", route="/api/upload", operation="insert") >= 40
+
+
+def test_parse_pool_is_exported(client):
+    text = client.get("/api/metrics").text
+    assert "# TYPE upload_parse_queue_depth gauge" in text
+    assert metric(text, "upload_parse_queue_depth") == 0
+    assert metric(text, "upload_parse_running") == 0
+    assert metric(text, "upload_parse_completed_total") >= 1
@@ -0,0 +1,115 @@
+"""The dashboard statements must not scan the incidents table.
+
+Plans are taken from a fresh schema without ANALYZE statistics, like a
+production database, for every standard filter shape.
+"""
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, func, select
+
+from app.models import Base, Incident
+from app.routers.dashboard import (
+    _by_month_statement,
+    _daily_totals_statement,
+    _group_cost_statement,
+    _group_count_statement,
+    _incident_list_statement,
+    _kpi_statement,
+)
+from app.services.filters import IncidentFilters
+from app.services.search import create_search_index
+
+DATE_RANGE = {"date_from": date(2025, 1, 1), "date_to": date(2025, 6, 30)}
+
+FILTER_SHAPES = {
+    "none": IncidentFilters(),
+    "date range": IncidentFilters(**DATE_RANGE),
+    "work_center": IncidentFilters(work_center="PLANTA A"),
+    "contract": IncidentFilters(contract="C-100"),
+    "work_center + date": IncidentFilters(work_center="PLANTA A", **DATE_RANGE),
+}
+
+# Columns grouped by the charts endpoint.
+GROUP_COLUMNS = (
+    "incident_type", "classifier", "work_center", "position", "sex",
+    "attention_type", "contract",
+)
+
+STATEMENT_PARAMS = {
+    "current_month_start": date(2025, 6, 1),
+    "prev_month_start": date(2025, 5, 1),
+    "since": date(2024, 7, 1),
+}
+
+
+@pytest.fixture(scope="module")
+def conn():
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        Base.metadata.create_all(connection)
+        create_search_index(connection)
+        yield connection
+    engine.dispose()
+
+
+def query_plan(conn, statement, filters: IncidentFilters) -> list[str]:
+    compiled = statement.compile(dialect=conn.dialect)
+    values = compiled.construct_params({**filters.params, **STATEMENT_PARAMS})
+    params = tuple(
+        value.isoformat() if isinstance(value, date) else value
+        for value in (values[name] for name in compiled.positiontup)
+    )
+    rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params)
+    return [row[3] for row in rows]
+
+
+def assert_no_table_scan(plan: list[str], name: str):
+    # "SCAN incidents USING [COVERING] INDEX ..." walks an index; a bare
+    # "SCAN incidents" reads every row of the table.
+    assert "SCAN incidents" not in plan, f"{name}: {plan}"
+
+
+def dashboard_statements(filters: IncidentFilters):
+    yield "kpis", _kpi_statement(filters)
+    yield "by_month", _by_month_statement(filters)
+    yield "daily_totals", _daily_totals_statement(filters)
+    yield "group_cost:classifier", _group_cost_statement(filters, Incident.classifier)
+    for name in GROUP_COLUMNS:
+        yield f"group_count:{name}", _group_count_statement(filters, getattr(Incident, name))
+    listing = _incident_list_statement(filters, None, "sqlite")
+    yield "incidents:count", select(func.count()).select_from(listing.subquery())
+    yield "incidents:by_date", listing.order_by(Incident.date.desc()).limit(20)
+
+
+@pytest.mark.parametrize("shape", FILTER_SHAPES)
+def test_dashboard_statements_use_indexes(conn, shape):
+    filters = FILTER_SHAPES[shape]
+    for name, statement in dashboard_statements(filters):
+        assert_no_table_scan(query_plan(conn, statement, filters), name)
+
+
+@pytest.mark.parametrize("shape", FILTER_SHAPES)
+def test_incident_page_by_id(conn, shape):
+    filters = FILTER_SHAPES[shape]
+    statement = _incident_list_statement(filters, None, "sqlite")
+    plan = query_plan(conn, statement.order_by(Incident.id.desc()).limit(20), filters)
+    if shape == "none":
+        # The default order is the rowid itself: SQLite reports a SCAN, but
+        # walks the table backwards and stops after the page, without sorting.
+        assert plan == ["SCAN incidents"], plan
+    else:
+        assert_no_table_scan(plan, "incidents:by_id")
+
+
+@pytest.mark.parametrize("shape", [*FILTER_SHAPES, "search only"])
+def test_search_uses_full_text_index(conn, shape):
+    filters = FILTER_SHAPES.get(shape, IncidentFilters())
+    listing = _incident_list_statement(filters, "mano", "sqlite")
+    for statement in (
+        select(func.count()).select_from(listing.subquery()),
+        listing.order_by(Incident.id.desc()).limit(20),
+    ):
+        plan = query_plan(conn, statement, filters)
+        assert_no_table_scan(plan, "incidents:search")
+        assert any("incidents_fts VIRTUAL TABLE INDEX" in step for step in plan), plan
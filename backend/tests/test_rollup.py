@@ -0,0 +1,27 @@
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.filters import IncidentFilters
+from app.services.rollup import rollup_fits
+
+
+@pytest.mark.parametrize("date_to, fits", [
+    (date(2025, 1, 31), True),
+    (date(2024, 2, 29), True),
+    (date(2025, 2, 28), True),
+    (date(2025, 2, 27), False),
+    (date(9999, 12, 31), True),
+    (date(9999, 12, 30), False),
+])
+def test_rollup_fits_month_end(date_to, fits):
+    assert rollup_fits(IncidentFilters(date_to=date_to)) is fits
+
+
+@pytest.mark.parametrize("path", ["kpis", "charts", "trends", "summary"])
+def test_max_date_is_accepted(path):
+    with TestClient(app) as client:
+        response = client.get(f"/api/dashboard/{path}", params={"date_to": "9999-12-31"})
+    assert response.status_code == 200
@@ -0,0 +1,54 @@
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.dialects import postgresql
+
+from app.models import Base, Incident, Upload
+from app.services.search import create_search_index, search_condition
+
+ROWS = [
+    {"id": 1, "name": "José Pérez", "observation": "corte en mano izquierda"},
+    {"id": 2, "name": "Jose Perez", "observation": "golpe en faena"},
+    {"id": 3, "name": "María Núñez", "observation": "caída de altura"},
+    {"id": 4, "name": "Ana Soto", "observation": "manipulación de carga"},
+]
+
+
+@pytest.fixture(scope="module")
+def conn():
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        Base.metadata.create_all(connection)
+        create_search_index(connection)
+        connection.execute(insert(Upload), [{"id": 1, "filename": "a.xlsx"}])
+        connection.execute(insert(Incident), [{**row, "upload_id": 1} for row in ROWS])
+        yield connection
+    engine.dispose()
+
+
+def search_ids(conn, search: str) -> set[int]:
+    q = select(Incident.id).where(search_condition(search, "sqlite"))
+    return set(conn.execute(q).scalars())
+
+
+@pytest.mark.parametrize("search, expected", [
+    ("jose", {1, 2}),
+    ("José", {1, 2}),
+    ("perez jose", {1, 2}),
+    ("nunez", {3}),
+    ("caida", {3}),
+    ("mano", {1}),
+    ("manip", {4}),
+])
+def test_accents_are_folded(conn, search, expected):
+    assert search_ids(conn, search) == expected
+
+
+def test_words_match_as_prefixes_not_substrings(conn):
+    # "ose" is inside "José" but starts no word.
+    assert search_ids(conn, "ose") == set()
+
+
+def test_postgres_folds_accents_in_the_query():
+    condition = search_condition("José", "postgresql")
+    sql = str(condition.compile(dialect=postgresql.dialect()))
+    assert "to_tsquery(%(to_tsquery_1)s, incidents_search_unaccent(" in sql
@@ -0,0 +1,53 @@
+import time
+from datetime import date
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+HEADERS = ["N°", "Nombre", "Rut", "Fecha", "Tipo", "Gasto Total"]
+
+
+def run_job(client: TestClient, content: bytes) -> dict:
+    response = client.post(
+        "/api/upload",
+        params={"async": "true", "mode": "merge"},
+        files={"file": ("job.xlsx", content)},
+    )
+    assert response.status_code == 200, response.text
+    job = response.json()
+    deadline = time.monotonic() + 30
+    while job["stage"] not in ("done", "failed") and time.monotonic() < deadline:
+        time.sleep(0.05)
+        job = client.get(f"/api/upload-jobs/{job['id']}").json()
+    assert job["stage"] == "done", job
+    return job
+
+
+def outcome(job: dict) -> tuple[int, int, int, int]:
+    return (
+        job["records_added"],
+        job["records_updated"],
+        job["records_unchanged"],
+        job["records_duplicated"],
+    )
+
+
+def test_merge_job_reports_real_counts(workbook):
+    day = date(2025, 6, 9)
+    rows = [
+        (7001, "Marta Díaz", "13.700.001-1", day, "ACCIDENTE", 100),
+        (7002, "Pedro Lagos", "13.700.002-2", day, "INCIDENTE", 50),
+        (7003, "Sara Vidal", "13.700.003-3", day, "INCIDENTE", 75),
+    ]
+    with TestClient(app) as client:
+        first = run_job(client, workbook(HEADERS, rows))
+        assert outcome(first) == (3, 0, 0, 0)
+
+        changed = [rows[0], rows[1], (*rows[2][:5], 80), rows[1]]
+        again = run_job(client, workbook(HEADERS, changed))
+        assert again["rows_inserted"] == 4
+        assert outcome(again) == (0, 1, 2, 1)
+
+        stored = client.get(f"/api/upload-jobs/{again['id']}").json()
+        assert outcome(stored) == (0, 1, 2, 1)
@@ -3,10 +3,15 @@ import type {
   KPIs,
   ChartsData,
   BodyMapData,
+  BodyPartIncident,
   TrendsData,
+  DashboardSummary,
+  IndicatorsData,
   IncidentListResponse,
   UploadItem,
   UploadResponse,
+  UploadJob,
+  WorkedHoursUploadResponse,
   Filters,
 } from '../types'
 
@@ -38,8 +43,28 @@ export async function fetchCharts(filters: Filters): Promise<ChartsData> {
   return data
 }
 
-export async function fetchBodyMap(filters: Filters): Promise<BodyMapData> {
-  const { data } = await api.get('/dashboard/body-map', { params: buildParams(filters) })
+function bodyMapParams(filters: Filters, maxIncidentsPerPart?: number): Record<string, string> {
+  const params = buildParams(filters)
+  if (maxIncidentsPerPart !== undefined) params.max_incidents_per_part = String(maxIncidentsPerPart)
+  return params
+}
+
+export async function fetchBodyMap(filters: Filters, maxIncidentsPerPart?: number): Promise<BodyMapData> {
+  const { data } = await api.get('/dashboard/body-map', {
+    params: bodyMapParams(filters, maxIncidentsPerPart),
+  })
+  return data
+}
+
+export async function fetchBodyPartIncidents(
+  part: string,
+  filters: Filters,
+  offset: number,
+  limit: number,
+): Promise<BodyPartIncident[]> {
+  const { data } = await api.get('/dashboard/body-map/incidents', {
+    params: { ...buildParams(filters), part, offset: String(offset), limit: String(limit) },
+  })
   return data
 }
 
@@ -48,6 +73,26 @@ export async function fetchTrends(filters: Filters): Promise<TrendsData> {
   return data
 }
 
+export async function fetchDashboardSummary(
+  filters: Filters,
+  maxIncidentsPerPart?: number,
+): Promise<DashboardSummary> {
+  const { data } = await api.get('/dashboard/summary', {
+    params: bodyMapParams(filters, maxIncidentsPerPart),
+  })
+  return data
+}
+
+export async function fetchIndicators(filters: Filters): Promise<IndicatorsData> {
+  const params: Record<string, string> = {}
+  if (filters.date_from) params.date_from = filters.date_from
+  if (filters.date_to) params.date_to = filters.date_to
+  if (filters.work_center) params.work_center = filters.work_center
+  if (filters.contract) params.contract = filters.contract
+  const { data } = await api.get('/dashboard/indicators', { params })
+  return data
+}
+
 export async function fetchFilterOptions(): Promise<{ contracts: string[]; work_centers: string[]; classifiers: string[] }> {
   const { data } = await api.get('/dashboard/filter-options')
   return data
@@ -82,6 +127,30 @@ export async function uploadFile(file: File): Promise<UploadResponse> {
   return data
 }
 
+export async function startUploadJob(file: File): Promise<UploadJob> {
+  const formData = new FormData()
+  formData.append('file', file)
+  const { data } = await api.post('/upload', formData, {
+    params: { async: true },
+    headers: { 'Content-Type': 'multipart/form-data' },
+  })
+  return data
+}
+
+export async function uploadWorkedHours(file: File): Promise<WorkedHoursUploadResponse> {
+  const formData = new FormData()
+  formData.append('file', file)
+  const { data } = await api.post('/worked-hours/upload', formData, {
+    headers: { 'Content-Type': 'multipart/form-data' },
+  })
+  return data
+}
+
+export async function fetchUploadJob(id: number): Promise<UploadJob> {
+  const { data } = await api.get(`/upload-jobs/${id}`)
+  return data
+}
+
 export async function fetchUploads(): Promise<UploadItem[]> {
   const { data } = await api.get('/uploads')
   return data
@@ -1,9 +1,13 @@
-import { useState, useMemo, useRef } from 'react'
-import type { BodyMapData, BodyPartData } from '../types'
+import { useState, useMemo, useRef, useEffect } from 'react'
+import type { BodyMapData, BodyPartData, Filters } from '../types'
 import { X } from 'lucide-react'
+import { fetchBodyPartIncidents } from '../api/client'
+
+const INCIDENT_PAGE_SIZE = 100
 
 interface BodyMapProps {
   data: BodyMapData | null
+  filters: Filters
 }
 
 interface BodyRegion {
@@ -374,13 +378,23 @@ function formatDate(dateStr: string): string {
   return dateStr
 }
 
-export default function BodyMap({ data }: BodyMapProps) {
+export default function BodyMap({ data, filters }: BodyMapProps) {
   const [hoveredRegion, setHoveredRegion] = useState<string | null>(null)
-  const [selectedPart, setSelectedPart] = useState<BodyPartData | null>(null)
+  // The parts of the selected region, with the incidents loaded so far
+  const [selectedParts, setSelectedParts] = useState<BodyPartData[] | null>(null)
   const [selectedRegionId, setSelectedRegionId] = useState<string | null>(null)
+  const [loadingMore, setLoadingMore] = useState(false)
+  const [loadMoreError, setLoadMoreError] = useState<string | null>(null)
   const [tooltipPos, setTooltipPos] = useState({ x: 0, y: 0 })
   const svgContainerRef = useRef<HTMLDivElement>(null)
 
+  // New data means new filters: drop the selection and its loaded pages
+  useEffect(() => {
+    setSelectedParts(null)
+    setSelectedRegionId(null)
+    setLoadMoreError(null)
+  }, [data])
+
   // Build a mapping from region ID to body part data
   const regionData = useMemo(() => {
     const map: Record<string, { count: number; percentage: number; parts: BodyPartData[] }> = {}
@@ -401,17 +415,46 @@ export default function BodyMap({ data }: BodyMapProps) {
     return map
   }, [data])
 
+  const selectedPart = useMemo<BodyPartData | null>(() => {
+    if (!selectedParts || !selectedRegionId) return null
+    return {
+      name: BODY_REGIONS.find((r) => r.id === selectedRegionId)?.label || selectedRegionId,
+      count: selectedParts.reduce((acc, p) => acc + p.count, 0),
+      percentage: selectedParts.reduce((acc, p) => acc + p.percentage, 0),
+      incidents: selectedParts.flatMap((p) => p.incidents),
+    }
+  }, [selectedParts, selectedRegionId])
+
   const handleRegionClick = (regionId: string) => {
     const rd = regionData[regionId]
     if (rd && rd.parts.length > 0) {
-      const merged: BodyPartData = {
-        name: BODY_REGIONS.find((r) => r.id === regionId)?.label || regionId,
-        count: rd.count,
-        percentage: rd.parts.reduce((acc, p) => acc + p.percentage, 0),
-        incidents: rd.parts.flatMap((p) => p.incidents),
-      }
-      setSelectedPart(merged)
+      setSelectedParts(rd.parts)
       setSelectedRegionId(regionId)
+      setLoadMoreError(null)
+    }
+  }
+
+  // The body map only carries the first incidents of each part; fetch the
+  // next page of every part of the region that has more.
+  const handleLoadMore = async () => {
+    if (!selectedParts) return
+    setLoadingMore(true)
+    setLoadMoreError(null)
+    try {
+      const pages = await Promise.all(
+        selectedParts.map((p) =>
+          p.incidents.length < p.count
+            ? fetchBodyPartIncidents(p.name, filters, p.incidents.length, INCIDENT_PAGE_SIZE)
+            : Promise.resolve([]),
+        ),
+      )
+      setSelectedParts((parts) =>
+        parts && parts.map((p, i) => ({ ...p, incidents: [...p.incidents, ...pages[i]] })),
+      )
+    } catch {
+      setLoadMoreError('No se pudieron cargar más incidentes')
+    } finally {
+      setLoadingMore(false)
     }
   }
 
@@ -608,7 +651,7 @@ export default function BodyMap({ data }: BodyMapProps) {
                 </h4>
                 <button
                   onClick={() => {
-                    setSelectedPart(null)
+                    setSelectedParts(null)
                     setSelectedRegionId(null)
                   }}
                   className="text-gray-500 hover:text-gray-300 transition-colors p-1 rounded-lg hover:bg-gray-700/50"
@@ -652,6 +695,19 @@ export default function BodyMap({ data }: BodyMapProps) {
                   </div>
                 ))}
               </div>
+
+              {selectedPart.incidents.length < selectedPart.count && (
+                <button
+                  onClick={handleLoadMore}
+                  disabled={loadingMore}
+                  className="mt-3 w-full px-3 py-1.5 bg-gray-700/80 text-gray-300 rounded-lg text-xs hover:bg-gray-600 disabled:opacity-40 transition-colors"
+                >
+                  {loadingMore
+                    ? 'Cargando...'
+                    : `Cargar más (${selectedPart.incidents.length} de ${selectedPart.count})`}
+                </button>
+              )}
+              {loadMoreError && <p className="mt-2 text-xs text-red-400">{loadMoreError}</p>}
             </div>
           ) : (
             <div className="flex items-center justify-center h-full">
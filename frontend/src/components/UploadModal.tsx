@@ -1,7 +1,17 @@
 import { useState, useRef, useCallback } from 'react'
 import { Upload, X, FileSpreadsheet, CheckCircle, AlertCircle } from 'lucide-react'
-import { uploadFile } from '../api/client'
-import type { UploadResponse } from '../types'
+import { startUploadJob, fetchUploadJob } from '../api/client'
+import type { UploadJob, UploadResponse } from '../types'
+
+const POLL_INTERVAL_MS = 1000
+
+const STAGE_LABELS: Record<UploadJob['stage'], string> = {
+  queued: 'En cola...',
+  parsing: 'Leyendo archivo...',
+  inserting: 'Guardando registros...',
+  done: 'Completado',
+  failed: 'Error',
+}
 
 interface UploadModalProps {
   isOpen: boolean
@@ -12,6 +22,7 @@ interface UploadModalProps {
 export default function UploadModal({ isOpen, onClose, onSuccess }: UploadModalProps) {
   const [file, setFile] = useState<File | null>(null)
   const [uploading, setUploading] = useState(false)
+  const [job, setJob] = useState<UploadJob | null>(null)
   const [result, setResult] = useState<UploadResponse | null>(null)
   const [error, setError] = useState<string | null>(null)
   const [dragOver, setDragOver] = useState(false)
@@ -19,6 +30,7 @@ export default function UploadModal({ isOpen, onClose, onSuccess }: UploadModalP
 
   const resetState = useCallback(() => {
     setFile(null)
+    setJob(null)
     setResult(null)
     setError(null)
     setDragOver(false)
@@ -50,8 +62,25 @@ export default function UploadModal({ isOpen, onClose, onSuccess }: UploadModalP
     setUploading(true)
     setError(null)
     try {
-      const resp = await uploadFile(file)
-      setResult(resp)
+      let current = await startUploadJob(file)
+      setJob(current)
+      while (current.stage !== 'done' && current.stage !== 'failed') {
+        await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS))
+        current = await fetchUploadJob(current.id)
+        setJob(current)
+      }
+      if (current.stage === 'failed') {
+        throw new Error(current.error || 'Error al cargar el archivo')
+      }
+      setResult({
+        upload_id: current.upload_id ?? 0,
+        filename: current.filename,
+        records_added: current.records_added,
+        records_updated: current.records_updated,
+        records_unchanged: current.records_unchanged,
+        records_duplicated: current.records_duplicated,
+        total_records: current.total_records ?? current.records_added,
+      })
       onSuccess()
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Error al cargar el archivo')
@@ -88,6 +117,12 @@ export default function UploadModal({ isOpen, onClose, onSuccess }: UploadModalP
             <p className="text-sm text-gray-400">
               {result.records_added} registros agregados de {result.total_records} totales
             </p>
+            {(result.records_updated > 0 || result.records_unchanged > 0 || result.records_duplicated > 0) && (
+              <p className="text-xs text-gray-500 mt-1">
+                {result.records_updated} actualizados, {result.records_unchanged} sin cambios
+                {result.records_duplicated > 0 && `, ${result.records_duplicated} duplicados en el archivo`}
+              </p>
+            )}
             <button
               onClick={handleClose}
               className="mt-4 px-4 py-2 bg-gray-700 text-gray-200 rounded-lg text-sm hover:bg-gray-600 transition-colors"
@@ -137,6 +172,18 @@ export default function UploadModal({ isOpen, onClose, onSuccess }: UploadModalP
               )}
             </div>
 
+            {/* Progress */}
+            {uploading && job && (
+              <div className="mt-3 text-sm text-gray-400 bg-gray-800/50 border border-gray-700 rounded-lg p-3">
+                <p className="text-gray-300">{STAGE_LABELS[job.stage]}</p>
+                {job.rows_parsed > 0 && (
+                  <p className="text-xs text-gray-500 mt-1">
+                    {job.rows_inserted} de {job.rows_parsed} registros procesados
+                  </p>
+                )}
+              </div>
+            )}
+
             {/* Error */}
             {error && (
               <div className="mt-3 flex items-center gap-2 text-red-400 text-sm bg-red-500/10 border border-red-500/30 rounded-lg p-3">
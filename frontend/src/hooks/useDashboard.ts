@@ -1,6 +1,10 @@
 import { useState, useEffect, useCallback } from 'react'
 import type { KPIs, ChartsData, BodyMapData, TrendsData, Filters } from '../types'
-import { fetchKPIs, fetchCharts, fetchBodyMap, fetchTrends } from '../api/client'
+import { fetchDashboardSummary } from '../api/client'
+
+// The body map only embeds the first incidents of each part; BodyMap loads
+// the rest page by page when a part is opened.
+export const BODY_MAP_INCIDENTS_PER_PART = 20
 
 interface DashboardState {
   kpis: KPIs | null
@@ -27,16 +31,11 @@ export function useDashboard(): DashboardState {
     setLoading(true)
     setError(null)
     try {
-      const [kpisData, chartsData, bodyMapData, trendsData] = await Promise.all([
-        fetchKPIs(filters),
-        fetchCharts(filters),
-        fetchBodyMap(filters),
-        fetchTrends(filters),
-      ])
-      setKpis(kpisData)
-      setCharts(chartsData)
-      setBodyMap(bodyMapData)
-      setTrends(trendsData)
+      const summary = await fetchDashboardSummary(filters, BODY_MAP_INCIDENTS_PER_PART)
+      setKpis(summary.kpis)
+      setCharts(summary.charts)
+      setBodyMap(summary.body_map)
+      setTrends(summary.trends)
     } catch (err) {
       const message = err instanceof Error ? err.message : 'Error al cargar datos'
       setError(message)
@@ -34,7 +34,7 @@ export default function DashboardPage() {
         <Charts data={charts} section="top" />
 
         <div className="grid grid-cols-1 lg:grid-cols-2 gap-4 mb-6">
-          <BodyMap data={bodyMap} />
+          <BodyMap data={bodyMap} filters={filters} />
           <AlertsPanel data={trends} />
         </div>
 
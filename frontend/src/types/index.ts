@@ -37,11 +37,18 @@ export interface ChartsData {
   by_contract: ChartDataItem[]
 }
 
+export interface BodyPartIncident {
+  id: number
+  name: string
+  date: string
+  classifier: string
+}
+
 export interface BodyPartData {
   name: string
   count: number
   percentage: number
-  incidents: { id: number; name: string; date: string; classifier: string }[]
+  incidents: BodyPartIncident[]
 }
 
 export interface BodyMapData {
@@ -54,12 +61,53 @@ export interface AlertItem {
   severity: 'info' | 'warning' | 'danger'
 }
 
+export interface TrendPeriodItem {
+  start: string
+  end: string
+  incidents: number
+  cost: number
+  incident_change: number
+  cost_change: number
+  incident_alert: boolean
+  cost_alert: boolean
+}
+
 export interface TrendsData {
   month_over_month_change: number
   cost_trend: number
   most_affected_body_part: string | null
   most_common_classifier: string | null
   alerts: AlertItem[]
+  period: 'week' | 'month' | 'quarter' | 'rolling'
+  comparison: 'previous' | 'year_over_year'
+  series: TrendPeriodItem[]
+}
+
+export interface IndicatorItem {
+  year: number
+  month: number
+  label: string
+  worked_hours: number
+  headcount: number
+  accidents: number
+  lost_days: number
+  frequency_rate: number
+  severity_rate: number
+  accident_rate: number
+}
+
+export interface IndicatorsData {
+  series: IndicatorItem[]
+  total: IndicatorItem | null
+  period_from: string | null
+  period_to: string | null
+}
+
+export interface DashboardSummary {
+  kpis: KPIs
+  charts: ChartsData
+  trends: TrendsData
+  body_map: BodyMapData
 }
 
 export interface Incident {
@@ -111,9 +159,37 @@ export interface UploadResponse {
   upload_id: number
   filename: string
   records_added: number
+  records_updated: number
+  records_unchanged: number
+  records_duplicated: number
   total_records: number
 }
 
+export interface WorkedHoursUploadResponse {
+  filename: string
+  records: number
+  months: string[]
+}
+
+export interface UploadJob {
+  id: number
+  filename: string
+  stage: 'queued' | 'parsing' | 'inserting' | 'done' | 'failed'
+  rows_parsed: number
+  rows_inserted: number
+  rows_per_second: number
+  records_added: number
+  records_updated: number
+  records_unchanged: number
+  records_duplicated: number
+  total_records: number | null
+  upload_id: number | null
+  error: string | null
+  created_at: string
+  started_at: string | null
+  finished_at: string | null
+}
+
 export interface Filters {
   date_from?: string
   date_to?: string